@@ -0,0 +1,60 @@
+import asyncio
+from time import perf_counter
+from typing import List
+
+from dataclasses import dataclass
+
+from dataclass_factory import Factory
+
+
+@dataclass
+class Order:
+    id: int
+    customer: str
+    amount: float
+    paid: bool = False
+
+
+factory = Factory(codegen=True)
+data = [{"id": i, "customer": "customer %s" % i, "amount": i * 1.5} for i in range(200000)]
+factory.load(data[:1], List[Order])  # create parsers in advance
+
+
+async def max_stall(coro):
+    """Return result of coroutine and the longest time event loop was blocked while it was running"""
+    stalls = []
+    done = False
+
+    async def ticker():
+        last = perf_counter()
+        while not done:
+            await asyncio.sleep(0)
+            now = perf_counter()
+            stalls.append(now - last)
+            last = now
+
+    task = asyncio.ensure_future(ticker())
+    await asyncio.sleep(0)
+    result = await coro
+    done = True
+    await task
+    return result, max(stalls)
+
+
+async def do_load():
+    return factory.load(data, List[Order])
+
+
+async def do_load_async():
+    return await factory.load_async(data, List[Order])
+
+
+async def main():
+    _, stall = await max_stall(do_load())
+    print("load       max stall", stall)  # 0.34612661699975433
+    _, stall = await max_stall(do_load_async())
+    # most of pauses are about 3ms, the longest one is caused by garbage collection of all created objects
+    print("load_async max stall", stall)  # 0.06546719300013137
+
+
+asyncio.new_event_loop().run_until_complete(main())
@@ -0,0 +1,55 @@
+from timeit import timeit
+from typing import List, Optional
+
+from dataclasses import dataclass
+
+from dataclass_factory import Factory, Schema
+
+
+@dataclass
+class Todo:
+    id: int
+    title: str
+    desc: str
+    done: bool = False
+    parent: Optional[int] = None
+
+
+schemas = {
+    Todo: Schema(
+        name_mapping={"desc": "description"}
+    )
+}
+factory = Factory(schemas=schemas)
+factory_codegen = Factory(schemas=schemas, codegen=True)
+
+todos = [{
+    "id": i,
+    "title": "title %s" % i,
+    "description": "5some long description %s %s %s" % (i, i * 10, i),
+    "done": i % 2 == 0,
+} for i in range(10000)]
+
+
+def do_list():
+    return factory.load(todos, List[Todo])
+
+
+def do_batch():
+    return factory.load_many(todos, Todo)
+
+
+def do_list_codegen():
+    return factory_codegen.load(todos, List[Todo])
+
+
+def do_batch_codegen():
+    return factory_codegen.load_many(todos, Todo)
+
+
+assert do_list() == do_batch() == do_list_codegen() == do_batch_codegen()
+
+print("load List[T]          ", timeit("do()", globals={"do": do_list}, number=100))  # 1.8268226630002573
+print("load_many             ", timeit("do()", globals={"do": do_batch}, number=100))  # 0.837084904999756
+print("load List[T] (codegen)", timeit("do()", globals={"do": do_list_codegen}, number=100))  # 1.5844753020001008
+print("load_many (codegen)   ", timeit("do()", globals={"do": do_batch_codegen}, number=100))  # 0.7740216830002282
@@ -0,0 +1,31 @@
+from timeit import repeat
+from typing import List
+
+from dataclasses import dataclass, field
+
+from dataclass_factory import Factory, Schema
+
+
+@dataclass(frozen=True)
+class Todo:
+    id: int
+    title: str
+    desc: str
+    done: bool = False
+    tags: List[str] = field(default_factory=list)
+
+
+todo = {"id": 1, "title": "title", "desc": "some long description", "done": True}
+
+
+def measure(bypass_init, codegen):
+    parser = Factory(default_schema=Schema(bypass_init=bypass_init), codegen=codegen).parser(Todo)
+    assert parser(todo) == Todo(1, "title", "some long description", True)
+    return min(repeat(lambda: parser(todo), number=100000, repeat=5))
+
+
+print("init          ", measure(False, False))  # 0.2898
+print("bypass        ", measure(True, False))  # 0.2438
+print("codegen init  ", measure(False, True))  # 0.1915
+# values are stored directly to `__dict__` of allocated instance
+print("codegen bypass", measure(True, True))  # 0.0849
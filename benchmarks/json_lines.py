@@ -0,0 +1,39 @@
+import json
+from io import BytesIO
+from timeit import timeit
+
+from dataclasses import dataclass
+
+from dataclass_factory import Factory
+
+
+@dataclass
+class Todo:
+    id: int
+    title: str
+    desc: str
+
+
+factory = Factory(codegen=True)
+todos = [Todo(i, "title %s" % i, "5some long description %s %s %s" % (i, i * 10, i)) for i in range(10000)]
+
+
+def do_loop():
+    file = BytesIO()
+    for todo in todos:
+        file.write(json.dumps(factory.dump(todo)).encode())
+        file.write(b"\n")
+    return file
+
+
+def do_dump_lines():
+    file = BytesIO()
+    factory.dump_lines(file, todos, Todo)
+    return file
+
+
+assert [json.loads(x) for x in do_loop().getvalue().splitlines()] == \
+       [json.loads(x) for x in do_dump_lines().getvalue().splitlines()]
+
+print("loop      ", timeit("do()", globals={"do": do_loop}, number=100))  # 3.7874829190000128
+print("dump_lines", timeit("do()", globals={"do": do_dump_lines}, number=100))  # 1.1257425759999933
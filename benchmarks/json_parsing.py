@@ -0,0 +1,69 @@
+import json
+import tracemalloc
+from timeit import timeit
+from typing import List, Optional
+
+from dataclasses import dataclass
+
+from dataclass_factory import Factory
+
+
+@dataclass
+class Author:
+    name: str
+    born_at: int
+
+
+@dataclass
+class Book:
+    title: str
+    price: float
+    author: Author
+    tags: List[str]
+    isbn: Optional[str] = None
+
+
+@dataclass
+class Page:
+    total: int
+    books: List[Book]
+
+
+factory = Factory(codegen=True)
+text = json.dumps({
+    "total": 1000,
+    "books": [
+        {
+            "title": "Fahrenheit 451",
+            "price": 100.5,
+            "author": {"name": "Ray Bradbury", "born_at": 1920, "country": "USA"},
+            "tags": ["dystopia", "novel"],
+            "reviews": [{"rating": 5, "text": "good"}],
+        }
+        for _ in range(1000)
+    ],
+})
+
+
+def do_load():
+    return factory.load(json.loads(text), Page)
+
+
+def do_load_json():
+    return factory.load_json(text, Page)
+
+
+def peak_memory(func):
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+assert do_load() == do_load_json()
+
+print("load(json.loads())", timeit("do()", globals={"do": do_load}, number=1000))  # 7.583957704000113
+print("load_json()       ", timeit("do()", globals={"do": do_load_json}, number=1000))  # 9.081609604999812
+print("load(json.loads()) peak memory", peak_memory(do_load))  # 1437897
+print("load_json() peak memory       ", peak_memory(do_load_json))  # 614902
@@ -0,0 +1,43 @@
+import json
+from timeit import timeit
+from typing import List, Optional
+
+from dataclasses import dataclass
+
+from dataclass_factory import Factory
+
+
+@dataclass
+class Author:
+    name: str
+    born_at: int
+
+
+@dataclass
+class Book:
+    title: str
+    price: float
+    author: Author
+    tags: List[str]
+    isbn: Optional[str] = None
+
+
+factory = Factory(codegen=True)
+books = [
+    Book("Fahrenheit 451", 100.5, Author("Ray Bradbury", 1920), ["dystopia", "novel"])
+    for _ in range(100)
+]
+
+
+def do_dumps():
+    return json.dumps(factory.dump(books, List[Book]), ensure_ascii=False, separators=(",", ":"))
+
+
+def do_dump_json():
+    return factory.dump_json(books, List[Book])
+
+
+assert do_dumps() == do_dump_json()
+
+print("json.dumps(dump())", timeit("do()", globals={"do": do_dumps}, number=10000))  # 3.9355897190002906
+print("dump_json()       ", timeit("do()", globals={"do": do_dump_json}, number=10000))  # 2.8515675329999794
@@ -0,0 +1,45 @@
+from timeit import timeit
+from typing import List, Optional
+
+from dataclasses import dataclass, field
+from enum import Enum
+
+from dataclass_factory import Factory, Schema
+
+
+class Status(Enum):
+    NEW = "new"
+    DONE = "done"
+
+
+@dataclass(frozen=True)
+class Point:
+    x: int = 0
+    y: int = 0
+
+
+@dataclass
+class Sparse:
+    id: int
+    title: Optional[str] = None
+    status: Status = Status.NEW
+    tags: List[str] = field(default_factory=list)
+    position: Point = Point()
+    score: float = 0.0
+    owner: Optional[str] = None
+    parent: Optional[int] = None
+
+
+sparse = Sparse(1)
+full = Sparse(1, "title", Status.DONE, ["tag"], Point(1, 2), 1.5, "owner", 0)
+
+serializer = Factory(default_schema=Schema(omit_default=True)).serializer(Sparse)
+serializer_codegen = Factory(default_schema=Schema(omit_default=True), codegen=True).serializer(Sparse)
+
+assert serializer(sparse) == serializer_codegen(sparse) == {"id": 1}
+
+# omitted fields are compared with defaults before serialization and are not serialized at all
+print("sparse        ", timeit("do(x)", globals={"do": serializer, "x": sparse}, number=100000))  # 0.1301
+print("full          ", timeit("do(x)", globals={"do": serializer, "x": full}, number=100000))  # 0.5381
+print("sparse codegen", timeit("do(x)", globals={"do": serializer_codegen, "x": sparse}, number=100000))  # 0.0507
+print("full codegen  ", timeit("do(x)", globals={"do": serializer_codegen, "x": full}, number=100000))  # 0.3701
@@ -0,0 +1,55 @@
+import json
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from timeit import timeit
+
+from dataclasses import dataclass
+
+from dataclass_factory import Factory
+
+ITEMS_COUNT = 200000
+
+
+@dataclass
+class Order:
+    id: int
+    customer: str
+    amount: float
+    paid: bool = False
+
+
+def per_item(func):
+    return timeit(func, number=1) / ITEMS_COUNT * 1e6
+
+
+# workers started with `spawn` or `forkserver` import this module again, so data is prepared only in main process
+if __name__ == "__main__":
+    factory = Factory(codegen=True)
+    data = [{"id": i, "customer": "customer %s" % i, "amount": i * 1.5} for i in range(ITEMS_COUNT)]
+    texts = [json.dumps(item) for item in data]
+    orders = factory.load_many(data, Order)
+    pickled_orders = pickle.dumps(orders)
+
+    # Cost model (microseconds per item). Main process pickles items and unpickles results,
+    # workers do the opposite and parse. So main process spends `pickle items + unpickle results` per item
+    # in any case and parallel parsing helps only if parsing is much slower than that.
+    print("parse           ", per_item(lambda: factory.load_many(data, Order)))  # 1.035445444999823
+    print("parse json      ", per_item(lambda: [factory.load_json(text, Order) for text in texts]))  # 5.006907014999342
+    print("pickle items    ", per_item(lambda: pickle.dumps(data)))  # 0.8993512849997387
+    print("pickle texts    ", per_item(lambda: pickle.dumps(texts)))  # 0.3265396500000861
+    print("pickle results  ", per_item(lambda: pickle.dumps(orders)))  # 2.7664943649983798
+    print("unpickle results", per_item(lambda: pickle.loads(pickled_orders)))  # noqa S301 # 1.9212202800008527
+
+    # Results of parallel runs below were measured on a single core machine, so they show only the overhead:
+    # load_many 0.21s, load_parallel with 1-8 workers 1.3-1.6s, from_json 1.5-2.3s
+    print("cpu count", os.cpu_count())
+    print("load_many", timeit(lambda: factory.load_many(data, Order), number=1))
+    for workers in (1, 2, 4, 8):
+        with ProcessPoolExecutor(workers) as executor:
+            factory.load_parallel(data[:workers], Order, executor, chunk_size=1)  # start workers
+            print("load_parallel", workers, timeit(lambda: factory.load_parallel(data, Order, executor), number=1))
+            print(
+                "load_parallel json", workers,
+                timeit(lambda: factory.load_parallel(texts, Order, executor, from_json=True), number=1),
+            )
@@ -56,6 +56,14 @@ factory_debug = Factory(schemas={
 }, debug_path=True)
 parser_debug = factory_debug.parser(List[Todo])
 
+# my lazy debug
+factory_lazy_debug = Factory(schemas={
+    Todo: DSchema(
+        name_mapping={"desc": "description"}
+    )
+}, lazy_debug_path=True)
+parser_lazy_debug = factory_lazy_debug.parser(List[Todo])
+
 
 # pydantic
 class PydTodo(BaseModel):
@@ -89,6 +97,10 @@ def do1_debug():
     return parser_debug(todos)
 
 
+def do1_lazy_debug():
+    return parser_lazy_debug(todos)
+
+
 def do2():
     return todo_schema.load(todos)
 
@@ -105,6 +117,7 @@ assert do1() == do2()
 
 print("my       ", timeit("do()", globals={"do": do1}, number=100000))  # 1.5959172130096704
 print("my debug ", timeit("do()", globals={"do": do1_debug}, number=100000))  # 2.087571810989175
+print("my lazy  ", timeit("do()", globals={"do": do1_lazy_debug}, number=100000))  # 1.1931162740000556
 print("mashumaro", timeit("do()", globals={"do": do4}, number=100000))  # 1.459100882988423
 print("marsh    ", timeit("do()", globals={"do": do2}, number=100000))  # 21.77947078004945
 print("mpydantic", timeit("do()", globals={"do": do3}, number=100000))  # 7.471431287995074
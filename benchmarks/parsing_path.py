@@ -12,6 +12,16 @@ class SimpleTodo:
     desc: str
 
 
+@dataclass
+class LegacyTodo:
+    id: int
+    title: str
+    author: str
+    created: str
+    updated: str
+    status: str
+
+
 @dataclass
 class Qwerty:
     qwerty: List[str]
@@ -35,6 +45,19 @@ factory = Factory(schemas={
 simple_parser = factory.parser(List[SimpleTodo])
 complex_parser = factory.parser(List[ComplexTodo])
 
+# fields with common prefix of path
+legacy_schema = Schema(
+    name_mapping={
+        "title": ("meta", "audit", "title"),
+        "author": ("meta", "audit", "author"),
+        "created": ("meta", "audit", "created"),
+        "updated": ("meta", "audit", "updated"),
+        "status": ("meta", "audit", "status"),
+    }
+)
+legacy_parser = Factory(schemas={LegacyTodo: legacy_schema}).parser(List[LegacyTodo])
+legacy_parser_codegen = Factory(schemas={LegacyTodo: legacy_schema}, codegen=True).parser(List[LegacyTodo])
+
 # test
 todos = [{
     "description": {
@@ -47,6 +70,20 @@ todos = [{
 } for i in range(10)]
 
 
+legacy_todos = [{
+    "id": i,
+    "meta": {
+        "audit": {
+            "title": "title %s" % i,
+            "author": "author %s" % i,
+            "created": "2020-01-%02d" % (i + 1),
+            "updated": "2021-01-%02d" % (i + 1),
+            "status": "done",
+        },
+    },
+} for i in range(10)]
+
+
 def do_simple():
     return simple_parser(todos)
 
@@ -55,5 +92,15 @@ def do_complex():
     return complex_parser(todos)
 
 
-print("simple ", timeit("do()", globals={"do": do_simple}, number=100000))  # 2.015210837998893
-print("complex", timeit("do()", globals={"do": do_complex}, number=100000))  # 3.569017971982248
+def do_legacy():
+    return legacy_parser(legacy_todos)
+
+
+def do_legacy_codegen():
+    return legacy_parser_codegen(legacy_todos)
+
+
+print("simple        ", timeit("do()", globals={"do": do_simple}, number=100000))  # 2.015210837998893
+print("complex       ", timeit("do()", globals={"do": do_complex}, number=100000))  # 3.569017971982248
+print("legacy        ", timeit("do()", globals={"do": do_legacy}, number=100000))  # 3.2946980579999945
+print("legacy codegen", timeit("do()", globals={"do": do_legacy_codegen}, number=100000))  # 1.9806694640001297
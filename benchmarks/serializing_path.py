@@ -35,6 +35,16 @@ factory = Factory(schemas={
 simple_serializer = factory.serializer(List[SimpleTodo])
 complex_serializer = factory.serializer(List[ComplexTodo])
 
+# my codegen
+factory_codegen = Factory(schemas={
+    SimpleTodo: DSchema(
+        name_mapping={
+            "desc": ("description", "qwerty", 0),
+        }
+    )
+}, codegen=True)
+simple_serializer_codegen = factory_codegen.serializer(List[SimpleTodo])
+
 # test
 simple_todos = [SimpleTodo(
     id=i,
@@ -53,11 +63,16 @@ def do_simple():
     return simple_serializer(simple_todos)
 
 
+def do_simple_codegen():
+    return simple_serializer_codegen(simple_todos)
+
+
 def do_complex():
     return complex_serializer(complex_todos)
 
 
-assert do_complex() == do_simple()
+assert do_complex() == do_simple() == do_simple_codegen()
 # print(json.dumps(do1()[0], indent=2))
-print("simple ", timeit("do()", globals={"do": do_simple}, number=100000))  # 1.9579019670491107
-print("complex", timeit("do()", globals={"do": do_complex}, number=100000))  # 1.8429706260212697
+print("simple        ", timeit("do()", globals={"do": do_simple}, number=100000))  # 2.3695738349997555
+print("simple codegen", timeit("do()", globals={"do": do_simple_codegen}, number=100000))  # 0.507813447999979
+print("complex       ", timeit("do()", globals={"do": do_complex}, number=100000))  # 2.616137277999769
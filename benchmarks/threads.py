@@ -0,0 +1,43 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import List
+
+from dataclasses import dataclass
+
+from dataclass_factory import Factory
+
+
+@dataclass
+class Order:
+    id: int
+    customer: str
+    amount: float
+    paid: bool = False
+
+
+factory = Factory(codegen=True)
+data = [{"id": i, "customer": "customer %s" % i, "amount": i * 1.5} for i in range(1000)]
+TASKS = 400
+
+
+def task(_):
+    return factory.load(data, List[Order])
+
+
+def throughput(workers: int) -> float:
+    """Return number of parsed lists per second"""
+    with ThreadPoolExecutor(workers) as executor:
+        started = perf_counter()
+        list(executor.map(task, range(TASKS)))
+        return TASKS / (perf_counter() - started)
+
+
+is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)
+print("GIL enabled", is_gil_enabled())
+# Run with free-threaded build (e.g. python3.13t) to see scaling. With GIL throughput does not grow.
+# Converters are built once on first use, following calls do not take any locks
+task(None)
+# with GIL (python 3.11, single core): 541, 637, 519, 600
+for workers in (1, 2, 4, 8):
+    print("threads", workers, throughput(workers))
@@ -0,0 +1,38 @@
+from timeit import repeat
+from typing import Any, Dict
+
+from dataclasses import dataclass, field
+
+from dataclass_factory import Factory, Schema, Unknown
+
+
+@dataclass
+class Todo:
+    id: int
+    title: str
+    desc: str
+    done: bool = False
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+
+todo = {"id": 1, "title": "title", "desc": "some long description", "done": True}
+todo_unknown = dict(todo, tag="tag", priority=1)
+
+
+def measure(unknown, codegen, data):
+    parser = Factory(default_schema=Schema(unknown=unknown), codegen=codegen).parser(Todo)
+    return min(repeat(lambda: parser(data), number=100000, repeat=5))
+
+
+# data dict is not changed by parsing, so the same one is used each time
+print("skip            ", measure(Unknown.SKIP, False, todo))  # 0.1691
+print("forbid          ", measure(Unknown.FORBID, False, todo))  # 0.1383
+# found keys are counted by closure parser too: compared with collecting unknown fields each time
+# "extra" is 17% faster, "extra, unknown" is 5% slower, Unknown.STORE without unknown keys is 25% faster
+print("extra           ", measure("extra", False, todo))  # 0.2354
+print("extra, unknown  ", measure("extra", False, todo_unknown))  # 0.2641
+print("codegen skip    ", measure(Unknown.SKIP, True, todo))  # 0.1024
+print("codegen forbid  ", measure(Unknown.FORBID, True, todo))  # 0.1013
+# unknown fields are collected only when there are keys not used by fields
+print("codegen extra   ", measure("extra", True, todo))  # 0.1467
+print("codegen extra, u", measure("extra", True, todo_unknown))  # 0.2251
@@ -0,0 +1,107 @@
+import asyncio
+from collections import deque
+from itertools import islice
+from time import perf_counter
+from typing import Any, Callable, Deque, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Type
+
+from .common import AbstractFactory
+from .parsers import dyn_element_parser, get_collection_factory
+from .schema import has_custom_parsing, has_custom_serializing
+from .type_detection import args_unspecified, hasargs, is_generic_concrete, is_tuple
+
+DEFAULT_ASYNC_CHUNK_SIZE = 1000
+COLLECTION_TYPES = (list, set, frozenset, deque, List, Set, FrozenSet, Deque)
+
+
+def get_item_types(class_: Type) -> Optional[Tuple[Type, ...]]:
+    """
+    Return item type of collection or key and value types of dict.
+
+    Returns None for other types, they are not split into chunks
+    """
+    if is_tuple(class_):
+        if hasargs(class_) and len(class_.__args__) == 2 and class_.__args__[1] is Ellipsis:
+            return class_.__args__[:1]
+        return None
+    origin = class_.__origin__ if is_generic_concrete(class_) else class_
+    if origin in (dict, Dict):
+        return (Any, Any) if args_unspecified(class_) else class_.__args__
+    if origin in COLLECTION_TYPES:
+        return (Any,) if args_unspecified(class_) else class_.__args__
+    return None
+
+
+async def map_chunked(
+    func: Callable[..., Any], items: Iterable[Any], chunk_size: int, time_slice: Optional[float],
+) -> List[Any]:
+    """
+    Apply `func` to each item, returning control to event loop after each chunk of items.
+
+    If `time_slice` is set, control is returned only when at least `time_slice` seconds passed since previous pause
+    """
+    iterator = iter(items)
+    result: List[Any] = []
+    deadline = perf_counter() + time_slice if time_slice else 0
+    while True:
+        size = len(result)
+        result.extend(map(func, islice(iterator, chunk_size)))
+        if len(result) - size < chunk_size:
+            return result
+        if not time_slice or perf_counter() >= deadline:
+            await asyncio.sleep(0)
+            if time_slice:
+                deadline = perf_counter() + time_slice
+
+
+async def parse_chunked(
+    factory: AbstractFactory,
+    data: Any,
+    class_: Type,
+    debug_path: bool,
+    chunk_size: int,
+    time_slice: Optional[float],
+) -> Any:
+    """Parse data like `factory.parser(class_)` does, but elements of top-level collection are parsed in chunks"""
+    item_types = get_item_types(class_)
+    if item_types is None or has_custom_parsing(factory.schema(class_)):
+        return factory.parser(class_)(data)
+    if len(item_types) == 2:
+        key_parser = factory.parser(item_types[0])
+        value_parser = factory.parser(item_types[1])
+        items = await map_chunked(
+            lambda item: (key_parser(item[0]), value_parser(item[1])), data.items(), chunk_size, time_slice,
+        )
+        return dict(items)
+
+    item_parser = factory.parser(item_types[0])
+    if debug_path:
+        items = await map_chunked(
+            lambda item: dyn_element_parser(item_parser, item[1], item[0]), enumerate(data), chunk_size, time_slice,
+        )
+    else:
+        items = await map_chunked(item_parser, data, chunk_size, time_slice)
+    collection_factory = tuple if is_tuple(class_) else get_collection_factory(class_)
+    if collection_factory is list:
+        return items
+    return collection_factory(items)
+
+
+async def serialize_chunked(
+    factory: AbstractFactory,
+    data: Any,
+    class_: Type,
+    chunk_size: int,
+    time_slice: Optional[float],
+) -> Any:
+    """Serialize data like `factory.serializer(class_)` does, but top-level collection is processed in chunks"""
+    item_types = get_item_types(class_)
+    if item_types is None or has_custom_serializing(factory.schema(class_)):
+        return factory.serializer(class_)(data)
+    if len(item_types) == 2:
+        key_serializer = factory.serializer(item_types[0])
+        value_serializer = factory.serializer(item_types[1])
+        items = await map_chunked(
+            lambda item: (key_serializer(item[0]), value_serializer(item[1])), data.items(), chunk_size, time_slice,
+        )
+        return dict(items)
+    return await map_chunked(factory.serializer(item_types[0]), data, chunk_size, time_slice)
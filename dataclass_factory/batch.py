@@ -0,0 +1,232 @@
+from array import array
+from dataclasses import Field, fields as dataclass_fields_of, is_dataclass, MISSING
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Type
+
+from .common import AbstractFactory, Parser, T
+from .fields import get_dataclass_fields, has_dataclass_init
+from .parsers import get_field_parser, MISSED
+from .path_utils import CleanKey
+from .schema import Schema, Unknown
+from .type_detection import is_generic_concrete
+
+BatchParser = Callable[[Iterable[Any]], List[T]]
+ColumnsParser = Callable[[Iterable[Any]], Dict[str, List[Any]]]
+
+
+class ColumnInfo(NamedTuple):
+    field_name: str
+    key: CleanKey  # key in parsed dict
+    parser: Parser  # with validators and path walking
+    has_path: bool
+    default: Callable[[], Any]  # called when field is missing in an item
+
+
+def get_default_getter(field: Field) -> Callable[[], Any]:
+    # type ignore because of https://github.com/python/mypy/issues/6910
+    if field.default_factory is not MISSING:  # type: ignore
+        return field.default_factory  # type: ignore
+    if field.default is not MISSING:
+        default = field.default
+        return lambda: default
+
+    def missing_field():
+        raise TypeError(f"Missing required field `{field.name}`")
+
+    return missing_field
+
+
+def get_columns_info(factory: AbstractFactory, schema: Schema, class_: Type) -> Optional[Sequence[ColumnInfo]]:
+    """
+    Return parsers of dataclass fields which can be applied to all items of batch one by one.
+
+    Returns None if items should be parsed separately
+    (custom parsers or `__init__`, list mode, storing unknown fields)
+    """
+    if schema.parser or schema.get_parser:
+        return None
+    if not has_dataclass_init(class_):
+        return None  # defaults of missing fields are known only for generated `__init__`
+    if is_generic_concrete(class_) and is_dataclass(class_.__origin__):
+        dataclass_fields = {f.name: f for f in dataclass_fields_of(class_.__origin__)}
+    elif is_dataclass(class_):
+        dataclass_fields = {f.name: f for f in dataclass_fields_of(class_)}
+    else:
+        return None
+    if schema.unknown not in (Unknown.SKIP, Unknown.FORBID):
+        return None
+    columns = []
+    for f in get_dataclass_fields(schema, class_):
+        key, parser = get_field_parser(
+            item=f.data_name,
+            parser=factory.parser(f.type),
+            pre_validators=schema.pre_validators.get(f.field_name, []) + schema.pre_validators.get(None, []),
+            post_validators=schema.post_validators.get(f.field_name, []) + schema.post_validators.get(None, []),
+        )
+        if isinstance(key, int):
+            return None
+        if schema.unknown is Unknown.FORBID and isinstance(f.data_name, tuple):
+            return None  # paths are not supported together with forbidding unknown fields
+        has_path = isinstance(f.data_name, tuple) and len(f.data_name) > 1
+        columns.append(ColumnInfo(
+            f.field_name, key, parser, has_path, get_default_getter(dataclass_fields[f.field_name]),
+        ))
+    if not columns:
+        return None
+    return columns
+
+
+def parse_column(column: ColumnInfo, data: List[Any]) -> List[Any]:
+    """Parse values of one field in all items. Missing values are replaced with defaults"""
+    key, parser = column.key, column.parser
+    try:
+        values = [item[key] for item in data]
+    except KeyError:
+        default = column.default
+        result = [parser(item[key]) if key in item else default() for item in data]
+    else:
+        result = list(map(parser, values))
+    if column.has_path:
+        # path parser returns MISSED if path is not found
+        default = column.default
+        return [default() if value is MISSED else value for value in result]
+    return result
+
+
+def is_positional(class_: Type, field_names: Sequence[str]) -> bool:
+    """Check if fields can be passed to constructor as positional arguments in this order."""
+    if is_generic_concrete(class_):
+        class_ = class_.__origin__
+    init_fields = [f for f in dataclass_fields_of(class_) if f.init]
+    if any(getattr(f, "kw_only", False) for f in init_fields):
+        return False
+    return [f.name for f in init_fields[:len(field_names)]] == list(field_names)
+
+
+def get_field_columns_parser(
+    factory: AbstractFactory, schema: Schema[T], class_: Type[T],
+) -> Optional[Callable[[List[Any]], List[List[Any]]]]:
+    """
+    Create parser which returns one list of parsed values for each field of dataclass.
+
+    Returns None if items of `class_` cannot be parsed by columns
+    """
+    columns = get_columns_info(factory, schema, class_)
+    if columns is None:
+        return None
+    known_fields = {column.key for column in columns} if schema.unknown is Unknown.FORBID else None
+    pre = schema.pre_parse
+
+    def parse_field_columns(data: List[Any]) -> List[List[Any]]:
+        if pre:
+            data = [pre(item) for item in data]
+        if known_fields is not None and not all(known_fields.issuperset(item) for item in data):
+            raise ValueError("Unknown fields")  # exact error is raised by list parser
+        return [parse_column(column, data) for column in columns]
+
+    return parse_field_columns
+
+
+def get_batch_parser(
+    factory: AbstractFactory, schema: Schema[T], class_: Type[T], list_parser: Parser[List[T]],
+) -> BatchParser[T]:
+    """
+    Create parser for a list of items of one type, which processes dataclass fields column by column.
+
+    Every field parser is called for all items before next field is processed.
+    If any error occurs, data is parsed again by `list_parser` item by item to raise the same error as it does
+    """
+    parse_field_columns = get_field_columns_parser(factory, schema, class_)
+    if parse_field_columns is None:
+        return list_parser
+
+    field_names = [f.field_name for f in get_dataclass_fields(schema, class_)]
+    positional = is_positional(class_, field_names)
+    post = schema.post_parse
+
+    def parse_columns(data: List[Any]) -> List[T]:
+        values = parse_field_columns(data)
+        if positional:
+            result = list(map(class_, *values))
+        else:
+            result = [class_(**dict(zip(field_names, row))) for row in zip(*values)]
+        if post:
+            return [post(item) for item in result]
+        return result
+
+    def batch_parser(data: Iterable[Any]) -> List[T]:
+        if not isinstance(data, list):
+            data = list(data)
+        try:
+            return parse_columns(data)
+        except Exception:  # noqa B902
+            return list_parser(data)
+
+    return batch_parser
+
+
+def get_columns_parser(
+    factory: AbstractFactory, schema: Schema[T], class_: Type[T], list_parser: Parser[List[T]],
+) -> ColumnsParser:
+    """
+    Create parser which returns values of each dataclass field in a separate list instead of creating instances.
+
+    Instances are still created if schema has `post_parse` step or data cannot be parsed by columns.
+    If any error occurs, data is parsed by `list_parser` to raise the same error as it does
+    """
+    if not (is_dataclass(class_) or (is_generic_concrete(class_) and is_dataclass(class_.__origin__))):  # type: ignore
+        raise ValueError(f"Cannot parse {class_} into columns, only dataclasses are supported")
+    field_names = [f.field_name for f in get_dataclass_fields(schema, class_)]
+    parse_field_columns = None if schema.post_parse else get_field_columns_parser(factory, schema, class_)
+
+    def columns_from_instances(data: List[Any]) -> Dict[str, List[Any]]:
+        instances = list_parser(data)
+        return {name: [getattr(item, name) for item in instances] for name in field_names}
+
+    def columns_parser(data: Iterable[Any]) -> Dict[str, List[Any]]:
+        if not isinstance(data, list):
+            data = list(data)
+        if parse_field_columns is None:
+            return columns_from_instances(data)
+        try:
+            return dict(zip(field_names, parse_field_columns(data)))
+        except Exception:  # noqa B902
+            return columns_from_instances(data)
+
+    return columns_parser
+
+
+def get_numeric_types(schema: Schema[T], class_: Type[T]) -> Dict[str, Type]:
+    """Return names of fields which are declared as int or float with their types."""
+    return {
+        f.field_name: f.type
+        for f in get_dataclass_fields(schema, class_)
+        if f.type in (int, float)
+    }
+
+
+def convert_numeric_columns(
+    columns: Dict[str, List[Any]], numeric_types: Dict[str, Type], use_numpy: Optional[bool],
+) -> Dict[str, Sequence[Any]]:
+    """
+    Convert columns of numeric fields to `array.array` or `numpy.ndarray`.
+
+    NumPy is used if `use_numpy` is True or it is None and NumPy is installed.
+    Columns which cannot be stored in 64-bit values are kept as lists
+    """
+    numpy = None
+    if use_numpy is not False:
+        try:
+            import numpy  # type: ignore # noqa I900
+        except ImportError:
+            if use_numpy:
+                raise
+    result: Dict[str, Sequence[Any]] = dict(columns)
+    for name, type_ in numeric_types.items():
+        try:
+            if numpy is not None:
+                result[name] = numpy.array(columns[name], dtype=numpy.int64 if type_ is int else numpy.float64)
+            else:
+                result[name] = array("q" if type_ is int else "d", columns[name])
+        except (OverflowError, TypeError, ValueError):
+            pass
+    return result
@@ -0,0 +1,97 @@
+import linecache
+from contextlib import contextmanager
+from itertools import count
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+_file_counter = count()
+
+
+class CodeBuilder:
+    """Collects lines of generated python source and objects they refer to."""
+
+    def __init__(self) -> None:
+        self.lines: List[str] = []
+        self.namespace: Dict[str, Any] = {}
+        self._indent = 0
+        self._names = count()
+
+    def __call__(self, line: str) -> None:
+        self.lines.append("    " * self._indent + line)
+
+    @contextmanager
+    def indent(self, enabled: bool = True) -> Iterator[None]:
+        """Indent lines added inside the block. Does nothing if not `enabled`."""
+        if enabled:
+            self._indent += 1
+        try:
+            yield
+        finally:
+            if enabled:
+                self._indent -= 1
+
+    def bind(self, prefix: str, value: Any) -> str:
+        """Make `value` available to generated code and return its name."""
+        name = f"{prefix}_{next(self._names)}"
+        self.namespace[name] = value
+        return name
+
+    def name(self, prefix: str) -> str:
+        """Return new unique name for local variable."""
+        return f"{prefix}_{next(self._names)}"
+
+    @property
+    def source(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+def get_lazy_reference(resolve: Callable[[], Callable]) -> Callable:
+    """
+    Create callable which gets real converter on first call.
+
+    It is used to refer converters of recursive types which are not created yet.
+    When resolved it replaces itself with real converter in generated code which uses it,
+    so following calls do not pass through it
+    """
+    target: Optional[Callable] = None
+    usages: List[Tuple[Dict[str, Any], str]] = []
+
+    def lazy_reference(data):
+        nonlocal target
+        if target is None:
+            target = resolve()
+            for namespace, name in usages:
+                namespace[name] = target
+            usages.clear()
+        return target(data)
+
+    def replace_in(namespace: Dict[str, Any], name: str) -> None:
+        if target is None:
+            usages.append((namespace, name))
+        else:
+            namespace[name] = target
+
+    lazy_reference.dataclass_factory_replace_in = replace_in  # type: ignore
+    return lazy_reference
+
+
+def compile_function(builder: CodeBuilder, func_name: str, title: str) -> Callable:
+    """
+    Execute generated source and return function defined there.
+
+    Source is registered in linecache, so tracebacks show generated lines
+    """
+    source = builder.source
+    filename = f"<dataclass_factory {title} #{next(_file_counter)}>"
+    code = compile(source, filename, "exec")
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    namespace = dict(builder.namespace)
+    exec(code, namespace)  # noqa S102
+    for name, value in builder.namespace.items():
+        replace_in = getattr(value, "dataclass_factory_replace_in", None)
+        if replace_in is not None:
+            replace_in(namespace, name)
+    return namespace[func_name]
+
+
+def get_qualname(class_: Any) -> str:
+    return getattr(class_, "__qualname__", None) or getattr(class_, "__name__", None) or str(class_)
@@ -1,9 +1,13 @@
+import re
 from typing import Any, Callable, Type, TypeVar
 
 
 T = TypeVar("T")
 K = TypeVar("K")
 
+# whitespace allowed between JSON tokens
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+
 
 class AbstractFactory:
     def parser(self, class_: Type):
@@ -18,6 +22,9 @@ class AbstractFactory:
     def json_schema_ref_name(self, class_: Type):
         raise NotImplementedError
 
+    def schema(self, class_: Type):
+        raise NotImplementedError
+
 
 Serializer = Callable[[T], Any]
 SerializerGetter = Callable[
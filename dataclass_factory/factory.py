@@ -1,12 +1,28 @@
-from copy import copy
-from typing import Any, Dict, Optional, Type, TypeVar
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+import json
+from threading import RLock
+from time import perf_counter
+from typing import (
+    Any, BinaryIO, Callable, cast, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Type, TypeVar, Union,
+)
 
+from .aio import DEFAULT_ASYNC_CHUNK_SIZE, parse_chunked, serialize_chunked
+from .batch import (
+    BatchParser, ColumnsParser, convert_numeric_columns, get_batch_parser, get_columns_parser, get_numeric_types,
+)
+from .codegen import get_lazy_reference
 from .common import AbstractFactory, Parser, Serializer
+from .json_parsers import create_json_parser, JsonParser, parse_json_text
+from .json_serializers import create_json_serializer, JsonSerializer
+from .json_stream import DEFAULT_CHUNK_SIZE, get_json_encoder, iter_json_array, write_json_lines
 from .jsonschema import create_schema
 from .naming import NameStyle
-from .parsers import create_parser, get_lazy_parser
-from .schema import merge_schema, Schema, Unknown
-from .serializers import create_serializer, get_lazy_serializer
+from .parallel import DEFAULT_PARALLEL_CHUNK_SIZE, parse_parallel
+from .parsers import create_parser, get_lazy_debug_parser, get_lazy_parser
+from .path_utils import CleanKey
+from .schema import merge_schema, ResolvedSchema, resolve_schema, Schema, Unknown
+from .serializers import create_serializer, get_recursive_serializer
 from .type_detection import is_generic_concrete
 
 DEFAULT_SCHEMA = Schema[Any](
@@ -28,6 +44,9 @@ class StackedFactory(AbstractFactory):
     def json_schema_ref_name(self, class_: Type):
         return self.factory._json_schema_ref_name_with_stack(class_, self)
 
+    def schema(self, class_: Type):
+        return self.factory.schema(class_)
+
     def json_schema(self, class_: Type):
         if class_ in self.stack:
             return
@@ -39,7 +58,8 @@ class StackedFactory(AbstractFactory):
 
     def parser(self, class_: Type):
         if class_ in self.stack:
-            return get_lazy_parser(self.factory, class_)
+            # resolved without lazy debug path wrapper, it is added only to top-level parser
+            return get_lazy_parser(StackedFactory(self.factory), class_)
         self.stack.append(class_)
         try:
             return self.factory._parser_with_stack(class_, self)
@@ -48,7 +68,7 @@ class StackedFactory(AbstractFactory):
 
     def serializer(self, class_: Type):
         if class_ in self.stack:
-            return get_lazy_serializer(self.factory)
+            return get_recursive_serializer(self.factory, class_)
         self.stack.append(class_)
         try:
             return self.factory._serializer_with_stack(class_, self)
@@ -59,14 +79,33 @@ class StackedFactory(AbstractFactory):
 T = TypeVar("T")
 
 
+@dataclass
+class BuildInfo:
+    """Information about parser or serializer built during `Factory.warmup`"""
+    type: Any
+    kind: str  # "parser" or "serializer"
+    seconds: float  # time spent building, excluding nested types
+
+
 class Factory(AbstractFactory):
-    __slots__ = ("default_schema", "debug_path", "schemas")
+    __slots__ = (
+        "default_schema", "debug_path", "lazy_debug_path", "schemas", "codegen",
+        "_parsers", "_serializers", "_batch_parsers", "_columns_parsers",
+        "_json_serializers", "_json_serializers_stack", "_json_parsers", "_json_parsers_stack",
+        "_lazy_debug_parsers", "_debug_factory", "_lock",
+        "_build_log", "_nested_build_time",
+    )
 
     def __init__(self,
                  default_schema: Optional[Schema] = None,
                  schemas: Optional[Dict[Type, Schema]] = None,
-                 debug_path: bool = False):
+                 debug_path: bool = False,
+                 lazy_debug_path: bool = False,
+                 codegen: bool = False):
         self.debug_path = debug_path
+        # paths are found only when error happens, by parsing data again with debug_path enabled
+        self.lazy_debug_path = lazy_debug_path and not debug_path
+        self.codegen = codegen
         self.default_schema = default_schema
         self.schemas: Dict[Type, Schema] = {}
         if schemas:
@@ -76,6 +115,40 @@ class Factory(AbstractFactory):
             })
         self.json_schemas: Dict[str, Dict] = {}
         self.json_schema_names: Dict[str, Type] = {}
+        # built parsers and serializers are stored here, not in schemas,
+        # so schemas contain only what was set by user
+        self._parsers: Dict[Type, Parser] = {}
+        self._serializers: Dict[Type, Serializer] = {}
+        self._batch_parsers: Dict[Type, BatchParser] = {}
+        self._columns_parsers: Dict[Type, ColumnsParser] = {}
+        self._json_serializers: Dict[Type, JsonSerializer] = {}
+        self._json_serializers_stack: List[Type] = []
+        self._json_parsers: Dict[Type, JsonParser] = {}
+        self._json_parsers_stack: List[Type] = []
+        self._lazy_debug_parsers: Dict[Type, Parser] = {}
+        self._debug_factory: Optional[Factory] = None
+        # converters are built holding the lock, so each of them is built once even if requested by several threads.
+        # Built ones are taken from caches without locking
+        self._lock = RLock()
+        # filled only during warmup
+        self._build_log: Optional[List[BuildInfo]] = None
+        self._nested_build_time: List[float] = []
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # only configuration is pickled, converters are created again when they are needed
+        return {
+            "default_schema": self.default_schema,
+            "schemas": {type_: self.schema(type_) for type_ in list(self.schemas)},
+            "debug_path": self.debug_path,
+            "lazy_debug_path": self.lazy_debug_path,
+            "codegen": self.codegen,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        state = dict(state)
+        schemas = state.pop("schemas")
+        self.__init__(**state)  # type: ignore
+        self.schemas.update(schemas)  # already resolved
 
     def schema(self, class_: Type[T]) -> Schema[T]:
         if is_generic_concrete(class_):
@@ -84,37 +157,85 @@ class Factory(AbstractFactory):
             base_class = None
 
         schema = self.schemas.get(class_)
+        if isinstance(schema, ResolvedSchema):
+            return cast(Schema[T], schema)
+        with self._lock:
+            return self._resolve_schema(class_, base_class)
+
+    def _resolve_schema(self, class_: Type[T], base_class: Optional[Type]) -> Schema[T]:
+        schema = self.schemas.get(class_)
+        if isinstance(schema, ResolvedSchema):
+            return cast(Schema[T], schema)
         if not schema:
             if base_class:
                 schema = self.schemas.get(base_class)
             if not schema:
                 schema = Schema()
-            schema = merge_schema(schema, self.default_schema, DEFAULT_SCHEMA)
-            self.schemas[class_] = schema
+        # merged options are resolved on first use and not changed later
+        schema = resolve_schema(schema, self.default_schema, DEFAULT_SCHEMA)
+        self.schemas[class_] = schema
         return schema
 
     def parser(self, class_: Type[T]) -> Parser[T]:
-        return self._parser_with_stack(class_, StackedFactory(self))
+        if self.lazy_debug_path:
+            return self._lazy_debug_parser(class_)
+        parser = self._parsers.get(class_)
+        if parser is None:
+            parser = StackedFactory(self).parser(class_)
+        return parser
+
+    def _lazy_debug_parser(self, class_: Type[T]) -> Parser[T]:
+        parser = self._lazy_debug_parsers.get(class_)
+        if parser is not None:
+            return parser
+        fast_parser = self._parsers.get(class_)
+        if fast_parser is None:
+            fast_parser = StackedFactory(self).parser(class_)
+        parser = get_lazy_debug_parser(fast_parser, lambda: self._get_debug_factory().parser(class_))
+        self._lazy_debug_parsers[class_] = parser
+        return parser
+
+    def _get_debug_factory(self) -> "Factory":
+        """Return factory with the same configuration, but with debug_path enabled"""
+        with self._lock:
+            if self._debug_factory is None:
+                state = self.__getstate__()
+                state.update(debug_path=True, lazy_debug_path=False)
+                factory = Factory.__new__(Factory)
+                factory.__setstate__(state)
+                self._debug_factory = factory
+            return self._debug_factory
 
     def _parser_with_stack(self, class_: Type[T], stacked_factory: StackedFactory) -> Parser[T]:
-        schema = self.schema(class_)
+        parser = self._parsers.get(class_)
+        if parser is not None:
+            return parser
+        with self._lock:
+            parser = self._parsers.get(class_)  # could be built by another thread while waiting for the lock
+            if parser is not None:
+                return parser
+            if self._build_log is None:
+                parser = self._create_parser(class_, stacked_factory)
+            else:
+                parser = self._timed_build(self._create_parser, class_, stacked_factory, "parser")
+            self._parsers[class_] = parser
+            return parser
 
+    def _create_parser(self, class_: Type[T], stacked_factory: StackedFactory) -> Parser[T]:
+        schema = self.schema(class_)
         if schema.get_parser is not None:
             if schema.parser is not None:
                 raise TypeError("Schema can not have parser and get_parser at same time")
-            else:
-                new_schema = copy(schema)
-                new_schema.parser = schema.get_parser(class_, stacked_factory, self.debug_path)
-                new_schema.get_parser = None
-                self.schemas[class_] = new_schema
-                schema = new_schema
-
-        if not schema.parser:
-            schema.parser = create_parser(stacked_factory, schema, self.debug_path, class_)
-        return schema.parser
+            parser = schema.get_parser(class_, stacked_factory, self.debug_path)
+        elif schema.parser:
+            parser = schema.parser
+        else:
+            parser = create_parser(stacked_factory, schema, self.debug_path, class_, self.codegen)
+        return parser
 
     def json_schema_ref_name(self, class_: Type[T]):
-        return self._json_schema_ref_name_with_stack(class_, StackedFactory(self))
+        with self._lock:
+            return self._json_schema_ref_name_with_stack(class_, StackedFactory(self))
 
     def _json_schema_ref_name_with_stack(self, class_: Type[T], stacked_factory: StackedFactory):
         schema = self.schema(class_)
@@ -132,20 +253,23 @@ class Factory(AbstractFactory):
                              f"{self.json_schema_names[name]}. "
                              f"Please, specify another name for {class_} "
                              f"in schema or rename class itself")
-        schema.name = name
+        resolved = cast(ResolvedSchema, schema)
+        self.schemas[class_] = cast(Schema, resolved.replace(name=name))
         stacked_factory.json_schema(class_)
         return name
 
     def json_schema(self, class_: Type[T]) -> Dict[str, Any]:
-        return self._json_schema_with_stack(class_, StackedFactory(self))
+        with self._lock:
+            return self._json_schema_with_stack(class_, StackedFactory(self))
 
     def json_schema_definitions(self) -> Dict[str, Any]:
-        return {
-            "definitions": {
-                k: v
-                for k, v in self.json_schemas.items()
-            },
-        }
+        with self._lock:
+            return {
+                "definitions": {
+                    k: v
+                    for k, v in self.json_schemas.items()
+                },
+            }
 
     def _json_schema_with_stack(self, class_: Type[T], stacked_factory: StackedFactory) -> Dict[str, Any]:
         schema = self.schema(class_)
@@ -157,30 +281,305 @@ class Factory(AbstractFactory):
         return json_schema
 
     def serializer(self, class_: Type[T]) -> Serializer[T]:
-        return self._serializer_with_stack(class_, StackedFactory(self))
+        serializer = self._serializers.get(class_)
+        if serializer is None:
+            serializer = StackedFactory(self).serializer(class_)
+        return serializer
 
     def _serializer_with_stack(self, class_: Type[T], stacked_factory: StackedFactory) -> Serializer[T]:
-        schema = self.schema(class_)
+        serializer = self._serializers.get(class_)
+        if serializer is not None:
+            return serializer
+        with self._lock:
+            serializer = self._serializers.get(class_)  # could be built by another thread while waiting for the lock
+            if serializer is not None:
+                return serializer
+            if self._build_log is None:
+                serializer = self._create_serializer(class_, stacked_factory)
+            else:
+                serializer = self._timed_build(self._create_serializer, class_, stacked_factory, "serializer")
+            self._serializers[class_] = serializer
+            return serializer
 
+    def _create_serializer(self, class_: Type[T], stacked_factory: StackedFactory) -> Serializer[T]:
+        schema = self.schema(class_)
         if schema.get_serializer is not None:
             if schema.serializer is not None:
                 raise TypeError("Schema can not have serializer and get_serializer at same time")
-            else:
-                new_schema = copy(schema)
-                new_schema.serializer = schema.get_serializer(class_, stacked_factory, self.debug_path)
-                new_schema.get_serializer = None
-                self.schemas[class_] = new_schema
-                schema = new_schema
-
-        if not schema.serializer:
-            schema.serializer = create_serializer(stacked_factory, schema, self.debug_path, class_)
-
-        return schema.serializer
+            serializer = schema.get_serializer(class_, stacked_factory, self.debug_path)
+        elif schema.serializer:
+            serializer = schema.serializer
+        else:
+            serializer = create_serializer(stacked_factory, schema, self.debug_path, class_, self.codegen)
+        return serializer
+
+    def _timed_build(
+        self,
+        build: Callable[[Type[T], StackedFactory], Callable],
+        class_: Type[T],
+        stacked_factory: StackedFactory,
+        kind: str,
+    ) -> Callable:
+        self._nested_build_time.append(0.)
+        started = perf_counter()
+        converter = build(class_, stacked_factory)
+        elapsed = perf_counter() - started
+        nested = self._nested_build_time.pop()
+        if self._nested_build_time:
+            self._nested_build_time[-1] += elapsed
+        cast(List[BuildInfo], self._build_log).append(BuildInfo(class_, kind, elapsed - nested))
+        return converter
+
+    def warmup(self, *classes: Type, parsers: bool = True, serializers: bool = True) -> List[BuildInfo]:
+        """
+        Build parsers and serializers for given types and all types reachable from them.
+
+        Types found in one direction (e.g. union members which are parsed) are built in another one too.
+        Disable `parsers` or `serializers` if you need only one direction.
+        Returns info about each parser and serializer built during this call
+        """
+        with self._lock:  # converters built by other threads at the same time should not get into the log
+            return self._warmup(classes, parsers, serializers)
+
+    def _warmup(self, classes: Sequence[Type], parsers: bool, serializers: bool) -> List[BuildInfo]:
+        log: List[BuildInfo] = []
+        self._build_log = log
+        self._nested_build_time = []
+        try:
+            for class_ in classes:
+                if parsers:
+                    self.parser(class_)
+                if serializers:
+                    self.serializer(class_)
+            processed = 0
+            while processed < len(log):
+                info = log[processed]
+                processed += 1
+                if serializers and info.kind == "parser":
+                    self.serializer(info.type)
+                elif parsers and info.kind == "serializer":
+                    self.parser(info.type)
+        finally:
+            self._build_log = None
+        return log
 
+    # `load` and `dump` check caches first, so no objects are created when converter is already built
     def load(self, data: Any, class_: Type[T]) -> T:
-        return self.parser(class_)(data)
+        if self.lazy_debug_path:
+            return self._lazy_debug_parser(class_)(data)
+        parser = self._parsers.get(class_)
+        if parser is None:
+            parser = StackedFactory(self).parser(class_)
+        return parser(data)
 
     def dump(self, data: T, class_: Type[T] = None) -> Any:
-        if class_ is None:
-            class_ = type(data)
-        return self.serializer(class_)(data)
+        serializer = self._serializers.get(type(data) if class_ is None else class_)
+        if serializer is None:
+            serializer = StackedFactory(self).serializer(type(data) if class_ is None else class_)
+        return serializer(data)
+
+    async def load_async(
+        self,
+        data: Any,
+        class_: Type[T],
+        chunk_size: int = DEFAULT_ASYNC_CHUNK_SIZE,
+        time_slice: Optional[float] = None,
+    ) -> T:
+        """
+        Parse data like `load` does, but do not block event loop for a long time.
+
+        Elements of top-level collection (or dict) are parsed in chunks of `chunk_size` and control is returned
+        to event loop after each chunk. If `time_slice` is set, it is returned only after at least `time_slice` seconds
+        """
+        debug_path = self.debug_path or self.lazy_debug_path
+        return await parse_chunked(self, data, class_, debug_path, chunk_size, time_slice)
+
+    async def dump_async(
+        self,
+        data: T,
+        class_: Optional[Type[T]] = None,
+        chunk_size: int = DEFAULT_ASYNC_CHUNK_SIZE,
+        time_slice: Optional[float] = None,
+    ) -> Any:
+        """Serialize data like `dump` does, but process top-level collection in chunks like `load_async`"""
+        return await serialize_chunked(self, data, type(data) if class_ is None else class_, chunk_size, time_slice)
+
+    def json_serializer(self, class_: Type[T]) -> Callable[[T], str]:
+        """Return function which converts instance of `class_` directly to compact JSON text"""
+        json_serializer = self._json_serializers.get(class_)
+        if json_serializer is not None:
+            return json_serializer
+        with self._lock:
+            json_serializer = self._json_serializers.get(class_)
+            if json_serializer is not None:
+                return json_serializer
+            if class_ in self._json_serializers_stack:
+                return get_lazy_reference(lambda: self.json_serializer(class_))
+            self._json_serializers_stack.append(class_)
+            try:
+                json_serializer = create_json_serializer(self, self.schema(class_), class_, self.json_serializer)
+            finally:
+                self._json_serializers_stack.pop()
+            self._json_serializers[class_] = json_serializer
+            return json_serializer
+
+    def dump_json(self, data: T, class_: Optional[Type[T]] = None) -> str:
+        """
+        Serialize data to compact JSON text without creating intermediate dicts and lists where possible.
+
+        Result is the same as `json.dumps(factory.dump(data), ensure_ascii=False, separators=(",", ":"))`
+        """
+        json_serializer = self._json_serializers.get(type(data) if class_ is None else class_)
+        if json_serializer is None:
+            json_serializer = self.json_serializer(type(data) if class_ is None else class_)
+        return json_serializer(data)
+
+    def json_parser(self, class_: Type[T]) -> JsonParser:
+        """
+        Return function which parses JSON value of `class_` directly from text.
+
+        It accepts text and index where value starts and returns parsed value and index after it
+        """
+        json_parser = self._json_parsers.get(class_)
+        if json_parser is not None:
+            return json_parser
+        with self._lock:
+            json_parser = self._json_parsers.get(class_)
+            if json_parser is not None:
+                return json_parser
+            if class_ in self._json_parsers_stack:
+                return get_lazy_reference(lambda: self.json_parser(class_))
+            self._json_parsers_stack.append(class_)
+            try:
+                json_parser = create_json_parser(StackedFactory(self), self.schema(class_), class_, self.json_parser)
+            finally:
+                self._json_parsers_stack.pop()
+            self._json_parsers[class_] = json_parser
+            return json_parser
+
+    def load_json(self, text: Union[str, bytes], class_: Type[T]) -> T:
+        """
+        Parse JSON text as `class_`. Result is the same as `factory.load(json.loads(text), class_)`.
+
+        Dataclasses are created while reading text, so no intermediate dicts are built for them.
+        If text or data is invalid, it is parsed again using `load` to raise the same error
+        """
+        if isinstance(text, (bytes, bytearray)):
+            text = text.decode()
+        json_parser = self._json_parsers.get(class_)
+        if json_parser is None:
+            json_parser = self.json_parser(class_)
+        try:
+            return parse_json_text(json_parser, text)
+        except Exception:  # noqa B902
+            return self.load(json.loads(text), class_)
+
+    def batch_parser(self, class_: Type[T]) -> BatchParser[T]:
+        """Return parser of many items of `class_` at once. It returns a list"""
+        batch_parser = self._batch_parsers.get(class_)
+        if batch_parser is not None:
+            return batch_parser
+        with self._lock:
+            batch_parser = self._batch_parsers.get(class_)
+            if batch_parser is None:
+                batch_parser = get_batch_parser(
+                    StackedFactory(self), self.schema(class_), class_, self.parser(List[class_]),  # type: ignore
+                )
+                self._batch_parsers[class_] = batch_parser
+            return batch_parser
+
+    def load_many(self, data: Iterable[Any], class_: Type[T]) -> List[T]:
+        """Parse each item of `data` as `class_`. Works like `load(data, List[class_])` but faster"""
+        batch_parser = self._batch_parsers.get(class_)
+        if batch_parser is None:
+            batch_parser = self.batch_parser(class_)
+        return batch_parser(data)
+
+    def load_parallel(
+        self,
+        data: Iterable[Any],
+        class_: Type[T],
+        executor: Optional[Executor] = None,
+        chunk_size: int = DEFAULT_PARALLEL_CHUNK_SIZE,
+        from_json: bool = False,
+    ) -> List[T]:
+        """
+        Parse each item of `data` as `class_` in several processes. Returns list in the same order.
+
+        Items are split into chunks of `chunk_size` and sent to `executor`. If it is not provided,
+        `ProcessPoolExecutor` is created for this call. Factory and `class_` must be picklable.
+        If `from_json` is True, items are JSON texts which are parsed with `load_json` inside of workers
+        """
+        if executor is None:
+            with ProcessPoolExecutor() as executor:
+                return parse_parallel(self, data, class_, executor, chunk_size, from_json)
+        return parse_parallel(self, data, class_, executor, chunk_size, from_json)
+
+    def iter_load(
+        self, file: BinaryIO, class_: Type[T], path: Sequence[CleanKey] = (), chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[T]:
+        """
+        Read JSON array from file and parse its elements as `class_` one by one.
+
+        Only current element is kept in memory, so file of any size can be processed.
+        `path` contains keys and indexes to find array inside of top-level JSON value
+        """
+        parser = self.parser(class_)
+        for item in iter_json_array(file, path, chunk_size):
+            yield parser(item)
+
+    def dump_lines(
+        self,
+        file: Union[BinaryIO, TextIO],
+        items: Iterable[T],
+        class_: Optional[Type[T]] = None,
+        buffer_size: int = DEFAULT_CHUNK_SIZE,
+        ensure_ascii: bool = False,
+    ) -> int:
+        """
+        Serialize items and write them to file in JSON Lines format. Returns number of written items.
+
+        Data is written in blocks of about `buffer_size` chars. If `class_` is not set, it is detected for each item
+        """
+        to_json: Callable[[Any], str]
+        if ensure_ascii:
+            encode = get_json_encoder(ensure_ascii=True)
+            dump = self.serializer(class_) if class_ is not None else self.dump
+
+            def to_json(item):
+                return encode(dump(item))
+        elif class_ is not None:
+            to_json = self.json_serializer(class_)
+        else:
+            to_json = self.dump_json
+        return write_json_lines(file, items, to_json, buffer_size)
+
+    def columns_parser(self, class_: Type[T]) -> ColumnsParser:
+        """Return parser of many items of dataclass, which returns list of values for each field"""
+        columns_parser = self._columns_parsers.get(class_)
+        if columns_parser is not None:
+            return columns_parser
+        with self._lock:
+            columns_parser = self._columns_parsers.get(class_)
+            if columns_parser is None:
+                columns_parser = get_columns_parser(
+                    StackedFactory(self), self.schema(class_), class_, self.parser(List[class_]),  # type: ignore
+                )
+                self._columns_parsers[class_] = columns_parser
+            return columns_parser
+
+    def load_columns(
+        self, data: Iterable[Any], class_: Type[T], numeric: bool = True, use_numpy: Optional[bool] = None,
+    ) -> Dict[str, Sequence[Any]]:
+        """
+        Parse each item of `data` as dataclass `class_`, but return values of each field as separate sequence.
+
+        Dataclass instances are not created (unless `post_parse` is set in schema).
+        If `numeric` is True, columns of `int` and `float` fields are converted to arrays:
+        `numpy.ndarray` if NumPy is installed (or `use_numpy` is True) and `array.array` otherwise
+        """
+        columns = self.columns_parser(class_)(data)
+        if not numeric:
+            return cast(Dict[str, Sequence[Any]], columns)
+        numeric_types = get_numeric_types(self.schema(class_), class_)
+        return convert_numeric_columns(columns, numeric_types, use_numpy)
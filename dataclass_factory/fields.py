@@ -1,13 +1,13 @@
 import inspect
-from dataclasses import dataclass, Field, fields, MISSING
+from dataclasses import dataclass, Field, fields, is_dataclass, MISSING
 from functools import partial
-from typing import Any, Callable, cast, Dict, List, Sequence, Type, TypeVar, Union
+from typing import Any, Callable, cast, Dict, List, Optional, Sequence, Type, TypeVar, Union
 
 from .generics import resolve_hints, resolve_init_hints
 from .naming import convert_name
 from .path_utils import CleanKey, CleanPath, Key, Path, replace_ellipsis
 from .schema import Schema
-from .type_detection import is_generic_concrete
+from .type_detection import is_generic_concrete, is_literal, is_literal36
 
 T = TypeVar("T")
 
@@ -38,6 +38,25 @@ def get_func_default(parameter: inspect.Parameter) -> Any:
     return parameter.default
 
 
+def has_dataclass_init(cls) -> bool:
+    """
+    Check if `__init__` of dataclass is generated by decorator, so it fills missing fields with their defaults.
+
+    Decorator keeps `__init__` written in class body. Generated one is compiled from string and named after its class
+    """
+    if is_generic_concrete(cls):
+        cls = cls.__origin__
+    if not isinstance(cls, type) or not is_dataclass(cls):
+        return False
+    owner = next(c for c in cls.__mro__ if "__init__" in vars(c))
+    if vars(owner).get("__dataclass_fields__") is not cls.__dataclass_fields__:
+        return False
+    init = vars(owner)["__init__"]
+    if getattr(getattr(init, "__code__", None), "co_filename", None) != "<string>":
+        return False
+    return getattr(init, "__qualname__", None) == f"{owner.__qualname__}.__init__"
+
+
 def all_dataclass_fields(cls) -> List[BaseFieldInfo]:
     if is_generic_concrete(cls):
         all_fields = fields(cls.__origin__)
@@ -157,3 +176,46 @@ def get_typeddict_fields(schema: Schema[T], class_: Type[T]) -> Sequence[FieldIn
 
 def get_class_fields(schema: Schema[T], class_: Type[T]) -> Sequence[FieldInfo]:
     return get_fields(all_class_fields, schema, class_)
+
+
+def get_discriminator_values(class_: Type, field_name: str) -> Sequence[Any]:
+    """Detect possible values of dataclass field using its `Literal` type or default."""
+    origin = class_.__origin__ if is_generic_concrete(class_) else class_
+    if not is_dataclass(origin):
+        return ()
+    field = next((f for f in fields(origin) if f.name == field_name), None)
+    if field is None:
+        return ()
+    hint = resolve_hints(class_).get(field_name)
+    if is_literal(hint):
+        return hint.__args__
+    if is_literal36(hint):
+        return hint.__values__
+    if field.default is not MISSING:
+        return (field.default,)
+    return ()
+
+
+def get_discriminator_mapping(
+    discriminator: str,
+    mapping: Optional[Dict[Any, Type]],
+    members: Sequence[Type],
+) -> Dict[Any, Type]:
+    """
+    Get mapping from discriminator value to union member.
+
+    If no mapping is provided, it is detected using field with the same name as discriminator
+    """
+    if mapping is not None:
+        alien_types = [t for t in mapping.values() if t not in members]
+        if alien_types:
+            raise ValueError(f"Types {alien_types} from discriminator mapping are not members of union")
+        return dict(mapping)
+    result = {
+        value: member
+        for member in reversed(members)
+        for value in get_discriminator_values(member, discriminator)
+    }
+    if not result:
+        raise ValueError(f"Cannot detect values of discriminator `{discriminator}` for {members}")
+    return result
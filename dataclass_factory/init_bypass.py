@@ -0,0 +1,131 @@
+from dataclasses import Field, fields as dataclass_fields_of, is_dataclass, MISSING
+from inspect import getattr_static, signature
+from types import MemberDescriptorType
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Type
+
+from .codegen import CodeBuilder, get_qualname
+from .common import T
+from .fields import has_dataclass_init
+
+SlotSetter = Callable[[Any, Any], None]
+
+
+def get_slot_setters(class_: Type, fields: Sequence[Field]) -> Optional[Dict[str, SlotSetter]]:
+    """
+    Find descriptors of slots storing values of fields.
+
+    Returns empty dict if all fields are stored in `__dict__` of instance
+    and None if some of them cannot be set directly (e.g. property with the same name)
+    """
+    setters = {}
+    for f in fields:
+        attr = getattr_static(class_, f.name, None)
+        if isinstance(attr, MemberDescriptorType):
+            setters[f.name] = attr.__set__
+        elif hasattr(type(attr), "__set__") or not class_.__dictoffset__:
+            return None
+    if setters and len(setters) != len(fields):
+        return None
+    return setters
+
+
+def can_bypass_init(class_: Type) -> bool:
+    """
+    Check if instance of dataclass can be created without calling its `__init__`.
+
+    It is possible only if `__init__` is generated by dataclass and nothing else happens during creation of instance:
+    no `__post_init__`, `InitVar` fields, custom `__new__` or `__setattr__`. Generic aliases are not supported
+    """
+    if not isinstance(class_, type) or not is_dataclass(class_):
+        return False
+    if not class_.__dataclass_params__.init or hasattr(class_, "__post_init__"):  # type: ignore
+        return False
+    if class_.__new__ is not object.__new__:
+        return False
+    # generated `__init__` of frozen class calls `object.__setattr__`, others use `__setattr__` of class
+    if class_.__setattr__ is not object.__setattr__ and not class_.__dataclass_params__.frozen:  # type: ignore
+        return False
+    if not has_dataclass_init(class_):  # custom `__init__`
+        return False
+    fields = dataclass_fields_of(class_)
+    init = class_.__init__
+    if list(signature(init).parameters)[1:] != [f.name for f in fields if f.init]:  # `InitVar` is passed to init
+        return False
+    return get_slot_setters(class_, fields) is not None
+
+
+def get_instance_factory(class_: Type[T]) -> Callable[[Dict[str, Any]], T]:  # noqa C901
+    """
+    Create function making instance of dataclass from dict of field values without calling `__init__`.
+
+    Missing values are filled with defaults like generated `__init__` does, passed dict is changed.
+    Class must be checked with `can_bypass_init` before
+    """
+    fields = dataclass_fields_of(class_)  # type: ignore
+    setters = get_slot_setters(class_, fields)
+    init_count = sum(f.init for f in fields)
+    required = tuple(f.name for f in fields if f.init and f.default is MISSING and f.default_factory is MISSING)
+    defaults = tuple((f.name, f.default) for f in fields if f.init and f.default is not MISSING)
+    factories = tuple((f.name, f.default_factory) for f in fields if f.init and f.default_factory is not MISSING)
+    # fields which are not passed to `__init__` are set only if they have factory, others are class attributes
+    fixed_factories = tuple(
+        (f.name, f.default_factory) for f in fields if not f.init and f.default_factory is not MISSING
+    )
+    qualname = get_qualname(class_)
+    new = object.__new__
+
+    def create_instance(values):
+        if len(values) != init_count:
+            for name in required:
+                if name not in values:
+                    raise TypeError(f"{qualname}.__init__() missing 1 required argument: {name!r}")
+            for name, default in defaults:
+                if name not in values:
+                    values[name] = default
+            for name, default_factory in factories:
+                if name not in values:
+                    values[name] = default_factory()
+        for name, default_factory in fixed_factories:
+            values[name] = default_factory()
+        instance = new(class_)
+        if setters:
+            for name, value in values.items():
+                setters[name](instance, value)
+        else:
+            instance.__dict__.update(values)
+        return instance
+
+    return create_instance
+
+
+def gen_instance(builder: CodeBuilder, class_: Type, values: Sequence[Tuple[str, str]], target: str) -> None:
+    """
+    Generate creation of dataclass instance without calling `__init__`.
+
+    `values` contains names of fields and expressions of their values,
+    other fields are filled with defaults, which are bound to generated code once
+    """
+    fields = dataclass_fields_of(class_)
+    setters = get_slot_setters(class_, fields)
+    expressions = dict(values)
+    builder(f"{target} = {builder.bind('new', object.__new__)}({builder.bind('class', class_)})")
+    if not setters:
+        attrs = builder.name("attrs")
+        builder(f"{attrs} = {target}.__dict__")
+    for f in fields:
+        if f.name in expressions:
+            expression = expressions[f.name]
+        elif f.default_factory is not MISSING:  # type: ignore
+            expression = f"{builder.bind('default_factory', f.default_factory)}()"  # type: ignore
+        elif not f.init:
+            continue
+        elif f.default is not MISSING:
+            expression = builder.bind("default", f.default)
+        else:
+            message = f"{get_qualname(class_)}.__init__() missing 1 required argument: {f.name!r}"
+            builder(f"raise TypeError({message!r})")
+            return
+        if setters:
+            builder(f"{builder.bind('set', setters[f.name])}({target}, {expression})")
+        else:
+            builder(f"{attrs}[{f.name!r}] = {expression}")
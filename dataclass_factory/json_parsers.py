@@ -0,0 +1,292 @@
+from dataclasses import is_dataclass
+from json import JSONDecodeError, JSONDecoder
+from json.decoder import scanstring  # type: ignore
+from json.scanner import make_scanner  # type: ignore
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+from .common import AbstractFactory, Parser, WHITESPACE
+from .exceptions import UnknownFieldsError
+from .fields import get_dataclass_fields
+from .init_bypass import can_bypass_init, get_instance_factory
+from .parsers import get_collection_factory, get_field_parser
+from .schema import has_custom_parsing, Schema, Unknown
+from .type_detection import hasargs, is_collection, is_dict, is_generic_concrete, is_optional, is_tuple
+
+# Decodes JSON value which starts at given index of text. Returns parsed value and index after the value
+JsonParser = Callable[[str, int], Tuple[Any, int]]
+
+WHITESPACE_CHARS = " \t\n\r"
+
+scan_once = make_scanner(JSONDecoder())  # type: ignore
+
+
+def skip_whitespace(text: str, idx: int) -> int:
+    if idx < len(text) and text[idx] in WHITESPACE_CHARS:
+        if idx + 1 < len(text) and text[idx + 1] not in WHITESPACE_CHARS:
+            return idx + 1  # single space after separator is the most common case
+        return WHITESPACE.match(text, idx).end()  # type: ignore
+    return idx
+
+
+def is_dataclass_supported(schema: Schema, class_: Type) -> bool:
+    """Check if dataclass can be parsed directly from text: no flattening, list mode or storing unknown fields"""
+    if not (is_dataclass(class_) or (is_generic_concrete(class_) and is_dataclass(class_.__origin__))):
+        return False
+    if schema.unknown not in (Unknown.SKIP, Unknown.FORBID):
+        return False
+    return all(isinstance(f.data_name, str) for f in get_dataclass_fields(schema, class_))
+
+
+def get_item_type(class_: Type) -> Optional[Type]:
+    """Return type of values of JSON array or object which is parsed as `class_`, if it is supported"""
+    if not hasargs(class_):
+        return None
+    if is_dict(class_):
+        return class_.__args__[1] if class_.__args__[0] is str else None
+    if is_collection(class_) and not is_tuple(class_):
+        return class_.__args__[0]
+    return None
+
+
+def is_structured(factory: AbstractFactory, class_: Type, seen: Tuple[Type, ...] = ()) -> bool:
+    """
+    Check if type contains arrays or objects with dataclasses inside.
+
+    Such types are parsed directly from text, so only one element is decoded by `json` module at a time.
+    Other types are decoded completely and then parsed as usual, as it is faster
+    """
+    schema = factory.schema(class_)
+    if has_custom_parsing(schema):
+        return False
+    if is_optional(class_):
+        return is_structured(factory, class_.__args__[0], seen)
+    item_type = get_item_type(class_)
+    if item_type is not None:
+        if is_optional(item_type):
+            item_type = item_type.__args__[0]
+        if is_dataclass(item_type) or (is_generic_concrete(item_type) and is_dataclass(item_type.__origin__)):
+            return True
+        return is_structured(factory, item_type, seen)
+    if class_ in seen or not is_dataclass_supported(schema, class_):
+        return False
+    seen = (*seen, class_)
+    return any(is_structured(factory, f.type, seen) for f in get_dataclass_fields(schema, class_))
+
+
+def get_fallback_json_parser(parser: Parser) -> JsonParser:
+    """Decode value using `json` module and then parse it as usual"""
+
+    def fallback_json_parser(text, idx):
+        try:
+            value, end = scan_once(text, idx)
+        except StopIteration as e:
+            raise JSONDecodeError("Expecting value", text, e.value) from None
+        return parser(value), end
+
+    return fallback_json_parser
+
+
+def get_optional_json_parser(json_parser: JsonParser) -> JsonParser:
+    def optional_json_parser(text, idx):
+        if text.startswith("null", idx):
+            return None, idx + 4
+        return json_parser(text, idx)
+
+    return optional_json_parser
+
+
+def get_collection_json_parser(
+    collection_factory: Type, item_json_parser: JsonParser, fallback: JsonParser,
+) -> JsonParser:
+    def collection_json_parser(text, idx):
+        if text[idx] != "[":
+            return fallback(text, idx)
+        result = []
+        idx = skip_whitespace(text, idx + 1)
+        if text[idx] != "]":
+            while True:
+                item, idx = item_json_parser(text, idx)
+                result.append(item)
+                idx = skip_whitespace(text, idx)
+                char = text[idx]
+                if char == "]":
+                    break
+                if char != ",":
+                    raise JSONDecodeError("Expecting ',' delimiter", text, idx)
+                idx = skip_whitespace(text, idx + 1)
+        if collection_factory is list:
+            return result, idx + 1
+        return collection_factory(result), idx + 1
+
+    return collection_json_parser
+
+
+def get_decoded_items_collection_json_parser(  # noqa C901
+    collection_factory: Type, item_parser: Parser, fallback: JsonParser,
+) -> JsonParser:
+    """Same as `get_collection_json_parser`, but each item is decoded by `json` module and then parsed"""
+
+    def decoded_items_collection_json_parser(text, idx):
+        if text[idx] != "[":
+            return fallback(text, idx)
+        result = []
+        append = result.append
+        idx = skip_whitespace(text, idx + 1)
+        if text[idx] != "]":
+            while True:
+                try:
+                    item, idx = scan_once(text, idx)
+                except StopIteration as e:
+                    raise JSONDecodeError("Expecting value", text, e.value) from None
+                append(item_parser(item))
+                char = text[idx]
+                if char in WHITESPACE_CHARS:
+                    idx = skip_whitespace(text, idx)
+                    char = text[idx]
+                if char == "]":
+                    break
+                if char != ",":
+                    raise JSONDecodeError("Expecting ',' delimiter", text, idx)
+                idx += 1
+                if text[idx] in WHITESPACE_CHARS:
+                    idx = skip_whitespace(text, idx)
+        if collection_factory is list:
+            return result, idx + 1
+        return collection_factory(result), idx + 1
+
+    return decoded_items_collection_json_parser
+
+
+def get_dict_json_parser(value_json_parser: JsonParser, fallback: JsonParser) -> JsonParser:
+    def dict_json_parser(text, idx):
+        if text[idx] != "{":
+            return fallback(text, idx)
+        result = {}
+        idx = skip_whitespace(text, idx + 1)
+        if text[idx] == "}":
+            return result, idx + 1
+        while True:
+            if text[idx] != '"':
+                raise JSONDecodeError("Expecting property name enclosed in double quotes", text, idx)
+            key, idx = scanstring(text, idx + 1)
+            idx = skip_whitespace(text, idx)
+            if text[idx] != ":":
+                raise JSONDecodeError("Expecting ':' delimiter", text, idx)
+            result[key], idx = value_json_parser(text, skip_whitespace(text, idx + 1))
+            idx = skip_whitespace(text, idx)
+            char = text[idx]
+            if char == "}":
+                return result, idx + 1
+            if char != ",":
+                raise JSONDecodeError("Expecting ',' delimiter", text, idx)
+            idx = skip_whitespace(text, idx + 1)
+
+    return dict_json_parser
+
+
+def get_dataclass_json_parser(  # noqa C901
+    factory: AbstractFactory,
+    schema: Schema,
+    class_: Type,
+    json_parser_getter: Callable[[Type], JsonParser],
+    fallback: JsonParser,
+) -> JsonParser:
+    """
+    Create parser which reads JSON object and creates dataclass instance without building intermediate dict.
+
+    Fields are found by key in a precomputed mapping, values of unknown keys are decoded and dropped immediately
+    """
+    fields: Dict[str, Tuple[str, JsonParser]] = {}
+    for f in get_dataclass_fields(schema, class_):
+        pre_validators = schema.pre_validators.get(f.field_name, []) + schema.pre_validators.get(None, [])
+        post_validators = schema.post_validators.get(f.field_name, []) + schema.post_validators.get(None, [])
+        if pre_validators or post_validators:
+            # validators need decoded value, so it is parsed as usual
+            _, parser = get_field_parser(f.data_name, factory.parser(f.type), pre_validators, post_validators)
+            field_json_parser = get_fallback_json_parser(parser)
+        else:
+            field_json_parser = json_parser_getter(f.type)
+        fields[f.data_name] = (f.field_name, field_json_parser)  # type: ignore
+    forbid_unknown = schema.unknown is Unknown.FORBID
+    if schema.bypass_init and schema.unknown is not Unknown.STORE and can_bypass_init(class_):
+        create_instance = get_instance_factory(class_)
+    else:
+        create_instance = None
+
+    def dataclass_json_parser(text, idx):
+        if text[idx] != "{":
+            return fallback(text, idx)
+        kwargs = {}
+        idx = skip_whitespace(text, idx + 1)
+        if text[idx] == "}":
+            if create_instance:
+                return create_instance(kwargs), idx + 1
+            return class_(), idx + 1
+        while True:
+            if text[idx] != '"':
+                raise JSONDecodeError("Expecting property name enclosed in double quotes", text, idx)
+            key, idx = scanstring(text, idx + 1)
+            if text[idx] != ":":
+                idx = skip_whitespace(text, idx)
+                if text[idx] != ":":
+                    raise JSONDecodeError("Expecting ':' delimiter", text, idx)
+            idx = skip_whitespace(text, idx + 1)
+            field = fields.get(key)
+            if field is not None:
+                kwargs[field[0]], idx = field[1](text, idx)
+            elif forbid_unknown:
+                raise UnknownFieldsError(f"Cannot parse {class_}", {key})
+            else:
+                try:
+                    _, idx = scan_once(text, idx)
+                except StopIteration as e:
+                    raise JSONDecodeError("Expecting value", text, e.value) from None
+            idx = skip_whitespace(text, idx)
+            char = text[idx]
+            if char == "}":
+                if create_instance:
+                    return create_instance(kwargs), idx + 1
+                return class_(**kwargs), idx + 1
+            if char != ",":
+                raise JSONDecodeError("Expecting ',' delimiter", text, idx)
+            idx = skip_whitespace(text, idx + 1)
+
+    return dataclass_json_parser
+
+
+def create_json_parser(
+    factory: AbstractFactory,
+    schema: Schema,
+    class_: Type,
+    json_parser_getter: Callable[[Type], JsonParser],
+) -> JsonParser:
+    """
+    Create function which parses JSON value of `class_` directly from text.
+
+    Arrays and objects containing dataclasses are processed directly, other values
+    are decoded by `json` module and then parsed as usual
+    """
+    fallback = get_fallback_json_parser(factory.parser(class_))
+    if not is_structured(factory, class_):
+        return fallback
+    if is_optional(class_):
+        return get_optional_json_parser(json_parser_getter(class_.__args__[0]))
+    item_type = get_item_type(class_)
+    if item_type is not None and is_dict(class_):
+        return get_dict_json_parser(json_parser_getter(item_type), fallback)
+    if item_type is not None and is_structured(factory, item_type):
+        return get_collection_json_parser(get_collection_factory(class_), json_parser_getter(item_type), fallback)
+    if item_type is not None:
+        return get_decoded_items_collection_json_parser(
+            get_collection_factory(class_), factory.parser(item_type), fallback,
+        )
+    return get_dataclass_json_parser(factory, schema, class_, json_parser_getter, fallback)
+
+
+def parse_json_text(json_parser: JsonParser, text: str) -> Any:
+    """Parse whole text, which must contain exactly one JSON value"""
+    value, end = json_parser(text, skip_whitespace(text, 0))
+    end = skip_whitespace(text, end)
+    if end != len(text):
+        raise JSONDecodeError("Extra data", text, end)
+    return value
@@ -0,0 +1,214 @@
+from dataclasses import is_dataclass, MISSING
+from json.encoder import encode_basestring  # type: ignore
+from typing import Any, Callable, Sequence, Type
+
+from .codegen import CodeBuilder, compile_function, get_qualname
+from .common import AbstractFactory
+from .fields import FieldInfo, get_dataclass_fields
+from .json_stream import get_json_encoder
+from .schema import has_custom_serializing, Schema, Unknown
+from .serializers import get_default_checker
+from .type_detection import is_collection, is_dict, is_generic_concrete, is_optional
+
+JsonSerializer = Callable[[Any], str]
+
+encode = get_json_encoder()
+
+
+def get_fallback_json_serializer(factory: AbstractFactory, class_: Type) -> JsonSerializer:
+    serializer = factory.serializer(class_)
+
+    def fallback_json_serializer(data):
+        return encode(serializer(data))
+
+    return fallback_json_serializer
+
+
+def json_str(data):
+    if data.__class__ is str:
+        return encode_basestring(data)
+    return encode(data)
+
+
+def json_int(data):
+    if data.__class__ is int:
+        return int.__repr__(data)
+    return encode(data)
+
+
+def json_float(data):
+    if data.__class__ is float and data - data == 0:  # not inf or nan
+        return float.__repr__(data)
+    return encode(data)
+
+
+def json_bool(data):
+    if data is True:
+        return "true"
+    if data is False:
+        return "false"
+    return encode(data)
+
+
+LEAF_SERIALIZERS = {str: json_str, int: json_int, float: json_float, bool: json_bool}
+# expressions used in generated code instead of calling function from LEAF_SERIALIZERS
+LEAF_TEMPLATES = {
+    str: "(encode_str({0}) if {0}.__class__ is str else encode({0}))",
+    int: "(int_repr({0}) if {0}.__class__ is int else encode({0}))",
+    float: "(float_repr({0}) if {0}.__class__ is float and {0} - {0} == 0 else encode({0}))",
+    bool: '("true" if {0} is True else "false" if {0} is False else encode({0}))',
+}
+
+
+def get_optional_json_serializer(serializer: JsonSerializer) -> JsonSerializer:
+    def optional_json_serializer(data):
+        if data is None:
+            return "null"
+        return serializer(data)
+
+    return optional_json_serializer
+
+
+def is_native(factory: AbstractFactory, class_: Type) -> bool:
+    """Check if values of type are not changed by serialization and can be passed to `json` module as is"""
+    if is_optional(class_) and class_.__args__:
+        return is_native(factory, class_.__args__[0])
+    if has_custom_serializing(factory.schema(class_)):
+        return False
+    if class_ in LEAF_SERIALIZERS:
+        return True
+    if is_generic_concrete(class_) and is_dict(class_.__origin__):
+        return bool(class_.__args__) and class_.__args__[0] is str and is_native(factory, class_.__args__[1])
+    if is_generic_concrete(class_) and is_collection(class_.__origin__):
+        return len(class_.__args__) == 1 and is_native(factory, class_.__args__[0])
+    return False
+
+
+def native_collection_json_serializer(data):
+    if data.__class__ is list:
+        return encode(data)
+    return encode(list(data))
+
+
+def native_dict_json_serializer(data):
+    if data.__class__ is dict:
+        return encode(data)
+    return encode(dict(data))
+
+
+def get_collection_json_serializer(item_serializer: JsonSerializer) -> JsonSerializer:
+    def collection_json_serializer(data):
+        return "[" + ",".join(map(item_serializer, data)) + "]"
+
+    return collection_json_serializer
+
+
+def get_dict_json_serializer(value_serializer: JsonSerializer) -> JsonSerializer:
+    def dict_json_serializer(data):
+        return "{" + ",".join(
+            json_str(key) + ":" + value_serializer(value)
+            for key, value in data.items()
+        ) + "}"
+
+    return dict_json_serializer
+
+
+def get_dataclass_json_serializer(
+    factory: AbstractFactory,
+    schema: Schema,
+    class_: Type,
+    fields: Sequence[FieldInfo],
+    json_serializer_getter: Callable[[Type], JsonSerializer],
+) -> JsonSerializer:
+    """
+    Generate function which converts dataclass instance to JSON text directly.
+
+    Keys of fields are escaped in advance, values of simple types are converted inline
+    """
+    builder = CodeBuilder()
+    builder.namespace.update(
+        encode=encode, encode_str=encode_basestring, int_repr=int.__repr__, float_repr=float.__repr__,
+    )
+    builder("def json_serialize(data):")
+    with builder.indent():
+        parts = []
+        for f in fields:
+            value = builder.name("value")
+            builder(f"{value} = data.{f.field_name}")
+            can_omit = schema.omit_default and f.default is not MISSING
+            is_default = None
+            if f.type in LEAF_TEMPLATES and not has_custom_serializing(factory.schema(f.type)):
+                expr = LEAF_TEMPLATES[f.type].format(value)
+            else:
+                json_serializer = json_serializer_getter(f.type)
+                expr = f"{builder.bind('serializer', json_serializer)}({value})"
+                if can_omit:
+                    is_default = get_default_checker(json_serializer, f.default)
+            key = encode_basestring(f.data_name) + ":"  # type: ignore
+            parts.append((key, expr, value, can_omit, f.default, is_default))
+
+        if not any(can_omit for *_, can_omit, _, _ in parts):
+            items = []
+            for i, (key, expr, *_) in enumerate(parts):
+                items.append("{" + builder.bind("key", ("{" if i == 0 else ",") + key) + "}")
+                items.append("{" + expr + "}")
+            items.append("}}" if parts else "{{}}")
+            builder(f"return f'{''.join(items)}'")
+        else:
+            builder("parts = []")
+            for key, expr, value, can_omit, default, is_default in parts:
+                key_name = builder.bind("key", key)
+                if can_omit:
+                    default_name = builder.bind("default", default)
+                    builder(f"if {value} is not {default_name} and {value} != {default_name}:")
+                    with builder.indent():
+                        if is_default:
+                            # value can differ from default, but have the same JSON representation
+                            text = builder.name("text")
+                            builder(f"{text} = {expr}")
+                            builder(f"if not {builder.bind('is_default', is_default)}({text}):")
+                            with builder.indent():
+                                builder(f"parts.append({key_name} + {text})")
+                        else:
+                            builder(f"parts.append({key_name} + {expr})")
+                else:
+                    builder(f"parts.append({key_name} + {expr})")
+            builder('return "{" + ",".join(parts) + "}"')
+    return compile_function(builder, "json_serialize", f"json serializer {get_qualname(class_)}")
+
+
+def create_json_serializer(  # noqa C901
+    factory: AbstractFactory,
+    schema: Schema,
+    class_: Type,
+    json_serializer_getter: Callable[[Type], JsonSerializer],
+) -> JsonSerializer:
+    """
+    Create function which converts data of `class_` to JSON text.
+
+    Types which are not supported directly are serialized as usual and then encoded by `json` module
+    """
+    if has_custom_serializing(schema):
+        return get_fallback_json_serializer(factory, class_)
+    if class_ in LEAF_SERIALIZERS:
+        return LEAF_SERIALIZERS[class_]
+    if is_optional(class_) and class_.__args__:
+        return get_optional_json_serializer(json_serializer_getter(class_.__args__[0]))
+    if is_dataclass(class_) or (is_generic_concrete(class_) and is_dataclass(class_.__origin__)):
+        fields = get_dataclass_fields(schema, class_)
+        # flattening, lists and storing unknown fields are not supported
+        if not isinstance(schema.unknown, Unknown) or not all(isinstance(f.data_name, str) for f in fields):
+            return get_fallback_json_serializer(factory, class_)
+        return get_dataclass_json_serializer(factory, schema, class_, fields, json_serializer_getter)
+    if is_generic_concrete(class_) and is_dict(class_.__origin__):
+        if is_native(factory, class_):
+            return native_dict_json_serializer
+        if class_.__args__ and class_.__args__[0] is str:
+            return get_dict_json_serializer(json_serializer_getter(class_.__args__[1]))
+        return get_fallback_json_serializer(factory, class_)
+    if is_generic_concrete(class_) and is_collection(class_.__origin__):
+        if is_native(factory, class_):
+            return native_collection_json_serializer
+        if len(class_.__args__) == 1:
+            return get_collection_json_serializer(json_serializer_getter(class_.__args__[0]))
+    return get_fallback_json_serializer(factory, class_)
@@ -0,0 +1,213 @@
+import codecs
+import json
+import re
+from json.encoder import c_make_encoder, encode_basestring, encode_basestring_ascii  # type: ignore
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, List, Optional, Sequence, TextIO, Union
+
+from .common import WHITESPACE
+from .path_utils import CleanKey
+
+NUMBER_CHARS = re.compile(r"[0-9eE.+\-]*")
+# the longest token which can be cut at the end of buffer: literal `-Infinity`
+MAX_TOKEN_LENGTH = 9
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class JsonReader:
+    """
+    Reads JSON values one by one from a file, keeping only a small part of it in memory.
+
+    File can be opened in binary mode (utf-8 is expected) or in text mode.
+    """
+
+    def __init__(self, file: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.utf8_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, size: int) -> bool:
+        """Read next chunk of file dropping already processed data. Returns False at the end of file"""
+        if self.eof:
+            return False
+        chunk = self.file.read(size)
+        if isinstance(chunk, bytes):
+            text = self.utf8_decoder.decode(chunk, final=not chunk)
+        else:
+            text = chunk
+        if not chunk:
+            self.eof = True
+        self.buffer = self.buffer[self.pos:] + text
+        self.pos = 0
+        return bool(chunk)
+
+    def peek(self) -> str:
+        """Skip whitespaces and return next char without consuming it. Returns empty string at the end of file"""
+        while True:
+            self.pos = WHITESPACE.match(self.buffer, self.pos).end()  # type: ignore
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill(self.chunk_size):
+                return ""
+
+    def expect(self, chars: str) -> str:
+        """Consume next char which must be one of `chars`"""
+        char = self.peek()
+        if not char or char not in chars:
+            raise json.JSONDecodeError(f"Expecting one of {chars!r}", self.buffer, self.pos)
+        self.pos += 1
+        return char
+
+    def read_value(self) -> Any:
+        """Decode next JSON value"""
+        self.peek()
+        size = self.chunk_size
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                # value is not read completely yet, other errors are raised without reading the rest of file
+                if not self.is_cut(e) or not self.fill(size):
+                    raise
+            else:
+                # numbers can be cut at the end of buffer, so they must be followed by other chars
+                if NUMBER_CHARS.match(self.buffer, end).end() < len(self.buffer) or not self.fill(size):  # type: ignore
+                    self.pos = end
+                    return value
+            size *= 2  # read more each time not to decode the same part of a large value again and again
+
+    def is_cut(self, error: json.JSONDecodeError) -> bool:
+        """Check if decoding error can be caused by the end of buffer. Unterminated string is reported at its start"""
+        return error.pos > len(self.buffer) - MAX_TOKEN_LENGTH or error.msg.startswith("Unterminated string")
+
+    def find(self, path: Sequence[CleanKey]) -> None:
+        """Skip data until value at `path` is found. Skipped values are decoded one by one"""
+        for key in path:
+            if isinstance(key, int):
+                self.find_index(key)
+            else:
+                self.find_key(key)
+
+    def find_index(self, index: int) -> None:
+        self.expect("[")
+        for _ in range(index):
+            if self.peek() == "]":
+                raise LookupError(f"Index {index} not found in JSON array")
+            self.read_value()
+            if self.expect(",]") == "]":
+                raise LookupError(f"Index {index} not found in JSON array")
+        if self.peek() == "]":
+            raise LookupError(f"Index {index} not found in JSON array")
+
+    def find_key(self, key: str) -> None:
+        self.expect("{")
+        if self.peek() == "}":
+            raise LookupError(f"Key {key!r} not found in JSON object")
+        while True:
+            current_key = self.read_value()
+            self.expect(":")
+            if current_key == key:
+                return
+            self.read_value()
+            if self.expect(",}") == "}":
+                raise LookupError(f"Key {key!r} not found in JSON object")
+
+    def iter_array(self) -> Iterator[Any]:
+        """Decode elements of JSON array one by one"""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.read_value()
+            if self.expect(",]") == "]":
+                return
+
+
+def iter_json_array(
+    file: BinaryIO, path: Sequence[CleanKey] = (), chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Any]:
+    """
+    Decode elements of JSON array from a file one by one.
+
+    `path` contains keys and indexes to find array inside of top-level value. By default top-level value is used
+    """
+    reader = JsonReader(file, chunk_size)
+    reader.find(path)
+    return reader.iter_array()
+
+
+def get_json_encoder(ensure_ascii: bool = False) -> Callable[[Any], str]:
+    """
+    Return function converting object to compact JSON text.
+
+    Unlike `json.dumps` it creates underlying C encoder only once, if it is available
+    """
+    encoder = json.JSONEncoder(ensure_ascii=ensure_ascii, separators=(",", ":"), check_circular=False)
+    if c_make_encoder is None:
+        return encoder.encode
+    c_encoder = c_make_encoder(
+        None,  # markers are used only to check circular references
+        encoder.default,
+        encode_basestring_ascii if ensure_ascii else encode_basestring,
+        None,  # indent
+        encoder.key_separator,
+        encoder.item_separator,
+        False,  # sort_keys
+        False,  # skipkeys
+        True,  # allow_nan
+    )
+
+    def encode(obj: Any) -> str:
+        return "".join(c_encoder(obj, 0))
+
+    return encode
+
+
+def write_json_lines(
+    file: Union[BinaryIO, TextIO],
+    items: Iterable[Any],
+    to_json: Callable[[Any], str],
+    buffer_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """
+    Write items to a file in JSON Lines format (one JSON value per line). `to_json` converts item to JSON text.
+
+    Lines are collected until their total length exceeds `buffer_size` and then written at once.
+    Binary files get utf-8 encoded data. Returns number of written items
+    """
+    # file mode is detected on first write: binary files do not accept str
+    binary: Optional[bool] = None
+    lines: List[str] = []
+
+    def flush():
+        nonlocal binary
+        lines.append("")  # for new line after the last item
+        text = "\n".join(lines)
+        if binary is None:
+            try:
+                file.write(text)  # type: ignore
+                binary = False
+            except TypeError:
+                file.write(text.encode())  # type: ignore
+                binary = True
+        else:
+            file.write(text.encode() if binary else text)  # type: ignore
+        lines.clear()
+
+    size = 0
+    count = 0
+    for item in items:
+        line = to_json(item)
+        lines.append(line)
+        size += len(line)
+        count += 1
+        if size >= buffer_size:
+            flush()
+            size = 0
+    if lines:
+        flush()
+    return count
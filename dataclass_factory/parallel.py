@@ -0,0 +1,71 @@
+import pickle  # noqa S403
+from concurrent.futures import Executor
+from functools import lru_cache
+from itertools import count, islice, repeat
+from typing import Any, Iterable, Iterator, List, Type
+
+from .common import AbstractFactory
+from .exceptions import InvalidFieldError
+
+DEFAULT_PARALLEL_CHUNK_SIZE = 10000
+
+
+@lru_cache(maxsize=16)
+def get_worker_factory(config: bytes) -> Any:
+    """Restore pickled factory. It is done once per worker process, so converters are not built again for each chunk"""
+    return pickle.loads(config)  # noqa S301
+
+
+def parse_chunk(config: bytes, class_: Type, chunk: List[Any], from_json: bool, offset: int) -> List[Any]:
+    """
+    Parse items of one chunk in worker.
+
+    `offset` is index of the first item in whole input, it is used in error path instead of index inside chunk
+    """
+    factory = get_worker_factory(config)
+    if from_json:
+        result = []
+        for index, item in enumerate(chunk, offset):
+            try:
+                result.append(factory.load_json(item, class_))
+            except InvalidFieldError as e:
+                e._append_path(str(index))
+                raise
+        return result
+    try:
+        return factory.load_many(chunk, class_)
+    except InvalidFieldError as e:
+        e.field_path[-1] = str(int(e.field_path[-1]) + offset)
+        raise
+
+
+def iter_chunks(data: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    iterator = iter(data)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def parse_parallel(
+    factory: AbstractFactory,
+    data: Iterable[Any],
+    class_: Type,
+    executor: Executor,
+    chunk_size: int,
+    from_json: bool,
+) -> List[Any]:
+    """
+    Parse items in chunks using executor (usually `ProcessPoolExecutor`). Results are returned in original order.
+
+    Factory configuration is pickled once and sent with each chunk, workers restore it only on first use.
+    Items and results are pickled to be passed between processes
+    """
+    config = pickle.dumps(factory)
+    result: List[Any] = []
+    chunks = iter_chunks(data, chunk_size)
+    offsets = count(0, chunk_size)
+    for parsed in executor.map(parse_chunk, repeat(config), repeat(class_), chunks, repeat(from_json), offsets):
+        result.extend(parsed)
+    return result
@@ -1,14 +1,19 @@
 import decimal
 from collections import deque
-from dataclasses import is_dataclass
+from dataclasses import Field, fields as dataclass_fields_of, is_dataclass, MISSING
 from typing import (
     Any, Callable, Collection, Deque, Dict, FrozenSet,
     List, Optional, Sequence, Set, Tuple, Type, Union,
 )
 
+from .codegen import CodeBuilder, compile_function, get_lazy_reference, get_qualname
 from .common import AbstractFactory, Parser, T
 from .exceptions import InvalidFieldError, UnionParseError, UnknownFieldsError
-from .fields import FieldInfo, get_class_fields, get_dataclass_fields, get_typeddict_fields
+from .fields import (
+    FieldInfo, get_class_fields, get_dataclass_fields, get_discriminator_mapping, get_typeddict_fields,
+    has_dataclass_init,
+)
+from .init_bypass import can_bypass_init, gen_instance, get_instance_factory
 from .path_utils import CleanKey, CleanPath
 from .schema import RuleForUnknown, Schema, Unknown
 from .type_detection import (
@@ -21,6 +26,8 @@ from .validators import combine_parser_validators
 PARSER_EXCEPTIONS = (ValueError, TypeError, AttributeError, LookupError)
 MISSED = object()  # field is missed in parsed data
 
+TypeChecker = Callable[[Type], bool]
+
 
 def get_element_parser(parser: Parser[T], key: Any) -> Parser[T]:
     def element_parser(data: Any) -> T:
@@ -45,6 +52,27 @@ def dyn_element_parser(parser: Parser[T], data: Any, key: Any) -> T:
         raise InvalidFieldError(str(e), [str(key)])
 
 
+def get_lazy_debug_parser(parser: Parser[T], get_debug_parser: Callable[[], Parser[T]]) -> Parser[T]:
+    """
+    Create parser which runs fast `parser` and, if it fails, parses the same data again using debug parser.
+
+    So the raised error contains path to invalid field, while valid data is parsed without overhead
+    """
+
+    def lazy_debug_parser(data):
+        try:
+            return parser(data)
+        except PARSER_EXCEPTIONS as e:
+            error = e
+        try:
+            get_debug_parser()(data)
+        except PARSER_EXCEPTIONS as e:
+            raise e from None
+        raise error  # debug parser has not failed, e.g. data was changed during the first attempt
+
+    return lazy_debug_parser
+
+
 def parse_stub(data: T) -> T:
     return data
 
@@ -81,20 +109,110 @@ def get_collection_parser(
     return collection_parser
 
 
-def get_union_parser(parsers: Collection[Callable]) -> Parser:
+def get_union_parser(
+    parsers: Collection[Callable],
+    type_checkers: Optional[Sequence[Optional[TypeChecker]]] = None,
+) -> Parser:
+    """
+    Create parser trying parsers of union members one by one.
+
+    If `type_checkers` are provided, only parsers which can accept type of data are called.
+    Suitable parsers are selected once per each type of data
+    """
+    if type_checkers is None:
+        type_checkers = [None] * len(parsers)
+    checked_parsers = tuple(zip(parsers, type_checkers))
+    parsers_by_type: Dict[Type, Tuple[Callable, ...]] = {}
+
     def union_parser(data):
+        data_type = type(data)
+        try:
+            suitable_parsers = parsers_by_type[data_type]
+        except KeyError:
+            suitable_parsers = parsers_by_type[data_type] = tuple(
+                p for p, checker in checked_parsers
+                if checker is None or checker(data_type)
+            )
         errors = []
-        for p in parsers:
+        for p in suitable_parsers:
             try:
                 return p(data)
             except PARSER_EXCEPTIONS as e:
                 errors.append((p.__qualname__, e))
                 continue
-        raise UnionParseError("No suitable parsers in union found for `%s`" % data, errors)
+        raise UnionParseError("No suitable parsers in union found for `%s`" % (data,), errors)
 
     return union_parser
 
 
+def has_any_attr(class_: Type, *names: str) -> bool:
+    return any(hasattr(class_, name) for name in names)
+
+
+def get_type_checker(schema: Schema, cls: Type) -> Optional[TypeChecker]:  # noqa C901, CCR001
+    """
+    Get function checking if default parser of `cls` can accept data of provided type.
+
+    It is used to skip parsers of union members which will definitely fail.
+    Returns None if it cannot be predicted
+    """
+    if schema.parser or schema.get_parser or schema.pre_parse:
+        return None
+    if is_newtype(cls):
+        return get_type_checker(schema, cls.__supertype__)
+    if is_literal(cls) or is_literal36(cls):
+        values = cls.__args__ if is_literal(cls) else cls.__values__
+        value_types = {type(v) for v in values}
+        return lambda data_type: data_type in value_types
+    if is_none(cls) or cls in (str, bytearray, bytes):
+        return lambda data_type: issubclass(data_type, cls)
+    if cls is int:
+        return lambda data_type: (
+            has_any_attr(data_type, "__int__", "__index__", "__trunc__") or
+            issubclass(data_type, (str, bytes, bytearray))
+        )
+    if cls is float:
+        return lambda data_type: (
+            has_any_attr(data_type, "__float__", "__index__") or
+            issubclass(data_type, (str, bytes, bytearray))
+        )
+    if cls is complex:
+        return lambda data_type: (
+            has_any_attr(data_type, "__complex__", "__float__", "__index__") or
+            issubclass(data_type, str)
+        )
+    if is_dict(cls):
+        return lambda data_type: hasattr(data_type, "items")
+    if is_enum(cls):
+        return None
+    if is_tuple(cls) or (is_collection(cls) and not is_typeddict(cls)):
+        return lambda data_type: hasattr(data_type, "__iter__")
+    if (
+        is_dataclass(cls) or is_typeddict(cls) or
+        (is_generic_concrete(cls) and (is_dataclass(cls.__origin__) or is_typeddict(cls.__origin__)))
+    ):
+        # complex parser checks fields using `in` and gets them by key or index
+        return lambda data_type: has_any_attr(data_type, "__contains__", "__iter__", "__getitem__")
+    return None
+
+
+def get_discriminated_union_parser(
+    discriminator: str,
+    parsers: Dict[Any, Parser],
+    fallback_parser: Optional[Parser],
+) -> Parser:
+    def discriminated_union_parser(data):
+        try:
+            parser = parsers[data[discriminator]]
+        except (KeyError, TypeError):
+            if fallback_parser is None:
+                raise UnionParseError(f"Cannot select union member using `{discriminator}` for `{data}`", [])
+            return fallback_parser(data)
+        return parser(data)
+
+    return discriminated_union_parser
+
+
 tuple_any_parser = tuple
 
 
@@ -126,6 +244,81 @@ def get_path_parser(parser: Parser[T], path: CleanPath) -> Parser[T]:
     return path_parser
 
 
+PathTreeWalker = Callable[[Any, Dict[str, Any]], None]
+
+
+class ContainerError:
+    """Stored instead of field value if container on its path has unexpected type."""
+    __slots__ = ("error",)
+
+    def __init__(self, error: Exception):
+        self.error = error
+
+
+def get_path_tree_walker(fields: Sequence[Tuple[str, CleanPath]]) -> PathTreeWalker:  # noqa C901
+    """
+    Create function which finds values of fields at given paths inside of data and stores them to dict.
+
+    Paths with common prefix are merged into tree, so each nested container is visited once.
+    If container is missing, fields inside it are skipped (default values are used),
+    if it is None, None is stored for all fields inside it, like `get_path_parser` does.
+    Values are not parsed here, so errors are raised in order of fields:
+    error of accessing container is stored as `ContainerError` and raised when its field is parsed
+    """
+    groups: Dict[CleanKey, List[Tuple[str, CleanPath]]] = {}
+    steps: List[Tuple[Optional[CleanKey], Any, Optional[PathTreeWalker]]] = []
+    for field_name, path in fields:
+        if not path:
+            steps.append((None, field_name, None))  # field is container itself
+        elif path[0] not in groups:
+            groups[path[0]] = [(field_name, path[1:])]
+            steps.append((path[0], field_name, None))
+        else:
+            groups[path[0]].append((field_name, path[1:]))
+    for i, (key, field_name, _) in enumerate(steps):
+        if key is None:
+            continue
+        group = groups[key]
+        if len(group) != 1 or group[0][1]:
+            steps[i] = (key, tuple(name for name, _ in group), get_path_tree_walker(group))
+    steps_info = tuple(steps)
+    all_names = tuple(field_name for field_name, _ in fields)
+
+    def path_tree_walker(data, result):
+        if data is None:
+            for field_name in all_names:
+                result[field_name] = None
+            return
+        for key, names, walker in steps_info:
+            if key is None:
+                result[names] = data
+                continue
+            try:
+                value = data[key]
+            except (KeyError, IndexError):
+                continue
+            except PARSER_EXCEPTIONS as e:  # container has unexpected type
+                if walker is None:
+                    result[names] = ContainerError(e)
+                else:
+                    for field_name in names:
+                        result[field_name] = ContainerError(e)
+                continue
+            if walker is None:
+                result[names] = value
+            else:
+                walker(value, result)
+
+    return path_tree_walker
+
+
+def split_path(item: Union[CleanKey, CleanPath]) -> Tuple[CleanKey, CleanPath]:
+    """Split field data name into key in parsed dict and path inside its value."""
+    if isinstance(item, tuple):
+        return item[0], item[1:]
+    return item, ()
+
+
 def get_field_parser(
     item: Union[CleanKey, CleanPath],
     parser: Parser[T],
@@ -148,7 +341,13 @@ def get_complex_parser(class_: Type[T],  # noqa C901, CCR001
                        unknown: RuleForUnknown,
                        pre_validators: Dict[Optional[str], List[Parser]],
                        post_validators: Dict[Optional[str], List[Parser]],
+                       bypass_init: bool = False,
                        ) -> Parser[T]:
+    # instance is created without calling `__init__`, so unknown fields cannot be passed to it
+    if bypass_init and unknown is not Unknown.STORE and can_bypass_init(class_):
+        create_instance: Optional[Callable[[Dict[str, Any]], T]] = get_instance_factory(class_)
+    else:
+        create_instance = None
     field_info = tuple(
         (
             f.field_name,
@@ -174,15 +373,18 @@ def get_complex_parser(class_: Type[T],  # noqa C901, CCR001
 
         def complex_parser(data):
             count = len(data)
-            return class_(**{
+            fields = {
                 field_name: parser(data[item_idx])
                 for field_name, item_idx, parser in field_info
                 if item_idx < count
-            })
+            }
+            if create_instance:
+                return create_instance(fields)
+            return class_(**fields)
     else:
         forbid_unknown = False
-        store_unknown_separate = False
         store_unknown = False
+        extras_names: Sequence[str] = ()
         if unknown is Unknown.FORBID:
             forbid_unknown = True
         elif unknown is Unknown.STORE:
@@ -190,41 +392,372 @@ def get_complex_parser(class_: Type[T],  # noqa C901, CCR001
         elif unknown is Unknown.SKIP:
             pass
         elif isinstance(unknown, str):
-            store_unknown_separate = True
-            unknown = [unknown]
+            extras_names = (unknown,)
         else:  # sequence of string
-            store_unknown_separate = True
+            extras_names = tuple(unknown)  # type: ignore
 
         known_fields = {f.data_name for f in fields}
+        # fields filled with unknown data, it is passed to them without changing input dict
+        extras_fields = tuple(
+            (field_name, parser)
+            for field_name, item_name, parser in field_info
+            if item_name in extras_names
+        )
+        extras_keys = tuple(item_name for _, item_name, _ in field_info if item_name in extras_names)
+        if extras_fields:
+            field_info = tuple(info for info in field_info if info[1] not in extras_names)
+        collect_unknown = store_unknown or bool(extras_fields)
+        # unknown fields are collected only if some keys of data are not used by fields. Without flattening each
+        # found key adds one parsed field, so they are counted using size of result. Otherwise they are always collected
+        names = [f.data_name for f in fields]
+        count_keys = all(isinstance(name, str) for name in names) and len(set(names)) == len(names)
+
+        # fields inside of nested containers are found using common tree for each key
+        path_groups: Dict[CleanKey, List[Tuple[str, CleanPath]]] = {}
+        for f in fields:
+            key, path = split_path(f.data_name)
+            if path and key not in extras_names:
+                path_groups[key] = []
+        for f in fields:
+            key, path = split_path(f.data_name)
+            if key in path_groups:
+                path_groups[key].append((f.field_name, path))
+        # fields are parsed in order of declaration, each tree is walked at place of its first field
+        field_parsers = {field_name: (item_name, parser) for field_name, item_name, parser in field_info}
+        steps: List[Tuple[CleanKey, str, Parser, Optional[PathTreeWalker], bool]] = []
+        for f in fields:
+            key, path = split_path(f.data_name)
+            if key in path_groups:
+                group = path_groups[key]
+                parser = combine_parser_validators(
+                    pre_validators.get(f.field_name, []) + pre_validators.get(None, []),
+                    factory.parser(f.type),
+                    post_validators.get(f.field_name, []) + post_validators.get(None, []),
+                )
+                if debug_path:
+                    parser = get_element_parser(parser, f.field_name)
+                walker = get_path_tree_walker(group) if group[0][0] == f.field_name else None
+                steps.append((key, f.field_name, parser, walker, True))
+            elif f.field_name in field_parsers:
+                item_name, parser = field_parsers[f.field_name]
+                steps.append((item_name, f.field_name, parser, None, False))
+        steps_info = tuple(steps)
 
         def complex_parser(data):
             if forbid_unknown and not known_fields.issuperset(data):
                 unknown_field_names = set(data) - known_fields
                 raise UnknownFieldsError(f"Cannot parse {class_}", unknown_field_names)
-            elif store_unknown_separate:
-                extras = {k: v for k, v in data.items() if k not in known_fields}
-                for field in unknown:
-                    data[field] = extras
-                unknown_fields = {}
-            elif store_unknown:
-                unknown_fields = {k: v for k, v in data.items() if k not in known_fields}
-            else:
-                unknown_fields = {}
 
             fields = {}
-            for field_name, item_name, parser in field_info:
+            found = {}
+            for item_name, field_name, parser, walker, in_tree in steps_info:
+                if in_tree:
+                    if walker is not None and item_name in data:
+                        walker(data[item_name], found)
+                    if field_name in found:
+                        value = found[field_name]
+                        if value.__class__ is ContainerError:
+                            if debug_path:
+                                raise InvalidFieldError(str(value.error), [field_name])
+                            raise value.error
+                        fields[field_name] = parser(value)
+                    continue
                 if item_name in data:
                     result = parser(data[item_name])
                     if result is not MISSED:
                         fields[field_name] = result
-            return class_(
-                **fields,
-                **unknown_fields,
-            )
+            if collect_unknown:
+                matched = len(fields)
+                if count_keys:
+                    for item_name in extras_keys:
+                        if item_name in data:
+                            matched += 1
+                if count_keys and matched == len(data):
+                    unknown_fields = {}
+                else:
+                    unknown_fields = {k: v for k, v in data.items() if k not in known_fields}
+                for field_name, parser in extras_fields:
+                    result = parser(unknown_fields)
+                    if result is not MISSED:
+                        fields[field_name] = result
+            if create_instance:
+                return create_instance(fields)
+            if store_unknown:
+                return class_(**fields, **unknown_fields)
+            return class_(**fields)
 
     return complex_parser
 
 
+def gen_field_default(builder: CodeBuilder, field: Optional[Field], target: str) -> None:
+    """
+    Generate filling of missing field with its default.
+
+    If default is not known (required field or custom `__init__`), field is marked as missed
+    and left out of constructor call, so constructor reports it after all fields are parsed
+    """
+    if field is not None and field.default is not MISSING:
+        builder(f"{target} = {builder.bind('default', field.default)}")
+    elif field is not None and field.default_factory is not MISSING:  # type: ignore
+        builder(f"{target} = {builder.bind('default_factory', field.default_factory)}()")  # type: ignore
+    else:
+        builder(f"{target} = MISSED")
+        builder("missed = True")
+
+
+def gen_path_steps(builder: CodeBuilder, path: CleanPath, target: str) -> None:
+    builder(f"{target} = {target}[{path[0]!r}]")
+    if len(path) > 1:
+        builder(f"if {target} is not None:")
+        with builder.indent():
+            gen_path_steps(builder, path[1:], target)
+
+
+def gen_path_walk(builder: CodeBuilder, path: CleanPath, target: str) -> None:
+    """Unrolled version of `get_path_parser` without calling parser."""
+    builder(f"if {target} is not None:")
+    with builder.indent():
+        builder("try:")
+        with builder.indent():
+            gen_path_steps(builder, path, target)
+        builder("except (KeyError, IndexError):")
+        with builder.indent():
+            builder(f"{target} = MISSED")
+
+
+def gen_path_tree(builder: CodeBuilder, fields: Sequence[Tuple[str, CleanPath, str]], source: str) -> None:  # noqa C901
+    """
+    Unrolled version of `get_path_tree_walker`.
+
+    Found value, None, MISSED or `ContainerError` is stored to target variable of each field
+    """
+    groups: Dict[CleanKey, List[Tuple[str, CleanPath, str]]] = {}
+    for field_name, path, target in fields:
+        if path:
+            groups.setdefault(path[0], []).append((field_name, path[1:], target))
+        else:
+            builder(f"{target} = {source}")
+    if not groups:
+        return
+    builder(f"if {source} is None:")
+    with builder.indent():
+        for field_name, path, target in fields:
+            if path:
+                builder(f"{target} = None")
+    builder("else:")
+    with builder.indent():
+        for key, group in groups.items():
+            if len(group) == 1 and not group[0][1]:
+                node = group[0][2]  # value is stored directly to field
+            else:
+                node = builder.name("node")
+            builder("try:")
+            with builder.indent():
+                builder(f"{node} = {source}[{key!r}]")
+            builder("except (KeyError, IndexError):")
+            with builder.indent():
+                for *_, target in group:
+                    builder(f"{target} = MISSED")
+            builder("except PARSER_EXCEPTIONS as e:")  # container has unexpected type
+            with builder.indent():
+                for *_, target in group:
+                    builder(f"{target} = ContainerError(e)")
+            if node != group[0][2]:
+                builder("else:")
+                with builder.indent():
+                    gen_path_tree(builder, group, node)
+
+
+def gen_field_parsing(
+    builder: CodeBuilder,
+    field_name: str,
+    path: CleanPath,
+    target: str,
+    parsers: Sequence[Parser],
+    debug_path: bool,
+    in_tree: bool = False,
+) -> None:
+    if debug_path:
+        builder("try:")
+    with builder.indent(debug_path):
+        if in_tree:
+            builder(f"if {target}.__class__ is ContainerError:")
+            with builder.indent():
+                builder(f"raise {target}.error")
+        if path:
+            gen_path_walk(builder, path, target)
+            builder(f"if {target} is not MISSED:")
+        with builder.indent(bool(path)):
+            for parser in parsers:
+                builder(f"{target} = {builder.bind('parser', parser)}({target})")
+    if debug_path:
+        builder("except InvalidFieldError as e:")
+        with builder.indent():
+            builder(f"e._append_path({field_name!r})")
+            builder("raise")
+        builder("except PARSER_EXCEPTIONS as e:")
+        with builder.indent():
+            builder(f"raise InvalidFieldError(str(e), [{field_name!r}])")
+
+
+def get_compiled_complex_parser(class_: Type[T],  # noqa C901, CCR001
+                                factory: AbstractFactory,
+                                fields: Sequence[FieldInfo],
+                                debug_path: bool,
+                                unknown: Union[str, Sequence[str], RuleForUnknown],
+                                pre_validators: Dict[Optional[str], List[Parser]],
+                                post_validators: Dict[Optional[str], List[Parser]],
+                                bypass_init: bool = False,
+                                ) -> Parser[T]:
+    """
+    Generate parser with one unrolled block per field and direct constructor call.
+
+    Unknown fields are collected only if some keys of data are not used by fields,
+    which is detected by counting found keys. Input data is never changed.
+    With `bypass_init` values are stored to the allocated instance instead of calling constructor.
+    Falls back to `get_complex_parser` if the shape of class is not supported
+    """
+    items = [split_path(f.data_name) for f in fields]
+    list_mode = any(isinstance(key, int) for key, _ in items)
+    if list_mode:
+        return get_complex_parser(
+            class_, factory, fields, debug_path, unknown, pre_validators, post_validators, bypass_init,
+        )
+    if unknown is None or isinstance(unknown, Unknown):
+        extras_names: Sequence[str] = ()
+    elif isinstance(unknown, str):
+        extras_names = (unknown,)
+    else:
+        extras_names = tuple(unknown)
+    collect_unknown = unknown is Unknown.STORE or bool(extras_names)
+    # with flattening top level keys of fields are not in `known_fields`, so they are always collected
+    names = [f.data_name for f in fields]
+    count_keys = collect_unknown and all(isinstance(name, str) for name in names) and len(set(names)) == len(names)
+
+    # defaults are filled inline only if they are used by `__init__`
+    field_defaults: Dict[str, Field] = {}
+    if has_dataclass_init(class_):
+        origin = class_.__origin__ if is_generic_concrete(class_) else class_  # type: ignore
+        field_defaults = {
+            f.name: f for f in dataclass_fields_of(origin)  # type: ignore
+            if f.default is not MISSING or f.default_factory is not MISSING  # type: ignore
+        }
+    may_miss = any(f.field_name not in field_defaults for f in fields)
+
+    builder = CodeBuilder()
+    builder.namespace.update(
+        MISSED=MISSED,
+        PARSER_EXCEPTIONS=PARSER_EXCEPTIONS,
+        InvalidFieldError=InvalidFieldError,
+        ContainerError=ContainerError,
+        UnknownFieldsError=UnknownFieldsError,
+        class_=class_,
+        known_fields={f.data_name for f in fields},
+    )
+    builder("def complex_parser(data):")
+    with builder.indent():
+        if unknown is Unknown.FORBID:
+            builder("if not known_fields.issuperset(data):")
+            with builder.indent():
+                builder("unknown_field_names = set(data) - known_fields")
+                message = builder.bind("message", f"Cannot parse {class_}")
+                builder(f"raise UnknownFieldsError({message}, unknown_field_names)")
+        if count_keys:
+            builder("found = 0")
+        if may_miss:
+            builder("missed = False")
+
+        arguments = []
+        extras_fields = []
+        targets = [builder.name("value") for _ in fields]
+        # fields inside of nested containers are found using common tree for each key
+        path_groups: Dict[CleanKey, List[Tuple[FieldInfo, CleanPath, str]]] = {}
+        for f, (key, path), target in zip(fields, items, targets):
+            if path and key not in extras_names:
+                path_groups[key] = []
+        for f, (key, path), target in zip(fields, items, targets):
+            if key in path_groups:
+                path_groups[key].append((f, path, target))
+
+        for f, (key, path), target in zip(fields, items, targets):
+            parsers = [
+                *pre_validators.get(f.field_name, []), *pre_validators.get(None, []),
+                factory.parser(f.type),
+                *post_validators.get(f.field_name, []), *post_validators.get(None, []),
+            ]
+            arguments.append(f"{f.field_name}={target}")
+            if key in path_groups:
+                group = path_groups[key]
+                if group[0][0] is f:  # values of all fields in group are found together
+                    builder(f"if {key!r} in data:")
+                    with builder.indent():
+                        node = builder.name("node")
+                        builder(f"{node} = data[{key!r}]")
+                        gen_path_tree(builder, [(g.field_name, p, t) for g, p, t in group], node)
+                    builder("else:")
+                    with builder.indent():
+                        for *_, group_target in group:
+                            builder(f"{group_target} = MISSED")
+                builder(f"if {target} is not MISSED:")
+                with builder.indent():
+                    gen_field_parsing(builder, f.field_name, (), target, parsers, debug_path, in_tree=True)
+                builder("else:")
+                with builder.indent():
+                    gen_field_default(builder, field_defaults.get(f.field_name), target)
+                continue
+            if key in extras_names:
+                # parsed after all other fields, when unknown fields are collected
+                extras_fields.append((f, path, target, parsers))
+                if count_keys:
+                    builder(f"if {key!r} in data:")
+                    with builder.indent():
+                        builder("found += 1")
+                continue
+            builder(f"if {key!r} in data:")
+            with builder.indent():
+                if count_keys:
+                    builder("found += 1")
+                builder(f"{target} = data[{key!r}]")
+                gen_field_parsing(builder, f.field_name, path, target, parsers, debug_path)
+            builder("else:")
+            with builder.indent():
+                gen_field_default(builder, field_defaults.get(f.field_name), target)
+
+        if count_keys:
+            builder("if found == len(data):")
+            with builder.indent():
+                builder("unknown_fields = {}")
+            builder("else:")
+        if collect_unknown:
+            with builder.indent(count_keys):
+                builder("unknown_fields = {k: v for k, v in data.items() if k not in known_fields}")
+        for f, path, target, parsers in extras_fields:
+            builder(f"{target} = unknown_fields")
+            gen_field_parsing(builder, f.field_name, path, target, parsers, debug_path)
+            if path:
+                builder(f"if {target} is MISSED:")
+                with builder.indent():
+                    gen_field_default(builder, field_defaults.get(f.field_name), target)
+
+        if may_miss:
+            builder("if missed:")
+            with builder.indent():
+                values = ", ".join(f"({f.field_name!r}, {target})" for f, target in zip(fields, targets))
+                builder(f"arguments = {{name: value for name, value in ({values},) if value is not MISSED}}")
+                if unknown is Unknown.STORE:
+                    builder("return class_(**arguments, **unknown_fields)")
+                else:
+                    builder("return class_(**arguments)")
+        if bypass_init and unknown is not Unknown.STORE and can_bypass_init(class_):
+            gen_instance(builder, class_, [(f.field_name, target) for f, target in zip(fields, targets)], "instance")
+            builder("return instance")
+        else:
+            if unknown is Unknown.STORE:
+                arguments.append("**unknown_fields")
+            builder(f"return class_({', '.join(arguments)})")
+    return compile_function(builder, "complex_parser", f"parser {get_qualname(class_)}")
+
+
 def get_typed_dict_parser(
     class_: Type,
     factory: AbstractFactory,
@@ -297,15 +830,37 @@ def get_literal_parser(factory, values: Sequence[Any]) -> Parser:
     return literal_parser
 
 
-def get_lazy_parser(factory, class_: Type) -> Parser:
-    def lazy_parser(data):
-        return factory.load(data, class_)
+def get_union_with_discriminator_parser(
+    discriminator: str,
+    discriminator_mapping: Optional[Dict[Any, Type]],
+    members: Sequence[Type],
+    parsers: Sequence[Parser],
+) -> Parser:
+    mapping = get_discriminator_mapping(discriminator, discriminator_mapping, members)
+    member_parsers = dict(zip(members, parsers))
+    untagged_parsers = tuple(
+        parser for member, parser in member_parsers.items()
+        if member not in mapping.values()
+    )
+    if not untagged_parsers:
+        fallback_parser = None
+    elif len(untagged_parsers) == 1:
+        fallback_parser = untagged_parsers[0]
+    else:
+        fallback_parser = get_union_parser(untagged_parsers)
+    return get_discriminated_union_parser(
+        discriminator,
+        {value: member_parsers[member] for value, member in mapping.items()},
+        fallback_parser,
+    )
+
 
-    return lazy_parser
+def get_lazy_parser(factory, class_: Type) -> Parser:
+    return get_lazy_reference(lambda: factory.parser(class_))
 
 
-def create_parser(factory, schema: Schema, debug_path: bool, cls: Type) -> Parser:
-    parser = create_parser_impl(factory, schema, debug_path, cls)
+def create_parser(factory, schema: Schema, debug_path: bool, cls: Type, codegen: bool = False) -> Parser:
+    parser = create_parser_impl(factory, schema, debug_path, cls, codegen)
     pre = schema.pre_parse
     post = schema.post_parse
     if pre or post:
@@ -321,7 +876,9 @@ def create_parser(factory, schema: Schema, debug_path: bool, cls: Type) -> Parse
     return parser
 
 
-def create_parser_impl(factory, schema: Schema, debug_path: bool, cls: Type) -> Parser:  # noqa C901, CCR001
+def create_parser_impl(  # noqa C901, CCR001
+    factory, schema: Schema, debug_path: bool, cls: Type, codegen: bool = False,
+) -> Parser:
     if is_any(cls):
         return parse_stub
     if is_none(cls):
@@ -339,7 +896,7 @@ def create_parser_impl(factory, schema: Schema, debug_path: bool, cls: Type) ->
     if cls in (decimal.Decimal,):
         return decimal_parse
     if is_newtype(cls):
-        return create_parser_impl(factory, schema, debug_path, cls.__supertype__)
+        return create_parser_impl(factory, schema, debug_path, cls.__supertype__, codegen)
     if is_enum(cls):
         return cls
     if is_tuple(cls):
@@ -378,17 +935,36 @@ def create_parser_impl(factory, schema: Schema, debug_path: bool, cls: Type) ->
         return get_collection_parser(collection_factory, item_parser, debug_path)
     if is_union(cls):
         # also, check if Union can be converted to Optional[...] or Optional[Union[...]]
-        parsers = tuple(factory.parser(x) for x in cls.__args__ if not is_none(x))
+        members = tuple(x for x in cls.__args__ if not is_none(x))
+        parsers = tuple(factory.parser(x) for x in members)
         if len(parsers) == 0:
             return parse_none
-        if len(parsers) == 1:
+        if schema.discriminator:
+            parser = get_union_with_discriminator_parser(
+                schema.discriminator, schema.discriminator_mapping, members, parsers,
+            )
+        elif len(parsers) == 1:
             parser = parsers[0]
         else:
-            parser = get_union_parser(parsers)
+            parser = get_union_parser(
+                parsers,
+                [get_type_checker(factory.schema(x), x) for x in members],
+            )
         if len(parsers) < len(cls.__args__):
             return get_optional_parser(parser)
         return parser
     if is_dataclass(cls) or (is_generic_concrete(cls) and is_dataclass(cls.__origin__)):
+        if codegen:
+            return get_compiled_complex_parser(
+                class_=cls,
+                factory=factory,
+                fields=get_dataclass_fields(schema, cls),
+                debug_path=debug_path,
+                unknown=schema.unknown,
+                pre_validators=schema.pre_validators,
+                post_validators=schema.post_validators,
+                bypass_init=bool(schema.bypass_init),
+            )
         return get_complex_parser(
             class_=cls,
             factory=factory,
@@ -397,6 +973,7 @@ def create_parser_impl(factory, schema: Schema, debug_path: bool, cls: Type) ->
             unknown=schema.unknown,
             pre_validators=schema.pre_validators,
             post_validators=schema.post_validators,
+            bypass_init=bool(schema.bypass_init),
         )
     try:
         return get_complex_parser(
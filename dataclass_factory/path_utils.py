@@ -87,3 +87,14 @@ def init_structure(paths: Iterable[Path]) -> Tuple[Container, Sequence[Tuple[Con
             prev_key = next_key
         field_containers.append((current, prev_key))
     return root[0], field_containers
+
+
+def init_template(paths: Sequence[Path]) -> Container:
+    """
+    Create structure like `init_structure` does, but with index of path placed instead of each value.
+    It describes shape of flattened data and is used to build it without copying empty structure
+    """
+    container, field_containers = init_structure(paths)
+    for index, (inner_container, key) in enumerate(field_containers):
+        inner_container[key] = index  # type: ignore
+    return container
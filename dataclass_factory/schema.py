@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Callable, cast, Dict, Generic, List, Optional, Sequence, Tuple, Union
+from typing import Any, Callable, cast, Dict, Generic, List, Optional, Sequence, Tuple, Type, Union
 
 from .common import InnerConverter, Parser, ParserGetter, Serializer, SerializerGetter, T
 from .naming import NameStyle
@@ -49,6 +49,11 @@ class Schema(Generic[T]):
         unknown: RuleForUnknown = None,
         name: Optional[str] = None,
         description: Optional[str] = None,
+
+        discriminator: Optional[str] = None,
+        discriminator_mapping: Optional[Dict[Any, Type]] = None,
+
+        bypass_init: Optional[bool] = None,
     ):
         self.pre_validators, self.post_validators = prepare_validators(self)
         if only is not None or not hasattr(self, "only"):
@@ -96,6 +101,14 @@ class Schema(Generic[T]):
         if description is not None or not hasattr(self, "description"):
             self.description = description
 
+        if discriminator is not None or not hasattr(self, "discriminator"):
+            self.discriminator = discriminator
+        if discriminator_mapping is not None or not hasattr(self, "discriminator_mapping"):
+            self.discriminator_mapping = discriminator_mapping
+
+        if bypass_init is not None or not hasattr(self, "bypass_init"):
+            self.bypass_init = bypass_init
+
 
 SCHEMA_FIELDS = [
     "only",
@@ -117,6 +130,9 @@ SCHEMA_FIELDS = [
     "unknown",
     "name",
     "description",
+    "discriminator",
+    "discriminator_mapping",
+    "bypass_init",
     "pre_validators",
     "post_validators",
 ]
@@ -143,3 +159,79 @@ class SchemaProxy:
 
 def merge_schema(*schemas: Optional[Schema]) -> Schema:
     return cast(Schema, SchemaProxy(*[s for s in schemas if s]))
+
+
+class ResolvedSchema:
+    """
+    Immutable result of merging schemas.
+
+    All known options are looked up once and stored in slots, so reading them is a plain attribute access.
+    Other attributes (e.g. set in Schema subclasses) are still taken from original schemas
+    """
+    __slots__ = (*SCHEMA_FIELDS, "_schemas")
+
+    def __init__(self, schemas: Sequence[Schema], values: Dict[str, Any]):
+        object.__setattr__(self, "_schemas", tuple(schemas))
+        for item in SCHEMA_FIELDS:
+            object.__setattr__(self, item, values[item])
+
+    def __getattr__(self, item):
+        if item == "_schemas" or item.startswith("__"):
+            raise AttributeError(item)
+        res = _find_value(self._schemas, item)
+        if res is None:
+            raise AttributeError(f"Field `{item}` is not defined for Schema")
+        return res
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"Cannot set `{key}`, resolved schema is immutable")
+
+    def __delattr__(self, key):
+        raise AttributeError(f"Cannot delete `{key}`, resolved schema is immutable")
+
+    def __reduce__(self):
+        return ResolvedSchema, (self._schemas, self.resolved_values())
+
+    def __repr__(self):
+        values = ", ".join(f"{k}={v!r}" for k, v in self.resolved_values().items() if v)
+        return f"{type(self).__name__}({values})"
+
+    def resolved_values(self) -> Dict[str, Any]:
+        """Return values of all schema options as they are used by factory"""
+        return {item: getattr(self, item) for item in SCHEMA_FIELDS}
+
+    def replace(self, **changes: Any) -> "ResolvedSchema":
+        """Return new resolved schema with some options replaced"""
+        unknown = set(changes) - set(SCHEMA_FIELDS)
+        if unknown:
+            raise TypeError(f"Unknown schema options: {sorted(unknown)}")
+        return ResolvedSchema(self._schemas, {**self.resolved_values(), **changes})
+
+
+def _find_value(schemas: Sequence[Schema], item: str) -> Any:
+    for schema in schemas:
+        res = getattr(schema, item, None)
+        if res is not None:
+            return res
+    return None
+
+
+def resolve_schema(*schemas: Optional[Schema]) -> Schema:
+    """Merge schemas like `merge_schema` does, but look up all options at once"""
+    filtered: List[Schema] = []
+    for schema in schemas:
+        if isinstance(schema, SchemaProxy):
+            filtered.extend(schema._schemas)
+        elif schema:
+            filtered.append(schema)
+    return cast(Schema, ResolvedSchema(filtered, {item: _find_value(filtered, item) for item in SCHEMA_FIELDS}))
+
+
+def has_custom_parsing(schema: Schema) -> bool:
+    """Check if schema changes how type is parsed, so its data cannot be processed bypassing the parser"""
+    return bool(schema.parser or schema.get_parser or schema.pre_parse or schema.post_parse)
+
+
+def has_custom_serializing(schema: Schema) -> bool:
+    """Check if schema changes how type is serialized, so its data cannot be processed bypassing the serializer"""
+    return bool(schema.serializer or schema.get_serializer or schema.pre_serialize or schema.post_serialize)
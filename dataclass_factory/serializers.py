@@ -1,14 +1,15 @@
 from dataclasses import is_dataclass, MISSING
-from marshal import dumps, loads
+from enum import Enum
 from operator import attrgetter, getitem
-from typing import Any, Callable, Dict, List, Optional, Sequence, Type, Union
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Type, Union
 
+from .codegen import CodeBuilder, compile_function, get_lazy_reference, get_qualname
 from .common import AbstractFactory, K, Serializer, T
-from .fields import FieldInfo, get_dataclass_fields, get_typeddict_fields
-from .path_utils import CleanKey, CleanPath, init_structure
+from .fields import FieldInfo, get_dataclass_fields, get_discriminator_mapping, get_typeddict_fields
+from .path_utils import CleanKey, CleanPath, Container, init_template
 from .schema import RuleForUnknown, Schema, Unknown
 from .type_detection import (
-    hasargs, is_any, is_collection, is_dict, is_enum, is_generic_concrete, 
+    hasargs, is_any, is_collection, is_dict, is_enum, is_generic_concrete,
     is_newtype, is_optional, is_tuple, is_type_var, is_typeddict, is_union,
     is_literal, is_literal36, instance_wont_have_dict, is_none,
 )
@@ -25,6 +26,94 @@ def unpack_fields(dest, fields):
         dest.update(dest.pop(f, {}))
 
 
+def none_serializer(data):
+    return None
+
+
+def get_default_checker(serializer: Serializer, default: Any) -> Optional[Callable[[Any], bool]]:
+    """
+    Create function checking if serialized value of field is equal to serialized default.
+
+    It is used only when original value differs from default, so nothing is created if serializer does not change data
+    or if type of default defines equality (then equal values are found without serialization).
+    Default is serialized on first use, because serializers of recursive types are not ready yet
+    """
+    if default is MISSING or default is None or isinstance(default, Enum) or serializer is stub_serializer:
+        return None
+    if type(default).__eq__ is not object.__eq__:
+        return None
+    serialized_default: List[Any] = []
+
+    def is_default(value):
+        if not serialized_default:
+            try:
+                serialized_default.append(serializer(default))
+            except Exception:  # noqa B902  default is not valid value of field type
+                serialized_default.append(MISSING)
+        return value == serialized_default[0]
+
+    return is_default
+
+
+def get_structure_serializer(template: Container,  # noqa C901
+                             field_info: Sequence[Any],
+                             getter: Callable[[Any, Any], Any],
+                             omit_default: bool) -> Serializer:
+    """
+    Create serializer building flattened container described by template (see `init_template`).
+
+    Each nested container is built by its own serializer, values of fields are placed directly
+    """
+    children: List[Tuple[Any, ...]] = []
+    items = template.items() if isinstance(template, dict) else enumerate(template)  # type: ignore
+    for key, value in items:
+        if isinstance(value, int):
+            field_name, serializer, _, default, is_default = field_info[value]
+            if not omit_default:
+                default = MISSING
+            children.append((key, field_name, serializer, default, None, is_default))
+        elif value is None:  # not used item of list
+            children.append((key, None, None, MISSING, none_serializer, None))
+        else:
+            nested = get_structure_serializer(value, field_info, getter, omit_default)
+            children.append((key, None, None, MISSING, nested, None))
+    children_info = tuple(children)
+
+    if isinstance(template, list):
+        # items of list cannot be omitted, so they are always filled
+        def list_serializer(data):
+            return [
+                nested(data) if nested else serializer(getter(data, field_name))
+                for key, field_name, serializer, default, nested, _ in children_info
+            ]
+
+        return list_serializer
+
+    if omit_default:
+        def dict_serializer(data):
+            container = {}
+            for key, field_name, serializer, default, nested, is_default in children_info:
+                if nested:
+                    container[key] = nested(data)
+                    continue
+                value = getter(data, field_name)
+                if default is not MISSING and (value is default or value == default):
+                    continue
+                value = serializer(value)
+                if is_default is None or not is_default(value):
+                    container[key] = value
+            return container
+    else:
+        # optimized version
+        def dict_serializer(data):
+            return {
+                key: nested(data) if nested else serializer(getter(data, field_name))
+                for key, field_name, serializer, default, nested, _ in children_info
+            }
+
+    return dict_serializer
+
+
 def get_complex_serializer(factory: AbstractFactory,  # noqa C901,CCR001
                            schema: Schema[T],
                            fields: Sequence[FieldInfo],
@@ -32,8 +121,15 @@ def get_complex_serializer(factory: AbstractFactory,  # noqa C901,CCR001
                            unknown: RuleForUnknown) -> Serializer[T]:
     has_default = schema.omit_default and any(f.default != MISSING for f in fields)
     field_info = tuple(
-        (f.field_name, factory.serializer(f.type), f.data_name, f.default)
+        (
+            f.field_name,
+            serializer,
+            f.data_name,
+            f.default,
+            get_default_checker(serializer, f.default) if has_default else None,
+        )
         for f in fields
+        for serializer in (factory.serializer(f.type),)
     )
     if isinstance(unknown, Unknown):
         unpack_unknown = False
@@ -44,29 +140,26 @@ def get_complex_serializer(factory: AbstractFactory,  # noqa C901,CCR001
         unpack_unknown = True
 
     if schema.name_mapping and any(isinstance(key, tuple) for key in schema.name_mapping.values()):
-        paths = tuple(to_path(f.data_name) for f in fields)
-        pickled = dumps(init_structure(paths))
-        if has_default:
-            raise ValueError("Cannot use `omit_default` option with flattening schema")
+        template = init_template([to_path(f.data_name) for f in fields])
+        structure_serializer = get_structure_serializer(template, field_info, getter, bool(has_default))
+        if not unpack_unknown:
+            return structure_serializer
 
         def serialize(data):
-            container, field_containers = loads(pickled)
-            for (
-                (inner_container, data_name), (field_name, serializer, *_)
-            ) in zip(field_containers, field_info):
-                inner_container[data_name] = serializer(getter(data, field_name))
-            if unpack_unknown:
-                unpack_fields(container, unknown)
+            container = structure_serializer(data)
+            unpack_fields(container, unknown)
             return container
     else:
         if has_default:
             def serialize(data):
-                container = {
-                    data_name: value
-                    for field_name, serializer, data_name, default in field_info
-                    for value in (serializer(getter(data, field_name)),)
-                    if value != default
-                }
+                container = {}
+                for field_name, serializer, data_name, default, is_default in field_info:
+                    value = getter(data, field_name)
+                    if value is default or value == default:
+                        continue
+                    value = serializer(value)
+                    if is_default is None or not is_default(value):
+                        container[data_name] = value
                 if unpack_unknown:
                     unpack_fields(container, unknown)
                 return container
@@ -75,7 +168,7 @@ def get_complex_serializer(factory: AbstractFactory,  # noqa C901,CCR001
             def serialize(data):
                 container = {
                     data_name: serializer(getter(data, field_name))
-                    for field_name, serializer, data_name, default in field_info
+                    for field_name, serializer, data_name, *_ in field_info
                 }
                 if unpack_unknown:
                     unpack_fields(container, unknown)
@@ -83,6 +176,112 @@ def get_complex_serializer(factory: AbstractFactory,  # noqa C901,CCR001
     return serialize
 
 
+class FieldCode(NamedTuple):
+    value: str  # expression reading field
+    serializer: Optional[str]  # name of serializer, None if value is not changed
+    can_omit: bool
+    default: Any
+    is_default: Optional[Callable[[Any], bool]]  # compares serialized value with serialized default
+
+    @property
+    def serialized(self) -> str:
+        if self.serializer:
+            return f"{self.serializer}({self.value})"
+        return self.value
+
+
+def gen_structure(builder: CodeBuilder, template: Any, values: Sequence[FieldCode]) -> str:  # noqa C901
+    """
+    Generate expression building container described by template (see `init_template`) or value of field.
+
+    Containers are built with literals, keys of fields which can be omitted (and all following keys of dict)
+    are added by separate statements. Items of list are never omitted
+    """
+    if isinstance(template, int):
+        return values[template].serialized
+    if template is None:
+        return "None"
+    items = list(template.items() if isinstance(template, dict) else enumerate(template))  # type: ignore
+    literal = []
+    statements: List[Tuple[Any, Any]] = []
+    for key, child in items:
+        if isinstance(template, dict) and (statements or isinstance(child, int) and values[child].can_omit):
+            statements.append((key, child))
+        else:
+            literal.append((key, gen_structure(builder, child, values)))
+
+    if isinstance(template, list):
+        expr = "[" + ", ".join(value for _, value in literal) + "]"
+    else:
+        expr = "{" + ", ".join(f"{key!r}: {value}" for key, value in literal) + "}"
+    if not statements:
+        return expr
+    container = builder.name("container")
+    builder(f"{container} = {expr}")
+    for key, child in statements:
+        if isinstance(child, int) and values[child].can_omit:
+            field = values[child]
+            target = builder.name("value")
+            default = builder.bind("default", field.default)
+            builder(f"{target} = {field.value}")
+            # original value is checked first, so omitted fields are not serialized
+            builder(f"if {target} is not {default} and {target} != {default}:")
+            with builder.indent():
+                if field.serializer:
+                    builder(f"{target} = {field.serializer}({target})")
+                if field.is_default:
+                    builder(f"if not {builder.bind('is_default', field.is_default)}({target}):")
+                with builder.indent(bool(field.is_default)):
+                    builder(f"{container}[{key!r}] = {target}")
+        else:
+            builder(f"{container}[{key!r}] = {gen_structure(builder, child, values)}")
+    return container
+
+
+def get_compiled_complex_serializer(class_: Type[T],  # noqa C901,CCR001
+                                    factory: AbstractFactory,
+                                    schema: Schema[T],
+                                    fields: Sequence[FieldInfo],
+                                    getter: Callable[[Any, Any], Any],
+                                    unknown: RuleForUnknown) -> Serializer[T]:
+    """
+    Generate serializer which reads fields directly and builds the result with literals.
+
+    Flattened structure is built with nested literals as well
+    """
+    if isinstance(unknown, Unknown):
+        unpack_names: Sequence[str] = ()
+    elif isinstance(unknown, str):
+        unpack_names = [unknown]
+    else:  # sequence of strings
+        unpack_names = unknown or ()
+
+    builder = CodeBuilder()
+    values: List[FieldCode] = []
+    for f in fields:
+        if getter is getattr:
+            value = f"data.{f.field_name}"
+        else:
+            value = f"data[{f.field_name!r}]"
+        serializer = factory.serializer(f.type)
+        serializer_name = None if serializer is stub_serializer else builder.bind("serializer", serializer)
+        can_omit = bool(schema.omit_default) and f.default != MISSING
+        is_default = get_default_checker(serializer, f.default) if can_omit else None
+        values.append(FieldCode(value, serializer_name, can_omit, f.default, is_default))
+    if schema.name_mapping and any(isinstance(key, tuple) for key in schema.name_mapping.values()):
+        template = init_template([to_path(f.data_name) for f in fields])
+    else:
+        template = {f.data_name: i for i, f in enumerate(fields)}  # type: ignore
+
+    builder("def serialize(data):")
+    with builder.indent():
+        builder(f"container = {gen_structure(builder, template, values)}")
+        for name in unpack_names:
+            builder(f"container.update(container.pop({name!r}, {{}}))")
+        builder("return container")
+    return compile_function(builder, "serialize", f"serializer {get_qualname(class_)}")
+
+
 def get_collection_serializer(serializer: Serializer[T]) -> Serializer[List[T]]:
     def collection_serializer(data):
         return [serializer(x) for x in data]
@@ -126,12 +325,43 @@ def get_dict_serializer(
 
 
 def get_lazy_serializer(factory) -> Serializer:
+    """
+    Create serializer which selects real one using type of data.
+
+    Serializer is requested from factory once for each type and then taken from local cache
+    """
+    serializers: Dict[Type, Serializer] = {}
+
     def lazy_serializer(data):
-        return factory.serializer(type(data))(data)
+        data_type = type(data)
+        try:
+            serializer = serializers[data_type]
+        except KeyError:
+            serializer = serializers[data_type] = factory.serializer(data_type)
+        return serializer(data)
 
     return lazy_serializer
 
 
+def get_recursive_serializer(factory, class_: Type) -> Serializer:
+    return get_lazy_reference(lambda: factory.serializer(class_))
+
+
+def get_discriminated_union_serializer(
+    factory, discriminator: str, tags: Dict[Type, Any],
+) -> Serializer:
+    """Serialize union member and add discriminator value if it is not filled by serializer."""
+    serializer = get_lazy_serializer(factory)
+
+    def discriminated_union_serializer(data):
+        result = serializer(data)
+        if isinstance(result, dict) and discriminator not in result and type(data) in tags:
+            result[discriminator] = tags[type(data)]
+        return result
+
+    return discriminated_union_serializer
+
+
 def get_optional_serializer(serializer: Serializer[T]) -> Serializer[Optional[T]]:
     def optional_serializer(data):
         if data is None:
@@ -142,8 +372,8 @@ def get_optional_serializer(serializer: Serializer[T]) -> Serializer[Optional[T]
     return optional_serializer
 
 
-def create_serializer(factory, schema: Schema, debug_path: bool, class_: Type) -> Serializer:
-    serializer = create_serializer_impl(factory, schema, debug_path, class_)
+def create_serializer(factory, schema: Schema, debug_path: bool, class_: Type, codegen: bool = False) -> Serializer:
+    serializer = create_serializer_impl(factory, schema, debug_path, class_, codegen)
     pre = schema.pre_serialize
     post = schema.post_serialize
     if pre or post:
@@ -159,17 +389,26 @@ def create_serializer(factory, schema: Schema, debug_path: bool, class_: Type) -
     return serializer
 
 
-def create_serializer_impl(factory, schema: Schema, debug_path: bool,
-                           class_: Type) -> Serializer:  # noqa C901,CCR001
+def create_serializer_impl(factory, schema: Schema, debug_path: bool,  # noqa C901,CCR001
+                           class_: Type, codegen: bool = False) -> Serializer:
     if class_ in (str, bytearray, bytes, int, float, complex, bool):
         return stub_serializer
     if is_literal(class_) or is_literal36(class_) or is_none(class_):
         return stub_serializer
     if is_newtype(class_):
-        return create_serializer_impl(factory, schema, debug_path, class_.__supertype__)
+        return create_serializer_impl(factory, schema, debug_path, class_.__supertype__, codegen)
     if is_type_var(class_):
         return get_lazy_serializer(factory)
     if is_dataclass(class_) or (is_generic_concrete(class_) and is_dataclass(class_.__origin__)):
+        if codegen:
+            return get_compiled_complex_serializer(
+                class_,
+                factory,
+                schema,
+                get_dataclass_fields(schema, class_),
+                getattr,
+                schema.unknown,
+            )
         return get_complex_serializer(
             factory,
             schema,
@@ -178,6 +417,15 @@ def create_serializer_impl(factory, schema: Schema, debug_path: bool,
             schema.unknown,
         )
     if is_typeddict(class_) or (is_generic_concrete(class_) and is_typeddict(class_.__origin__)):
+        if codegen:
+            return get_compiled_complex_serializer(
+                class_,
+                factory,
+                schema,
+                get_typeddict_fields(schema, class_),
+                getitem,
+                schema.unknown,
+            )
         return get_complex_serializer(
             factory,
             schema,
@@ -200,6 +448,13 @@ def create_serializer_impl(factory, schema: Schema, debug_path: bool,
         # create serializers:
         for type_ in class_.__args__:
             factory.serializer(type_)
+        if schema.discriminator:
+            members = tuple(x for x in class_.__args__ if not is_none(x))
+            mapping = get_discriminator_mapping(schema.discriminator, schema.discriminator_mapping, members)
+            tags: Dict[Type, Any] = {}
+            for value, member in mapping.items():
+                tags.setdefault(member.__origin__ if is_generic_concrete(member) else member, value)
+            return get_discriminated_union_serializer(factory, schema.discriminator, tags)
         return get_lazy_serializer(factory)
     if is_tuple(class_):
         if not hasargs(class_):
@@ -0,0 +1,28 @@
+from typing import Union
+
+from dataclasses import dataclass
+
+from dataclass_factory import Factory, Schema
+
+
+@dataclass
+class Item:
+    name: str
+
+
+@dataclass
+class Group:
+    name: str
+
+
+Something = Union[Item, Group]  # Available types
+
+factory = Factory(schemas={
+    Something: Schema(
+        discriminator="type",
+        discriminator_mapping={"item": Item, "group": Group},
+    ),
+})
+
+assert factory.load({"name": "some name", "type": "group"}, Something) == Group("some name")
+assert factory.dump(Item("some name"), Something) == {"name": "some name", "type": "item"}
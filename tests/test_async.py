@@ -0,0 +1,95 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Set, Tuple
+from unittest import TestCase
+
+from dataclass_factory import Factory, Schema
+from dataclass_factory.exceptions import InvalidFieldError
+
+
+@dataclass
+class Item:
+    id: int
+    name: str
+
+
+ITEMS = [Item(i, str(i)) for i in range(25)]
+
+
+class TestAsync(TestCase):
+    def setUp(self) -> None:
+        self.factory = Factory()
+
+    def run_counting(self, coro) -> Tuple[Any, int]:
+        """Run coroutine and count how many times it returned control to event loop"""
+        switches = 0
+        done = False
+
+        async def counter():
+            nonlocal switches
+            while not done:
+                switches += 1
+                await asyncio.sleep(0)
+
+        async def main():
+            nonlocal done
+            task = asyncio.ensure_future(counter())
+            await asyncio.sleep(0)
+            start = switches
+            try:
+                return await coro, switches - start
+            finally:
+                done = True
+                await task
+
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(main())
+        finally:
+            loop.close()
+
+    def test_load(self):
+        data = self.factory.dump(ITEMS)
+        for class_ in (List[Item], Tuple[Item, ...], Deque[Item], list):
+            result, switches = self.run_counting(self.factory.load_async(data, class_, chunk_size=10))
+            self.assertEqual(result, self.factory.load(data, class_))
+            self.assertEqual(switches, 2)
+
+    def test_load_dict(self):
+        data = {str(i): i for i in range(10)}
+        result, switches = self.run_counting(self.factory.load_async(data, Dict[str, int], chunk_size=3))
+        self.assertEqual(result, data)
+        self.assertEqual(switches, 3)
+
+    def test_load_not_collection(self):
+        data = {"id": 1, "name": "x"}
+        result, switches = self.run_counting(self.factory.load_async(data, Item, chunk_size=1))
+        self.assertEqual(result, Item(1, "x"))
+        self.assertEqual(switches, 0)
+
+    def test_time_slice(self):
+        data = self.factory.dump(ITEMS)
+        result, switches = self.run_counting(self.factory.load_async(data, List[Item], chunk_size=1, time_slice=100))
+        self.assertEqual(result, ITEMS)
+        self.assertEqual(switches, 0)
+
+    def test_debug_path(self):
+        factory = Factory(debug_path=True)
+        data = factory.dump(ITEMS)
+        data[12]["id"] = "x"
+        with self.assertRaises(InvalidFieldError) as e:
+            self.run_counting(factory.load_async(data, List[Item], chunk_size=5))
+        self.assertEqual(e.exception.field_path, ["id", "12"])
+
+    def test_custom_parser(self):
+        factory = Factory(schemas={List[Item]: Schema(pre_parse=lambda data: data[:1])})
+        data = factory.dump(ITEMS)
+        result, _ = self.run_counting(factory.load_async(data, List[Item], chunk_size=1))
+        self.assertEqual(result, ITEMS[:1])
+
+    def test_dump(self):
+        for data, class_ in ((ITEMS, None), (set(range(5)), Set[int]), ({"a": ITEMS[0]}, None)):
+            result, _ = self.run_counting(self.factory.dump_async(data, class_, chunk_size=2))
+            self.assertEqual(result, self.factory.dump(data, class_))
+        _, switches = self.run_counting(self.factory.dump_async(ITEMS, List[Item], chunk_size=10))
+        self.assertEqual(switches, 2)
@@ -0,0 +1,142 @@
+from array import array
+from dataclasses import dataclass, field
+from typing import Generic, List, Optional, TypeVar
+from unittest import skipUnless, TestCase
+
+from dataclass_factory import Factory, Schema, Unknown, validate
+from dataclass_factory.exceptions import InvalidFieldError, UnknownFieldsError
+
+try:
+    import numpy  # type: ignore # noqa I900
+except ImportError:
+    numpy = None
+
+T = TypeVar("T")
+
+
+@dataclass
+class Item:
+    id: int
+    name: str = "noname"
+    tags: List[str] = field(default_factory=list)
+    parent: Optional[int] = None
+
+
+@dataclass
+class Point:
+    x: int
+    y: float
+    label: str = ""
+
+
+@dataclass
+class GenericItem(Generic[T]):
+    value: T
+
+
+class ItemSchema(Schema[Item]):
+    name_mapping = {
+        "parent": ("meta", "parent"),
+    }
+    exclude = ["name"]
+
+    @validate("id")
+    def positive(self, data):
+        if data < 0:
+            raise ValueError("negative id")
+        return data
+
+    def post_parse(self, data):
+        data.tags.append("parsed")
+        return data
+
+
+class TestBatch(TestCase):
+    def setUp(self) -> None:
+        self.data = [
+            {"id": 1, "name": "x", "tags": ["a"], "parent": 3},
+            {"id": 2},
+            {"id": 3, "parent": None},
+        ]
+
+    def test_simple(self):
+        factory = Factory()
+        result = factory.load_many(self.data, Item)
+        self.assertEqual(result, factory.load(self.data, List[Item]))
+        self.assertEqual(result[1], Item(2))
+        self.assertIsNot(result[1].tags, result[2].tags)
+        self.assertEqual(factory.load_many(iter(self.data), Item), result)
+        self.assertEqual(factory.load_many([], Item), [])
+
+    def test_schema(self):
+        factory = Factory(schemas={Item: ItemSchema()})
+        data = [{"id": 1, "name": "x", "meta": {"parent": 2}}, {"id": 2, "meta": {}}]
+        result = factory.load_many(data, Item)
+        self.assertEqual(result, [Item(1, parent=2, tags=["parsed"]), Item(2, tags=["parsed"])])
+
+    def test_errors(self):
+        factory = Factory(debug_path=True, schemas={Item: ItemSchema()})
+        data = [{"id": 1}, {"id": -1}]
+        with self.assertRaises(InvalidFieldError) as list_cm:
+            factory.load(data, List[Item])
+        with self.assertRaises(InvalidFieldError) as cm:
+            factory.load_many(data, Item)
+        self.assertEqual(cm.exception.field_path, list_cm.exception.field_path)
+        with self.assertRaises(InvalidFieldError):  # missing field
+            factory.load_many([{"id": 1}, {"name": "x"}], Item)
+
+    def test_forbid(self):
+        factory = Factory(default_schema=Schema(unknown=Unknown.FORBID))
+        self.assertEqual(factory.load_many([{"id": 1}], Item), [Item(1)])
+        with self.assertRaises(UnknownFieldsError):
+            factory.load_many([{"id": 1}, {"id": 1, "x": 1}], Item)
+
+    def test_other_types(self):
+        factory = Factory()
+        self.assertEqual(factory.load_many(["1", 2], int), [1, 2])
+        self.assertEqual(factory.load_many([{"value": "1"}], GenericItem[int]), [GenericItem(1)])
+        factory = Factory(schemas={Item: Schema(name_mapping={"id": 0, "name": 1, "tags": 2, "parent": 3})})
+        self.assertEqual(factory.load_many([[1]], Item), [Item(1)])
+
+
+class TestColumns(TestCase):
+    def setUp(self) -> None:
+        self.data = [{"x": 1, "y": 2, "label": "a"}, {"x": 3, "y": 4.5}]
+
+    def test_lists(self):
+        factory = Factory()
+        self.assertEqual(
+            factory.load_columns(self.data, Point, numeric=False),
+            {"x": [1, 3], "y": [2, 4.5], "label": ["a", ""]},
+        )
+
+    def test_arrays(self):
+        factory = Factory()
+        columns = factory.load_columns(self.data, Point, use_numpy=False)
+        self.assertEqual(columns["x"], array("q", [1, 3]))
+        self.assertEqual(columns["y"], array("d", [2, 4.5]))
+        self.assertEqual(columns["label"], ["a", ""])
+        columns = factory.load_columns([{"x": 2 ** 70, "y": 0}], Point, use_numpy=False)
+        self.assertEqual(columns["x"], [2 ** 70])
+
+    @skipUnless(numpy, "NumPy is not installed")
+    def test_numpy(self):
+        factory = Factory()
+        columns = factory.load_columns(self.data, Point)
+        self.assertIsInstance(columns["x"], numpy.ndarray)
+        self.assertEqual(columns["x"].tolist(), [1, 3])
+
+    def test_schema(self):
+        factory = Factory(schemas={Item: ItemSchema()})
+        data = [{"id": 1, "meta": {"parent": 2}}, {"id": 2}]
+        self.assertEqual(
+            factory.load_columns(data, Item),
+            {"id": array("q", [1, 2]), "tags": [["parsed"], ["parsed"]], "parent": [2, None]},
+        )
+
+    def test_errors(self):
+        factory = Factory()
+        with self.assertRaises(ValueError):
+            factory.load_columns([{"x": "x", "y": 1}], Point)
+        with self.assertRaises(ValueError):
+            factory.load_columns([1], int)
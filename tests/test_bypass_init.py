@@ -0,0 +1,121 @@
+import pickle
+from dataclasses import dataclass, field, InitVar
+from typing import Any, Dict, List
+from unittest import TestCase
+
+from dataclass_factory import Factory, Schema
+from dataclass_factory.init_bypass import can_bypass_init
+
+INIT_CALLS: List[Any] = []
+
+
+@dataclass
+class Data:
+    x: int
+    y: str = "y"
+    items: List[int] = field(default_factory=list)
+    tags: List[str] = field(init=False, default_factory=list)
+
+
+@dataclass(frozen=True)
+class Frozen:
+    x: int
+    y: str = "y"
+
+
+@dataclass
+class Slots:
+    __slots__ = ("x", "y")
+    x: int
+    y: str
+
+
+@dataclass
+class PostInit:
+    x: int
+
+    def __post_init__(self):
+        INIT_CALLS.append(self)
+
+
+@dataclass
+class WithInitVar:
+    x: int
+    scale: InitVar[int] = 1
+
+
+@dataclass
+class CustomInit:
+    x: int
+
+    def __init__(self, x):
+        INIT_CALLS.append(self)
+        self.x = x
+
+
+# custom `__init__` compiled from string like generated one
+compiled: Dict[str, Any] = {}
+exec("def __init__(self, x):\n    INIT_CALLS.append(self)\n    self.x = x", globals(), compiled)  # noqa S102
+
+
+@dataclass
+class CompiledInit:
+    x: int
+
+    __init__ = compiled["__init__"]
+
+
+class TestBypassInit(TestCase):
+    def test_can_bypass(self):
+        self.assertTrue(can_bypass_init(Data))
+        self.assertTrue(can_bypass_init(Frozen))
+        self.assertTrue(can_bypass_init(Slots))
+        self.assertFalse(can_bypass_init(PostInit))
+        self.assertFalse(can_bypass_init(WithInitVar))
+        self.assertFalse(can_bypass_init(CustomInit))
+        self.assertFalse(can_bypass_init(CompiledInit))
+
+    def test_defaults(self):
+        for codegen in (False, True):
+            factory = Factory(default_schema=Schema(bypass_init=True), codegen=codegen)
+            data = factory.load({"x": 1}, Data)
+            self.assertEqual(Data(1), data)
+            self.assertEqual(vars(Data(1)), vars(data))
+            # default factories are called for each instance
+            self.assertIsNot(data.items, factory.load({"x": 1}, Data).items)
+            self.assertEqual(Data(1, "a", [1]), factory.load({"x": 1, "y": "a", "items": [1]}, Data))
+
+    def test_missing_required(self):
+        for codegen in (False, True):
+            factory = Factory(default_schema=Schema(bypass_init=True), codegen=codegen)
+            with self.assertRaises(TypeError):
+                factory.load({"y": "a"}, Data)
+
+    def test_frozen(self):
+        for codegen in (False, True):
+            factory = Factory(default_schema=Schema(bypass_init=True), codegen=codegen)
+            data = factory.load({"x": 1}, Frozen)
+            self.assertEqual(Frozen(1), data)
+            self.assertEqual(hash(Frozen(1)), hash(data))
+            self.assertEqual(Frozen(1), pickle.loads(pickle.dumps(data)))
+
+    def test_slots(self):
+        for codegen in (False, True):
+            factory = Factory(default_schema=Schema(bypass_init=True), codegen=codegen)
+            data = factory.load({"x": 1, "y": "a"}, Slots)
+            self.assertEqual(Slots(1, "a"), data)
+            self.assertFalse(hasattr(data, "__dict__"))
+
+    def test_json(self):
+        factory = Factory(default_schema=Schema(bypass_init=True))
+        self.assertEqual(Frozen(1, "a"), factory.load_json('{"x": 1, "y": "a"}', Frozen))
+
+    def test_not_supported(self):
+        for codegen in (False, True):
+            factory = Factory(default_schema=Schema(bypass_init=True), codegen=codegen)
+            INIT_CALLS.clear()
+            factory.load({"x": 1}, PostInit)
+            factory.load({"x": 1}, CustomInit)
+            factory.load({"x": 1}, CompiledInit)
+            self.assertEqual(3, len(INIT_CALLS))
+            self.assertEqual(WithInitVar(1), factory.load({"x": 1}, WithInitVar))
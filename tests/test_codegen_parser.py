@@ -0,0 +1,131 @@
+from dataclasses import dataclass, field
+from typing import Dict, Generic, List, Optional, TypeVar
+from unittest import TestCase
+
+from dataclass_factory import Factory, Schema, Unknown, validate
+from dataclass_factory.exceptions import InvalidFieldError
+
+T = TypeVar("T")
+
+
+@dataclass
+class Sub:
+    value: int
+
+
+@dataclass
+class Data:
+    x: int
+    sub: Sub
+    y: str = "y"
+    items: List[int] = field(default_factory=list)
+    nested: Optional[int] = None
+
+
+@dataclass
+class WithExtras:
+    a: int
+    extras: Optional[Dict] = None
+
+
+@dataclass
+class GenericData(Generic[T]):
+    value: T
+
+
+@dataclass
+class CustomInit:
+    x: int
+
+    def __init__(self, x=5):
+        self.x = x
+
+
+class DataSchema(Schema[Data]):
+    name_mapping = {
+        "nested": ("a", "b", 0),
+    }
+
+    @validate("x")
+    def double(self, data):
+        return data * 2
+
+    @validate("x", pre=True)
+    def strip(self, data):
+        return data.strip() if isinstance(data, str) else data
+
+
+class TestCodegenParser(TestCase):
+    def setUp(self) -> None:
+        self.factory = Factory(schemas={Data: DataSchema()}, codegen=True)
+
+    def test_defaults(self):
+        self.assertEqual(
+            self.factory.load({"x": 1, "sub": {"value": 2}}, Data),
+            Data(2, Sub(2)),
+        )
+        first = self.factory.load({"x": 1, "sub": {"value": 2}}, Data)
+        second = self.factory.load({"x": 1, "sub": {"value": 2}}, Data)
+        self.assertIsNot(first.items, second.items)
+
+    def test_validators(self):
+        self.assertEqual(
+            self.factory.load({"x": " 1 ", "sub": {"value": 2}, "y": "z", "items": [1]}, Data),
+            Data(2, Sub(2), "z", [1]),
+        )
+
+    def test_path(self):
+        serial = {"x": 1, "sub": {"value": 2}, "a": {"b": [3]}}
+        self.assertEqual(self.factory.load(serial, Data), Data(2, Sub(2), nested=3))
+        serial = {"x": 1, "sub": {"value": 2}, "a": {"c": [3]}}
+        self.assertEqual(self.factory.load(serial, Data), Data(2, Sub(2)))
+        serial = {"x": 1, "sub": {"value": 2}, "a": None}
+        self.assertEqual(self.factory.load(serial, Data), Data(2, Sub(2)))
+
+    def test_missing(self):
+        with self.assertRaises(TypeError):
+            self.factory.load({"sub": {"value": 2}}, Data)
+
+    def test_missing_debug_path(self):
+        # missing field is reported by constructor only after all fields are parsed
+        factory = Factory(debug_path=True, codegen=True)
+        with self.assertRaises(InvalidFieldError) as cm:
+            factory.load({"sub": {"value": "a"}}, Data)
+        self.assertEqual(cm.exception.field_path, ["value", "sub"])
+
+    def test_custom_init(self):
+        self.assertEqual(self.factory.load({}, CustomInit), CustomInit(5))
+        self.assertEqual(self.factory.load_many([{}, {"x": 1}], CustomInit), [CustomInit(5), CustomInit(1)])
+
+    def test_debug_path(self):
+        factory = Factory(debug_path=True, codegen=True)
+        with self.assertRaises(InvalidFieldError) as cm:
+            factory.load({"x": 1, "sub": {"value": "a"}}, Data)
+        self.assertEqual(cm.exception.field_path, ["value", "sub"])
+
+    def test_generic(self):
+        self.assertEqual(self.factory.load({"value": "1"}, GenericData[int]), GenericData(1))
+
+    def test_unknown(self):
+        factory = Factory(default_schema=Schema(unknown=Unknown.FORBID), codegen=True)
+        self.assertEqual(factory.load({"value": 1}, Sub), Sub(1))
+        with self.assertRaises(ValueError):
+            factory.load({"value": 1, "other": 1}, Sub)
+
+    def test_fallback(self):
+        factory = Factory(
+            schemas={Sub: Schema(name_mapping={"value": 0})},
+            codegen=True,
+        )
+        self.assertEqual(factory.load([1], Sub), Sub(1))
+
+    def test_unknown_extras(self):
+        factory = Factory(
+            schemas={WithExtras: Schema(unknown="extras")},
+            codegen=True,
+        )
+        data = {"a": 1, "b": 2, "extras": 3}
+        self.assertEqual(factory.load(data, WithExtras), WithExtras(1, {"b": 2}))
+        self.assertEqual(data, {"a": 1, "b": 2, "extras": 3})
+        self.assertEqual(factory.load({"a": 1}, WithExtras), WithExtras(1, {}))
+        self.assertEqual(factory.load({"a": 1, "extras": 3}, WithExtras), WithExtras(1, {}))
@@ -0,0 +1,78 @@
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, List, Optional
+from unittest import TestCase
+
+from typing_extensions import TypedDict
+
+from dataclass_factory import Factory, NameStyle, Schema
+
+
+class Color(Enum):
+    RED = "red"
+
+
+@dataclass
+class Sub:
+    value: int
+
+
+@dataclass
+class Data:
+    x: int
+    sub: Sub
+    color: Color
+    y: str = "y"
+    items: List[int] = field(default_factory=list)
+    extras: Optional[Dict[str, int]] = None
+
+
+class Book(TypedDict):
+    title: str
+    sub: Sub
+
+
+class TestCodegenSerializer(TestCase):
+    def test_simple(self):
+        factory = Factory(default_schema=Schema(name_style=NameStyle.upper), codegen=True)
+        self.assertEqual(
+            factory.dump(Data(1, Sub(2), Color.RED)),
+            {"X": 1, "SUB": {"VALUE": 2}, "COLOR": "red", "Y": "y", "ITEMS": [], "EXTRAS": None},
+        )
+
+    def test_omit_default(self):
+        factory = Factory(default_schema=Schema(omit_default=True), codegen=True)
+        self.assertEqual(
+            list(factory.dump(Data(1, Sub(2), Color.RED, items=[1]))),
+            ["x", "sub", "color", "items"],
+        )
+
+    def test_unknown(self):
+        factory = Factory(schemas={Data: Schema(unknown="extras")}, codegen=True)
+        self.assertEqual(
+            factory.dump(Data(1, Sub(2), Color.RED, extras={"z": 3})),
+            {"x": 1, "sub": {"value": 2}, "color": "red", "y": "y", "items": [], "z": 3},
+        )
+
+    def test_typed_dict(self):
+        factory = Factory(codegen=True)
+        self.assertEqual(
+            factory.dump(Book(title="x", sub=Sub(1)), Book),
+            {"title": "x", "sub": {"value": 1}},
+        )
+
+    def test_flattening(self):
+        factory = Factory(schemas={Sub: Schema(name_mapping={"value": ("a", 0)})}, codegen=True)
+        self.assertEqual(factory.dump(Sub(1)), {"a": [1]})
+        factory = Factory(
+            schemas={Data: Schema(name_mapping={"x": ("a", "x"), "y": ("a", "y")}, omit_default=True)},
+            codegen=True,
+        )
+        self.assertEqual(
+            factory.dump(Data(1, Sub(2), Color.RED, y="z")),
+            {"a": {"x": 1, "y": "z"}, "sub": {"value": 2}, "color": "red"},
+        )
+        self.assertEqual(
+            factory.dump(Data(1, Sub(2), Color.RED)),
+            {"a": {"x": 1}, "sub": {"value": 2}, "color": "red"},
+        )
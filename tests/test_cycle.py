@@ -51,3 +51,34 @@ class TestGeneric(TestCase):
         serial = {"b": {"a": {"b": None}}}
         self.assertEqual(self.factory.dump(a), serial)
         self.assertEqual(self.factory.load(serial, A), a)
+
+
+@dataclass
+class Tree:
+    value: int
+    left: "Tree"
+    right: "Optional[Tree]" = None
+
+
+class TestRecursiveReferences(TestCase):
+    def test_codegen(self):
+        factory = Factory(codegen=True)
+        linked = LinkedList(1, LinkedList(2))
+        serial = {"data": 1, "next": {"data": 2, "next": None}}
+        self.assertEqual(factory.dump(linked), serial)
+        self.assertEqual(factory.load(serial, LinkedList), linked)
+
+    def test_resolved_once(self):
+        def left_parser_name(parser):
+            return next(
+                name for name, value in parser.__globals__.items()
+                if getattr(value, "__name__", None) in ("complex_parser", "lazy_reference") and name != "complex_parser"
+            )
+
+        factory = Factory(codegen=True)
+        parser = factory.parser(Tree)
+        lazy_name = left_parser_name(parser)
+        self.assertTrue(hasattr(parser.__globals__[lazy_name], "dataclass_factory_replace_in"))
+        with self.assertRaises(TypeError):
+            parser({"value": 1, "left": None})  # resolved and fails on None
+        self.assertIs(parser.__globals__[lazy_name], parser)
@@ -0,0 +1,76 @@
+from dataclasses import dataclass
+from typing import Optional, Union
+from unittest import TestCase
+
+from typing_extensions import Literal
+
+from dataclass_factory import Factory, Schema
+from dataclass_factory.exceptions import UnionParseError
+
+
+@dataclass
+class A:
+    a: str
+    type: Literal["a"] = "a"
+
+
+@dataclass
+class B:
+    a: str
+    type: str = "b"
+
+
+@dataclass
+class C:
+    a: str
+
+
+@dataclass
+class Untagged:
+    x: int
+
+
+ABC = Union[A, B, C]
+
+
+class TestDiscriminator(TestCase):
+    def test_mapping(self):
+        factory = Factory(schemas={
+            ABC: Schema(discriminator="kind", discriminator_mapping={"a": A, "b": B, "c": C}),
+        })
+        self.assertEqual(factory.load({"a": "x", "kind": "c"}, ABC), C("x"))
+        self.assertEqual(factory.load({"a": "x", "kind": "b"}, ABC), B("x"))
+        self.assertEqual(factory.dump(C("x"), ABC), {"a": "x", "kind": "c"})
+        with self.assertRaises(UnionParseError):
+            factory.load({"a": "x", "kind": "d"}, ABC)
+        with self.assertRaises(UnionParseError):
+            factory.load({"a": "x"}, ABC)
+
+    def test_detect(self):
+        factory = Factory(schemas={
+            Union[A, B]: Schema(discriminator="type"),
+        })
+        self.assertEqual(factory.load({"a": "x", "type": "b"}, Union[A, B]), B("x"))
+        self.assertEqual(factory.load({"a": "x", "type": "a"}, Union[A, B]), A("x"))
+        self.assertEqual(factory.dump(B("x"), Union[A, B]), {"a": "x", "type": "b"})
+
+    def test_optional(self):
+        factory = Factory(schemas={
+            Union[A, B, None]: Schema(discriminator="type"),
+        })
+        self.assertEqual(factory.load({"a": "x", "type": "b"}, Optional[Union[A, B]]), B("x"))
+        self.assertIsNone(factory.load(None, Optional[Union[A, B]]))
+
+    def test_untagged(self):
+        factory = Factory(schemas={
+            Union[A, Untagged]: Schema(discriminator="type"),
+        })
+        self.assertEqual(factory.load({"a": "x", "type": "a"}, Union[A, Untagged]), A("x"))
+        self.assertEqual(factory.load({"x": 1}, Union[A, Untagged]), Untagged(1))
+
+    def test_bad_mapping(self):
+        factory = Factory(schemas={
+            Union[A, B]: Schema(discriminator="type", discriminator_mapping={"c": C}),
+        })
+        with self.assertRaises(ValueError):
+            factory.parser(Union[A, B])
@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from typing import List
+from unittest import TestCase
+from unittest.mock import patch
+
+from dataclass_factory import Factory
+
+
+@dataclass
+class Data:
+    x: int
+
+
+class TestFactoryCache(TestCase):
+    def test_cache_hit(self):
+        factory = Factory()
+        self.assertEqual(factory.load({"x": 1}, Data), Data(1))
+        self.assertEqual(factory.dump(Data(1)), {"x": 1})
+        self.assertEqual(factory.dump([Data(1)], List[Data]), [{"x": 1}])
+        with patch("dataclass_factory.factory.StackedFactory") as stacked_factory:
+            with patch.object(Factory, "schema") as schema:
+                self.assertEqual(factory.load({"x": 2}, Data), Data(2))
+                self.assertEqual(factory.dump(Data(2)), {"x": 2})
+                self.assertEqual(factory.dump([Data(2)], List[Data]), [{"x": 2}])
+                self.assertIs(factory.parser(Data), factory.parser(Data))
+                self.assertIs(factory.serializer(Data), factory.serializer(Data))
+        stacked_factory.assert_not_called()
+        schema.assert_not_called()
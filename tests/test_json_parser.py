@@ -0,0 +1,98 @@
+import json
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from unittest import TestCase
+
+from dataclass_factory import Factory, NameStyle, Schema, Unknown, validate
+from dataclass_factory.exceptions import InvalidFieldError, UnknownFieldsError
+
+
+class Color(Enum):
+    RED = "red"
+
+
+@dataclass
+class Sub:
+    value: float
+    flag: bool = False
+
+
+@dataclass
+class Data:
+    some_id: int
+    name: str
+    sub: Sub
+    color: Color
+    items: List[Sub] = field(default_factory=list)
+    mapping: Dict[str, Optional[Sub]] = field(default_factory=dict)
+    unique: Set[int] = field(default_factory=set)
+    pair: Optional[Tuple[int, str]] = None
+    either: Union[int, str] = 0
+    extra: Any = None
+    parent: Optional["Data"] = None
+
+
+DATA = {
+    "someId": 1,
+    "name": "имя \"quoted\"\n",
+    "sub": {"value": 1.5},
+    "color": "red",
+    "items": [{"value": 1, "flag": True}, {"value": 1e10, "unknown": [{"x": 1}]}],
+    "mapping": {"a": {"value": 2}, "b": None},
+    "unique": [1, 2, 1],
+    "pair": [1, "x"],
+    "either": "str",
+    "extra": {"x": [1, 2]},
+    "parent": {"someId": 2, "name": "parent", "sub": {"value": 0}, "color": "red", "other": None},
+}
+
+
+class SubSchema(Schema):
+    @validate("value")
+    def positive(self, value):
+        if value < 0:
+            raise ValueError("negative")
+        return value
+
+
+class TestJsonParser(TestCase):
+    def setUp(self) -> None:
+        self.factory = Factory(default_schema=Schema(name_style=NameStyle.camel_lower), schemas={Sub: SubSchema()})
+
+    def assert_same(self, text: str, class_: Any):
+        self.assertEqual(self.factory.load_json(text, class_), self.factory.load(json.loads(text), class_))
+
+    def test_same_as_load(self):
+        self.assert_same(json.dumps(DATA), Data)
+        self.assert_same(json.dumps(DATA, indent=4), Data)
+        self.assert_same(json.dumps([DATA, DATA]), List[Data])
+        self.assert_same(json.dumps({"a": DATA}), Dict[str, Data])
+        self.assert_same(" null ", Optional[Data])
+        self.assert_same("[1, 2]", List[int])
+        self.assert_same('{"value": 1, "value": 2}', Sub)
+
+    def test_bytes(self):
+        self.assertEqual(self.factory.load_json(json.dumps(DATA).encode(), Data), self.factory.load(DATA, Data))
+
+    def test_errors(self):
+        with self.assertRaises(json.JSONDecodeError):
+            self.factory.load_json('{"value": 1', Sub)
+        with self.assertRaises(json.JSONDecodeError):
+            self.factory.load_json('{"value": 1} x', Sub)
+        with self.assertRaises(ValueError):
+            self.factory.load_json('{"value": -1}', Sub)
+        with self.assertRaises(TypeError):
+            self.factory.load_json('{"flag": true}', Sub)
+
+    def test_debug_path(self):
+        factory = Factory(debug_path=True)
+        with self.assertRaises(InvalidFieldError) as e:
+            factory.load_json('[{"value": 1}, {"value": "x"}]', List[Sub])
+        self.assertEqual(e.exception.field_path, ["value", "1"])
+
+    def test_forbid_unknown(self):
+        factory = Factory(default_schema=Schema(unknown=Unknown.FORBID))
+        self.assertEqual(factory.load_json('{"value": 1}', Sub), Sub(1))
+        with self.assertRaises(UnknownFieldsError):
+            factory.load_json('{"value": 1, "other": 2}', Sub)
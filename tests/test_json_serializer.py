@@ -0,0 +1,76 @@
+import json
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, List, Optional, Set, Tuple
+from unittest import TestCase
+
+from dataclass_factory import Factory, NameStyle, Schema
+
+
+class Color(Enum):
+    RED = "red"
+
+
+@dataclass
+class Sub:
+    value: float
+    flag: bool = False
+
+
+@dataclass
+class Data:
+    some_id: int
+    name: str
+    sub: Sub
+    color: Color
+    items: List[Sub] = field(default_factory=list)
+    mapping: Dict[str, Optional[int]] = field(default_factory=dict)
+    extra: Any = None
+    parent: Optional["Data"] = None
+
+
+@dataclass
+class Empty:
+    pass
+
+
+DATA = Data(
+    1, "имя \"quoted\"\n", Sub(1.5), Color.RED,
+    items=[Sub(float("inf")), Sub(float("nan"), True)],
+    mapping={"a": 1, "b": None},
+    extra={"x": [1, 2]},
+    parent=Data(True, "parent", Sub(0), Color.RED),  # type: ignore
+)
+
+
+class TestJsonSerializer(TestCase):
+    def assert_same(self, factory: Factory, data: Any, class_: Any = None):
+        expected = json.dumps(factory.dump(data, class_), ensure_ascii=False, separators=(",", ":"))
+        self.assertEqual(factory.dump_json(data, class_), expected)
+
+    def test_same_as_dump(self):
+        for codegen in (False, True):
+            factory = Factory(default_schema=Schema(name_style=NameStyle.camel), codegen=codegen)
+            self.assert_same(factory, DATA)
+            self.assert_same(factory, [DATA, DATA], List[Data])
+            self.assert_same(factory, Empty())
+            self.assert_same(factory, "x")
+
+    def test_native(self):
+        factory = Factory()
+        self.assert_same(factory, ("a", "b"), Tuple[str, ...])
+        self.assert_same(factory, {1}, Set[int])
+        self.assert_same(factory, {"a": [1, None]}, Dict[str, List[Optional[int]]])
+
+    def test_omit_default(self):
+        factory = Factory(default_schema=Schema(omit_default=True))
+        self.assert_same(factory, DATA)
+        self.assertEqual(factory.dump_json(Sub(1)), '{"value":1}')
+
+    def test_custom_schema(self):
+        factory = Factory(schemas={
+            float: Schema(serializer=str),
+            Sub: Schema(name_mapping={"flag": ("a", "b")}),
+            Color: Schema(serializer=lambda x: x.name),
+        })
+        self.assert_same(factory, DATA)
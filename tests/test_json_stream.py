@@ -0,0 +1,120 @@
+import codecs
+import json
+from dataclasses import dataclass
+from io import BytesIO, StringIO
+from tempfile import SpooledTemporaryFile
+from typing import List, Optional
+from unittest import TestCase
+
+from dataclass_factory import Factory
+from dataclass_factory.json_stream import iter_json_array, JsonReader
+
+
+@dataclass
+class Item:
+    id: int
+    name: str
+    tags: List[str]
+    price: Optional[float] = None
+
+
+ITEMS = [
+    Item(1, "первый", ["a", "b"], 12.5),
+    Item(22, "second \"quoted\"", []),
+    Item(333, "третий ☃", ["\\"], 1e10),
+]
+
+
+class TestJsonStream(TestCase):
+    def setUp(self) -> None:
+        self.factory = Factory()
+        self.serial = self.factory.dump(ITEMS)
+
+    def test_chunks(self):
+        data = json.dumps(self.serial, ensure_ascii=False, indent=2).encode()
+        for chunk_size in (1, 2, 3, 7, 64, 1024):
+            result = list(self.factory.iter_load(BytesIO(data), Item, chunk_size=chunk_size))
+            self.assertEqual(result, ITEMS, f"chunk_size={chunk_size}")
+
+    def test_numbers(self):
+        data = b"[1, 23,456 ,7890,-1.5e3]"
+        for chunk_size in (1, 2, 3, 5):
+            self.assertEqual(list(iter_json_array(BytesIO(data), chunk_size=chunk_size)), [1, 23, 456, 7890, -1500])
+
+    def test_path(self):
+        data = {"meta": {"items": [1, 2]}, "data": [0, {"items": self.serial}]}
+        file = BytesIO(json.dumps(data).encode())
+        self.assertEqual(list(self.factory.iter_load(file, Item, ["data", 1, "items"], chunk_size=5)), ITEMS)
+        with self.assertRaises(LookupError):
+            list(iter_json_array(BytesIO(json.dumps(data).encode()), ["data", 5]))
+        with self.assertRaises(LookupError):
+            list(iter_json_array(BytesIO(json.dumps(data).encode()), ["other"]))
+
+    def test_text_file(self):
+        file = StringIO(json.dumps(self.serial))
+        self.assertEqual(list(self.factory.iter_load(file, Item)), ITEMS)  # type: ignore
+
+    def test_empty(self):
+        self.assertEqual(list(iter_json_array(BytesIO(b" [ ] "))), [])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            list(iter_json_array(BytesIO(b"[1, 2")))
+        with self.assertRaises(ValueError):
+            list(iter_json_array(BytesIO(b"{}")))
+        with self.assertRaises(ValueError):
+            list(iter_json_array(BytesIO(b"[1, {]")))
+
+    def test_invalid_not_read(self):
+        data = b'[{"id": 1}, {"id": x}, ' + b'{"id": 1}, ' * 100000 + b"]"
+        file = BytesIO(data)
+        items = iter_json_array(file, chunk_size=100)
+        self.assertEqual(next(items), {"id": 1})
+        with self.assertRaises(ValueError):
+            next(items)
+        self.assertLess(file.tell(), 1000)
+
+    def test_memory(self):
+        data = ("[" + ",".join(['{"id": 1, "name": "x", "tags": []}'] * 10000) + "]").encode()
+        reader = JsonReader(BytesIO(data), chunk_size=1000)
+        for _ in reader.iter_array():
+            self.assertLess(len(reader.buffer), 2000)
+
+
+class TestJsonLines(TestCase):
+    def setUp(self) -> None:
+        self.factory = Factory()
+
+    def test_binary(self):
+        for buffer_size in (1, 10, 10000):
+            file = BytesIO()
+            self.assertEqual(self.factory.dump_lines(file, ITEMS, Item, buffer_size=buffer_size), len(ITEMS))
+            lines = file.getvalue().decode().split("\n")
+            self.assertEqual(lines[-1], "")
+            self.assertEqual([json.loads(line) for line in lines[:-1]], self.factory.dump(ITEMS))
+
+    def test_text(self):
+        file = StringIO()
+        self.factory.dump_lines(file, iter(ITEMS))
+        self.assertEqual(file.getvalue().splitlines()[0], '{"id":1,"name":"первый","tags":["a","b"],"price":12.5}')
+
+    def test_other_files(self):
+        expected = "".join(
+            json.dumps(item, ensure_ascii=False, separators=(",", ":")) + "\n" for item in self.factory.dump(ITEMS)
+        )
+        with SpooledTemporaryFile(mode="w+") as text_file:
+            self.factory.dump_lines(text_file, ITEMS, Item)
+            text_file.seek(0)
+            self.assertEqual(text_file.read(), expected)
+        with SpooledTemporaryFile() as binary_file:
+            self.factory.dump_lines(binary_file, ITEMS, Item)
+            binary_file.seek(0)
+            self.assertEqual(binary_file.read(), expected.encode())
+        data = BytesIO()
+        self.factory.dump_lines(codecs.getwriter("utf-8")(data), ITEMS, Item)  # type: ignore
+        self.assertEqual(data.getvalue(), expected.encode())
+
+    def test_empty(self):
+        file = BytesIO()
+        self.assertEqual(self.factory.dump_lines(file, [], Item), 0)
+        self.assertEqual(file.getvalue(), b"")
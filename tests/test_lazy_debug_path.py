@@ -0,0 +1,71 @@
+import json
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from unittest import TestCase
+
+from dataclass_factory import Factory, InvalidFieldError, Schema
+
+
+@dataclass
+class Foo:
+    a: int
+    b: str = ""
+
+
+@dataclass
+class Bar:
+    foos: List[Foo]
+    mapping: Dict[str, Foo]
+    parent: Optional["Bar"] = None
+
+
+VALID = {"foos": [{"a": 1}], "mapping": {"x": {"a": 2, "b": "b"}}}
+INVALID = {"foos": [{"a": 1}], "mapping": {}, "parent": {"foos": [{"a": 1}, {"a": "x"}], "mapping": {}}}
+
+
+class TestLazyDebugPath(TestCase):
+    def assert_path(self, func, path):
+        with self.assertRaises(InvalidFieldError) as e:
+            func()
+        self.assertEqual(e.exception.field_path, path)
+
+    def test_valid(self):
+        for codegen in (False, True):
+            factory = Factory(lazy_debug_path=True, codegen=codegen)
+            self.assertEqual(factory.load(VALID, Bar), Factory().load(VALID, Bar))
+            self.assertIsNone(factory._debug_factory)
+
+    def test_path(self):
+        expected = ["a", "1", "foos", "parent"]
+        for codegen in (False, True):
+            factory = Factory(lazy_debug_path=True, codegen=codegen)
+            self.assert_path(lambda: factory.load(INVALID, Bar), expected)
+            self.assert_path(lambda: factory.parser(Bar)(INVALID), expected)
+            self.assert_path(lambda: factory.load_many([VALID, INVALID], Bar), [*expected, "1"])
+            self.assert_path(lambda: factory.load_json(json.dumps(INVALID), Bar), expected)
+
+    def test_same_as_debug_path(self):
+        schemas = {Foo: Schema(name_mapping={"a": "A"})}
+        data = {"foos": [{"A": "x"}], "mapping": {}}
+        with self.assertRaises(InvalidFieldError) as e:
+            Factory(debug_path=True, schemas=schemas).load(data, Bar)
+        self.assert_path(lambda: Factory(lazy_debug_path=True, schemas=schemas).load(data, Bar), e.exception.field_path)
+
+    def test_recursive_parsed_twice(self):
+        calls = []
+
+        def count(data):
+            calls.append(data)
+            return data
+
+        for codegen in (False, True):
+            factory = Factory(lazy_debug_path=True, schemas={Bar: Schema(pre_parse=count)}, codegen=codegen)
+            calls.clear()
+            self.assert_path(lambda: factory.load(INVALID, Bar), ["a", "1", "foos", "parent"])
+            # nested levels are not wrapped, so data is parsed once by fast parser and once by debug parser
+            self.assertEqual(len(calls), 4)
+
+    def test_not_field_error(self):
+        factory = Factory(lazy_debug_path=True)
+        with self.assertRaises(TypeError):
+            factory.load({"b": "x"}, Foo)
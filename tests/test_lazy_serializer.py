@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Type
+from unittest import TestCase
+
+from dataclass_factory import AbstractFactory, Factory
+from dataclass_factory.serializers import get_lazy_serializer
+
+
+@dataclass
+class Data:
+    x: int
+
+
+@dataclass
+class SubData(Data):
+    y: int = 0
+
+
+class CountingFactory(AbstractFactory):
+    def __init__(self):
+        self.factory = Factory()
+        self.calls: Dict[Type, int] = {}
+
+    def serializer(self, class_: Type):
+        self.calls[class_] = self.calls.get(class_, 0) + 1
+        return self.factory.serializer(class_)
+
+
+class TestLazySerializer(TestCase):
+    def test_cache(self):
+        factory = CountingFactory()
+        serializer = get_lazy_serializer(factory)
+        for _ in range(3):
+            self.assertEqual(serializer(Data(1)), {"x": 1})
+            self.assertEqual(serializer(SubData(1, 2)), {"x": 1, "y": 2})
+            self.assertEqual(serializer(1), 1)
+        self.assertEqual(factory.calls, {Data: 1, SubData: 1, int: 1})
+
+    def test_any(self):
+        factory = Factory()
+        data = {"a": Data(1), "b": [SubData(1)], "c": None}
+        serial = {"a": {"x": 1}, "b": [{"x": 1, "y": 0}], "c": None}
+        self.assertEqual(factory.dump(data, Dict[str, Any]), serial)
+        self.assertEqual(factory.dump(data), serial)
@@ -1,4 +1,6 @@
+import json
 from dataclasses import dataclass, field
+from enum import Enum
 from typing import List, Any
 from unittest import TestCase
 
@@ -17,6 +19,29 @@ class DataUnderscore:
     from_: int = 1
 
 
+class Color(Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+@dataclass(frozen=True)
+class Point:
+    x: int = 0
+
+
+@dataclass(eq=False)
+class Size:
+    width: int = 0
+
+
+@dataclass
+class Shape:
+    color: Color = Color.RED
+    point: Point = Point()
+    size: Size = Size()
+    points: List[Point] = field(default_factory=list)
+
+
 schema = Schema[Any](omit_default=True, trim_trailing_underscore=True)
 
 
@@ -30,3 +55,32 @@ class TestDefault(TestCase):
         self.assertEqual(factory.dump(Data()), {})
         self.assertEqual(factory.dump(Data(1, [], "test")), {})
         self.assertEqual(factory.dump(Data(2, [], "test")), {"x": 2})
+
+    def test_serialized_default(self):
+        for codegen in (False, True):
+            factory = Factory(default_schema=Schema(omit_default=True), codegen=codegen)
+            self.assertEqual(factory.dump(Shape()), {})
+            # instances are not equal, but serialized values are
+            self.assertEqual(factory.dump(Shape(size=Size())), {})
+            self.assertEqual(factory.dump_json(Shape(size=Size())), "{}")
+            data = Shape(Color.BLUE, Point(1), Size(2), [Point()])
+            expected = {"color": "blue", "point": {"x": 1}, "size": {"width": 2}, "points": [{}]}
+            self.assertEqual(factory.dump(data), expected)
+            self.assertEqual(json.loads(factory.dump_json(data)), expected)
+
+    def test_omitted_not_serialized(self):
+        serialized = []
+
+        def serialize_point(point):
+            serialized.append(point)
+            return {"x": point.x}
+
+        for codegen in (False, True):
+            factory = Factory(
+                default_schema=Schema(omit_default=True),
+                schemas={Point: Schema(serializer=serialize_point)},
+                codegen=codegen,
+            )
+            serialized.clear()
+            self.assertEqual(factory.dump(Shape(point=Point())), {})
+            self.assertEqual(serialized, [])
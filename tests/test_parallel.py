@@ -0,0 +1,58 @@
+import json
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from unittest import TestCase
+
+from dataclass_factory import Factory, NameStyle, Schema
+from dataclass_factory.exceptions import InvalidFieldError
+
+
+@dataclass
+class Item:
+    item_id: int
+    name: str
+
+
+class TestParallel(TestCase):
+    def setUp(self) -> None:
+        self.factory = Factory(
+            default_schema=Schema(name_style=NameStyle.camel_lower),
+            schemas={Item: Schema(name_mapping={"name": "title"})},
+        )
+        self.items = [Item(i, str(i)) for i in range(100)]
+        self.data = self.factory.dump(self.items)
+
+    def test_pickle(self):
+        self.factory.load(self.data[0], Item)
+        copy = pickle.loads(pickle.dumps(self.factory))  # noqa S301
+        self.assertEqual(copy.load(self.data[0], Item), self.items[0])
+        self.assertEqual(copy.dump(self.items[0]), self.data[0])
+
+    def test_processes(self):
+        with ProcessPoolExecutor(2) as executor:
+            self.assertEqual(self.factory.load_parallel(self.data, Item, executor, chunk_size=7), self.items)
+            self.assertEqual(self.factory.load_parallel(iter(self.data), Item, executor, chunk_size=1000), self.items)
+
+    def test_json(self):
+        texts = [json.dumps(item) for item in self.data]
+        with ThreadPoolExecutor(2) as executor:
+            result = self.factory.load_parallel(texts, Item, executor, chunk_size=10, from_json=True)
+        self.assertEqual(result, self.items)
+
+    def test_empty(self):
+        with ThreadPoolExecutor(1) as executor:
+            self.assertEqual(self.factory.load_parallel([], Item, executor), [])
+
+    def test_debug_path(self):
+        for factory in (Factory(debug_path=True), Factory(lazy_debug_path=True)):
+            data = factory.dump(self.items)
+            data[12]["item_id"] = "x"
+            with ProcessPoolExecutor(2) as executor:
+                with self.assertRaises(InvalidFieldError) as e:
+                    factory.load_parallel(data, Item, executor, chunk_size=5)
+                self.assertEqual(e.exception.field_path, ["item_id", "12"])
+                texts = [json.dumps(item) for item in data]
+                with self.assertRaises(InvalidFieldError) as e:
+                    factory.load_parallel(texts, Item, executor, chunk_size=5, from_json=True)
+                self.assertEqual(e.exception.field_path, ["item_id", "12"])
@@ -1,7 +1,9 @@
 from dataclasses import dataclass
+from typing import Optional
 from unittest import TestCase
 
 from dataclass_factory import Factory, NameStyle, Schema
+from dataclass_factory.exceptions import InvalidFieldError
 from dataclass_factory.path_utils import NameMapping
 
 
@@ -17,6 +19,39 @@ schema = Schema[A](
     },
 )
 
+
+@dataclass
+class Audit:
+    author: Optional[str] = "author0"
+    created: Optional[int] = 0
+    tag: Optional[str] = "tag0"
+    id: int = 0
+
+
+schema_prefix = Schema[Audit](
+    name_mapping={
+        "author": ("meta", "audit", "author"),
+        "created": ("meta", "audit", "created"),
+        "tag": ("meta", "tags", 0),
+    },
+)
+
+
+@dataclass
+class Mixed:
+    a: int
+    b: int = 0
+    c: int = 0
+
+
+schema_mixed = Schema[Mixed](
+    name_mapping={
+        "a": ("m", "a"),
+        "b": "b",
+        "c": ("n", "c"),
+    },
+)
+
 schema_list = Schema[A](
     name_mapping={
         "x": (0, 0),
@@ -162,6 +197,27 @@ class Test1(TestCase):
         self.assertEqual(expected, factory.dump(data, A))
         self.assertEqual(expected2, factory.dump(data2, A))
 
+    def test_dump_omit_default(self):
+        for codegen in (False, True):
+            factory = Factory(
+                schemas={
+                    A: Schema[A](name_mapping=schema_ellipsis.name_mapping, omit_default=True),
+                },
+                codegen=codegen,
+            )
+            self.assertEqual({"sub": {}}, factory.dump(A(), A))
+            self.assertEqual({"sub": {"y": "world"}}, factory.dump(A(y="world"), A))
+            self.assertEqual(A(y="world"), factory.load({"sub": {"y": "world"}}, A))
+
+    def test_dump_list_omit_default(self):
+        factory = Factory(
+            schemas={
+                A: Schema[A](name_mapping=schema_list.name_mapping, omit_default=True),
+            },
+        )
+        # items of list are kept to save positions of other items
+        self.assertEqual([["x0", "y0"]], factory.dump(A(), A))
+
     def test_load_list(self):
         factory = Factory(
             schemas={
@@ -215,3 +271,44 @@ class Test1(TestCase):
         self.assertEqual(expected, factory.load(data, A))
         data = {"y": "test", "a": {"b": []}}
         self.assertEqual(expected, factory.load(data, A))
+
+    def test_parse_common_prefix(self):
+        for codegen in (False, True):
+            factory = Factory(schemas={Audit: schema_prefix}, codegen=codegen)
+            data = {"meta": {"audit": {"author": "me", "created": 1}, "tags": ["x"]}, "id": 1}
+            self.assertEqual(Audit("me", 1, "x", 1), factory.load(data, Audit))
+            data = {"meta": {"audit": {"created": 1}}}
+            self.assertEqual(Audit(created=1), factory.load(data, Audit))
+            # missing container skips all fields inside it
+            data = {"meta": {"tags": ["x"]}}
+            self.assertEqual(Audit(tag="x"), factory.load(data, Audit))
+            # None is passed to parsers of all fields inside container
+            data = {"meta": {"audit": None, "tags": ["x"]}}
+            self.assertEqual(Audit(None, None, "x"), factory.load(data, Audit))
+            data = {"meta": None}
+            self.assertEqual(Audit(None, None, None), factory.load(data, Audit))
+
+    def test_parse_common_prefix_error(self):
+        for codegen in (False, True):
+            factory = Factory(schemas={Audit: schema_prefix}, codegen=codegen, debug_path=True)
+            with self.assertRaises(InvalidFieldError) as e:
+                factory.load({"meta": {"audit": {"author": "me", "created": "x"}}}, Audit)
+            self.assertEqual(["created"], e.exception.field_path)
+            with self.assertRaises(InvalidFieldError) as e:
+                factory.load({"meta": {"audit": "audit"}}, Audit)
+            self.assertEqual(["author"], e.exception.field_path)
+
+    def test_parse_error_order(self):
+        for codegen in (False, True):
+            factory = Factory(schemas={Mixed: schema_mixed}, codegen=codegen, debug_path=True)
+            # fields are parsed in order of declaration whatever their paths are
+            for data, field_path in [
+                ({"b": "zz", "m": {"a": "x"}}, ["a"]),
+                ({"b": "zz", "m": {"a": 1}, "n": {"c": "x"}}, ["b"]),
+                ({"b": "zz", "m": "x"}, ["a"]),
+                ({"b": "zz", "m": {"a": 1}, "n": "x"}, ["b"]),
+                ({"m": {"a": 1}, "n": "x"}, ["c"]),
+            ]:
+                with self.assertRaises(InvalidFieldError) as e:
+                    factory.load(data, Mixed)
+                self.assertEqual(field_path, e.exception.field_path)
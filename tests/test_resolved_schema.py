@@ -0,0 +1,55 @@
+import pickle
+from dataclasses import dataclass
+from unittest import TestCase
+
+from dataclass_factory import Factory, NameStyle, Schema
+from dataclass_factory.schema import ResolvedSchema, Unknown
+
+
+@dataclass
+class Data:
+    a_b: int
+
+
+class CustomSchema(Schema[Data]):
+    skip_internal = False
+    extra_option = "extra"
+
+
+class TestResolvedSchema(TestCase):
+    def setUp(self) -> None:
+        self.user_schema = CustomSchema(only=["a_b"])
+        self.factory = Factory(
+            default_schema=Schema(name_style=NameStyle.camel),
+            schemas={Data: self.user_schema},
+        )
+
+    def test_values(self):
+        schema = self.factory.schema(Data)
+        self.assertIsInstance(schema, ResolvedSchema)
+        values = schema.resolved_values()
+        self.assertEqual(values["only"], ["a_b"])
+        self.assertEqual(values["name_style"], NameStyle.camel)
+        self.assertEqual(values["unknown"], Unknown.SKIP)
+        self.assertFalse(values["skip_internal"])
+        self.assertIsNone(values["parser"])
+        self.assertEqual(schema.extra_option, "extra")
+        self.assertIs(self.factory.schema(Data), schema)
+        self.assertEqual(self.factory.load({"AB": 1}, Data), Data(1))
+
+    def test_immutable(self):
+        schema = self.factory.schema(Data)
+        with self.assertRaises(AttributeError):
+            schema.only = None
+        with self.assertRaises(AttributeError):
+            schema.missing_option  # noqa B018
+
+    def test_json_schema_name(self):
+        self.factory.json_schema(Data)
+        self.assertEqual(self.factory.schema(Data).name, "Data")
+        self.assertIsNone(self.user_schema.name)
+
+    def test_pickle(self):
+        schema = self.factory.schema(Data)
+        copy = pickle.loads(pickle.dumps(schema))  # noqa S301
+        self.assertEqual(copy.resolved_values(), schema.resolved_values())
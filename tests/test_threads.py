@@ -0,0 +1,61 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from threading import Barrier
+from time import sleep
+from typing import Optional
+from unittest import TestCase
+
+from dataclass_factory import Factory, Schema
+
+THREADS = 8
+
+
+@dataclass
+class Item:
+    id: int
+    parent: Optional["Item"] = None
+
+
+class TestThreads(TestCase):
+    def test_built_once(self):
+        calls = []
+
+        def get_parser(class_, factory, debug_path):
+            calls.append(class_)
+            sleep(0.01)  # make other threads come while parser is being built
+            return lambda data: Item(data["id"])
+
+        factory = Factory(schemas={Item: Schema(get_parser=get_parser)})
+        barrier = Barrier(THREADS)
+
+        def load(i):
+            barrier.wait()
+            return factory.load({"id": i}, Item)
+
+        with ThreadPoolExecutor(THREADS) as executor:
+            result = list(executor.map(load, range(THREADS)))
+        self.assertEqual(result, [Item(i) for i in range(THREADS)])
+        self.assertEqual(calls, [Item])
+
+    def test_recursive(self):
+        factory = Factory(codegen=True)
+        barrier = Barrier(THREADS)
+        data = {"id": 1, "parent": {"id": 2, "parent": {"id": 3, "parent": None}}}
+        expected = Item(1, Item(2, Item(3)))
+
+        def convert(_):
+            barrier.wait()
+            return (
+                factory.load(data, Item),
+                factory.dump(expected),
+                factory.dump_json(expected),
+                factory.load_many([data], Item),
+            )
+
+        with ThreadPoolExecutor(THREADS) as executor:
+            results = list(executor.map(convert, range(THREADS)))
+        for item, dumped, text, items in results:
+            self.assertEqual(item, expected)
+            self.assertEqual(dumped, data)
+            self.assertEqual(factory.load_json(text, Item), expected)
+            self.assertEqual(items, [expected])
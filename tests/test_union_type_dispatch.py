@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+from typing import Dict, List, Union
+from unittest import TestCase
+
+from dataclass_factory import Factory, Schema
+from dataclass_factory.exceptions import UnionParseError
+
+
+@dataclass
+class Data:
+    x: int
+
+
+Mixed = Union[int, str, List[Data], Dict[str, Data]]
+
+
+class TestUnionTypeDispatch(TestCase):
+    def setUp(self) -> None:
+        self.factory = Factory()
+
+    def test_parse(self):
+        self.assertEqual(self.factory.load(1, Mixed), 1)
+        self.assertEqual(self.factory.load("1", Mixed), 1)
+        self.assertEqual(self.factory.load("x", Mixed), "x")
+        self.assertEqual(self.factory.load([{"x": 1}], Mixed), [Data(1)])
+        self.assertEqual(self.factory.load({"a": {"x": 1}}, Mixed), {"a": Data(1)})
+
+    def test_skip_incompatible(self):
+        with self.assertRaises(UnionParseError) as cm:
+            self.factory.load(None, Mixed)
+        self.assertEqual(cm.exception.suberrors, [])
+        with self.assertRaises(UnionParseError) as cm:
+            self.factory.load([1], Mixed)
+        self.assertEqual(len(cm.exception.suberrors), 1)
+
+    def test_custom_parser(self):
+        factory = Factory(schemas={
+            Data: Schema(parser=lambda data: Data(int(data))),
+        })
+        self.assertEqual(factory.load(None, Union[str, Data, None]), None)
+        self.assertEqual(factory.load(1, Union[str, Data]), Data(1))
@@ -103,3 +103,25 @@ class TestFactory(TestCase):
         data = factory.load(serialized, DataWithExtras)
         self.assertEqual(data.a, "AA")
         self.assertEqual(data.extras, {"b": "b"})
+
+    def test_store_separate_not_changes_data(self):
+        for codegen in (False, True):
+            factory = Factory(
+                default_schema=Schema(
+                    unknown=["unknown", "sub"],
+                ),
+                codegen=codegen,
+            )
+            serialized = {"a": "AA", "b": "b"}
+            self.assertEqual(Data("AA", {"b": "b"}, Sub("b")), factory.load(serialized, Data))
+            self.assertEqual({"a": "AA", "b": "b"}, serialized)
+
+    def test_only_known_keys(self):
+        for codegen in (False, True):
+            factory = Factory(default_schema=Schema(unknown="unknown"), codegen=codegen)
+            self.assertEqual(Data("AA", {}), factory.load({"a": "AA"}, Data))
+            self.assertEqual(Data("AA", {}), factory.load({"a": "AA", "unknown": {"b": "b"}}, Data))
+            self.assertEqual(Data("AA", {"b": "b"}), factory.load({"a": "AA", "unknown": {}, "b": "b"}, Data))
+            factory = Factory(default_schema=Schema(unknown=Unknown.STORE), codegen=codegen)
+            self.assertEqual({}, factory.load({"a": "AA"}, DataWithExtras).extras)
+            self.assertEqual({"b": "b"}, factory.load({"a": "AA", "b": "b"}, DataWithExtras).extras)
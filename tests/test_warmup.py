@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+from typing import Generic, List, Optional, TypeVar, Union
+from unittest import TestCase
+
+from dataclass_factory import Factory
+
+T = TypeVar("T")
+
+
+@dataclass
+class Cat:
+    name: str
+
+
+@dataclass
+class Dog:
+    barks: int
+
+
+@dataclass
+class Box(Generic[T]):
+    value: T
+
+
+@dataclass
+class Owner:
+    pets: List[Union[Cat, Dog]]
+    box: Box[int]
+    parent: Optional["Owner"] = None
+
+
+class TestWarmup(TestCase):
+    def test_reachable(self):
+        factory = Factory()
+        report = factory.warmup(Owner)
+        built = {(info.type, info.kind) for info in report}
+        for class_ in (Owner, Cat, Dog, Box[int], List[Union[Cat, Dog]]):
+            self.assertIn((class_, "parser"), built)
+            self.assertIn((class_, "serializer"), built)
+        self.assertEqual(len(built), len(report))
+        self.assertTrue(all(info.seconds >= 0 for info in report))
+
+        self.assertEqual(factory.warmup(Owner), [])
+        owner = Owner([Cat("Tom"), Dog(1)], Box(1))
+        self.assertEqual(factory.load(factory.dump(owner), Owner), owner)
+
+    def test_one_direction(self):
+        factory = Factory()
+        report = factory.warmup(Owner, serializers=False)
+        self.assertEqual({info.kind for info in report}, {"parser"})
+        self.assertIn(Dog, [info.type for info in report])